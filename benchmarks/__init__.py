@@ -0,0 +1,7 @@
+"""
+Ad-hoc performance benchmarks.
+
+Each module is runnable with `python -m benchmarks.<name> --help`. They run
+against a throwaway database created the same way the test runner does, so the
+development database is never touched.
+"""
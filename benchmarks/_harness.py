@@ -0,0 +1,95 @@
+import os
+import random
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+
+
+def setup_django() -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ticketing.settings")
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def scratch_database(*, on_disk: bool = True):
+    """
+    Create a migrated throwaway database for the default alias and drop it afterwards.
+
+    SQLite test databases live in memory by default; `on_disk` puts it in a temp
+    file instead so numbers include real page-cache / I/O behaviour.
+    """
+    from django.db import connection
+
+    tmpdir = None
+    if on_disk and connection.vendor == "sqlite":
+        tmpdir = tempfile.TemporaryDirectory(prefix="ticketing-bench-")
+        connection.settings_dict.setdefault("TEST", {})["NAME"] = os.path.join(tmpdir.name, "bench.sqlite3")
+
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+
+WORDS = (
+    "refund payment invoice charged twice login password reset error timeout crash "
+    "slow upload download attachment screenshot account locked billing technical "
+    "general shipping delayed order missing broken page mobile desktop browser api "
+    "integration webhook sync partner alert outage latency database export report"
+).split()
+
+
+def fake_ticket_kwargs(rng: random.Random, i: int) -> dict:
+    from tickets.models import Ticket
+
+    is_external = rng.random() < 0.3
+    return {
+        "source": Ticket.Source.EXTERNAL if is_external else Ticket.Source.CUSTOMER,
+        "external_ref": f"EXT-{i}" if is_external else None,
+        "title": " ".join(rng.choices(WORDS, k=rng.randint(3, 7))).capitalize(),
+        "description": " ".join(rng.choices(WORDS, k=rng.randint(10, 60))),
+        "priority": rng.choice(Ticket.Priority.values),
+        "status": rng.choice(Ticket.Status.values),
+        "category": rng.choice(("billing", "technical", "general")),
+        "customer_id": f"customer{rng.randint(1, max(1, i // 20 + 1))}@example.com",
+        "assigned_to": f"agent{rng.randint(1, 25)}@example.com" if rng.random() < 0.6 else None,
+    }
+
+
+def bulk_create_tickets(n: int, *, seed: int = 1, start: int = 0, chunk_size: int = 5000) -> None:
+    """
+    Insert `n` fake tickets numbered from `start`.
+
+    The number is part of each external ref, which is unique per source, so a
+    run that tops a database up in steps passes the count already loaded.
+    """
+    from tickets.models import Ticket
+
+    rng = random.Random(seed)
+    end = start + n
+    for first in range(start, end, chunk_size):
+        batch = [Ticket(**fake_ticket_kwargs(rng, i)) for i in range(first, min(end, first + chunk_size))]
+        Ticket.objects.bulk_create(batch, batch_size=chunk_size)
+
+
+def time_call(fn, *, repeat: int) -> dict:
+    """Run `fn` `repeat` times and return latency percentiles in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "n": repeat,
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p50_ms": round(samples[len(samples) // 2], 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "max_ms": round(samples[-1], 3),
+    }
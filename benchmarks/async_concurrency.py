@@ -0,0 +1,151 @@
+"""
+Many concurrent polling clients against the DRF read views vs their /async/ twins.
+
+    python -m benchmarks.async_concurrency --tickets 20000 --clients 500
+
+Drives `ticketing.asgi.application` in-process (no sockets), with one asyncio
+task per client, each issuing `--requests` GETs against a list / detail / stats
+route. Reports wall time, throughput and per-request latency percentiles.
+
+Under ASGI, sync views are all funnelled through a single thread-sensitive
+executor; async views keep requests interleaved on the event loop, with only the
+ORM calls themselves handed to a worker thread.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from benchmarks._harness import bulk_create_tickets, scratch_database, setup_django
+
+
+ROUTES = {
+    "customer list": ("/customer/tickets", "customer"),
+    "customer detail": ("/customer/tickets/{id}", "customer"),
+    "admin list": ("/admin/tickets?status=open", "admin"),
+    "admin stats": ("/admin/tickets/stats", "admin"),
+}
+
+
+async def asgi_get(application, path: str, headers: dict[str, str]) -> int:
+    """Issue one GET through the ASGI app and return the status code."""
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"localhost")] + [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    status = 0
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()  # the client never disconnects
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await application(scope, receive, send)
+    return status
+
+
+async def run_clients(application, targets: list[tuple[str, dict]], clients: int, requests: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+
+    async def client(i: int):
+        nonlocal errors
+        for j in range(requests):
+            path, headers = targets[(i * requests + j) % len(targets)]
+            started = time.perf_counter()
+            status = await asgi_get(application, path, headers)
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors += status != 200
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(clients)))
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "wall_s": round(wall, 3),
+        "rps": round(len(latencies) / wall, 1),
+        "p50_ms": round(latencies[len(latencies) // 2], 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95)], 2),
+        "max_ms": round(latencies[-1], 2),
+        "mean_ms": round(statistics.fmean(latencies), 2),
+    }
+
+
+def build_targets(route: str, prefix: str, rng: random.Random) -> list[tuple[str, dict]]:
+    from tickets.models import Ticket
+
+    path, role = ROUTES[route]
+    sample = list(Ticket.objects.values_list("id", "customer_id").order_by("?")[:200])
+    targets = []
+    for ticket_id, customer in sample:
+        user = customer if role == "customer" else "admin@example.com"
+        targets.append((prefix + path.format(id=ticket_id), {"X-Role": role, "X-User": user}))
+    rng.shuffle(targets)
+    return targets
+
+
+def run(tickets: int, clients: int, requests: int, routes: list[str]) -> list[dict]:
+    from ticketing.asgi import application
+
+    results = []
+    with scratch_database(on_disk=True):
+        bulk_create_tickets(tickets)
+        from tickets.domain.stats import rebuild_buckets
+
+        rebuild_buckets()
+        for route in routes:
+            for flavour, prefix in (("sync", ""), ("async", "/async")):
+                targets = build_targets(route, prefix, random.Random(7))
+                asyncio.run(run_clients(application, targets[:5], 5, 2))  # warm up
+                row = {"route": route, "view": flavour, "clients": clients}
+                row.update(asyncio.run(run_clients(application, targets, clients, requests)))
+                results.append(row)
+                print(
+                    f"{route:<16} {flavour:<6} {row['rps']:>8.1f} req/s  p50={row['p50_ms']:>8.2f}ms  "
+                    f"p95={row['p95_ms']:>8.2f}ms  errors={row['errors']}"
+                )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickets", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=4, help="Requests per client")
+    parser.add_argument("--routes", nargs="+", choices=list(ROUTES), default=list(ROUTES))
+    parser.add_argument("--json", help="Write raw results to this file")
+    args = parser.parse_args()
+
+    setup_django()
+    results = run(args.tickets, args.clients, args.requests, args.routes)
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+Latency percentiles and query counts for every route in `tickets/urls.py`.
+
+    python -m benchmarks.routes --sizes 10000 100000 1000000 --json routes.json
+    python -m benchmarks.routes --sizes 10000 --compare routes.json   # exit 1 on regressions
+
+Seeds a throwaway database with `tickets.domain.seed` (topping it up to each
+size in turn) and sends every sample request through the full middleware
+stack with the Django test client: one warm-up call counts the queries, then
+`--repeat` timed calls. Requests act as the busiest seeded customer, so
+customer routes see the worst-case skew. The response cache is off unless
+`--response-cache` is given.
+
+Every route needs a sample below or an entry in SKIPPED: a route added without
+one stops the run, so the suite keeps covering the whole API.
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from benchmarks._harness import scratch_database, setup_django, time_call
+
+
+CUSTOMER = "customer1@example.com"
+
+
+@dataclass(frozen=True)
+class Sample:
+    name: str
+    method: str
+    path: str  # formatted with the fixture ids and {n}, a per-call counter
+    role: str  # customer | admin | external
+    body: object = None
+
+
+SAMPLES = [
+    Sample("customer list", "GET", "/customer/tickets", "customer"),
+    Sample("customer list cursor", "GET", "/customer/tickets?pagination=cursor&fields=id,title,status", "customer"),
+    Sample("customer create", "POST", "/customer/tickets", "customer", {"title": "Bench {n}", "category": "billing"}),
+    Sample("customer changes", "GET", "/customer/tickets/changes?timeout=0", "customer"),
+    Sample("customer detail", "GET", "/customer/tickets/{ticket}", "customer"),
+    Sample("customer comments", "GET", "/customer/tickets/{ticket}/comments", "customer"),
+    Sample("customer add comment", "POST", "/customer/tickets/{ticket}/comments", "customer", {"message": "Any news?"}),
+    Sample("customer close", "POST", "/customer/tickets/{ticket}/close", "customer"),
+    Sample("customer attachment", "GET", "/customer/tickets/{ticket}/attachments/{attachment}", "customer"),
+    Sample("admin list", "GET", "/admin/tickets", "admin"),
+    Sample("admin list filtered", "GET", "/admin/tickets?status=open&priority=high", "admin"),
+    Sample("admin list search", "GET", "/admin/tickets?q=refund", "admin"),
+    Sample("admin stats", "GET", "/admin/tickets/stats", "admin"),
+    Sample(
+        "admin export",
+        "GET",
+        "/admin/tickets/export?status=open&priority=high&assigned_to=agent1@example.com",
+        "admin",
+    ),
+    Sample("admin changes", "GET", "/admin/tickets/changes?timeout=0", "admin"),
+    Sample("admin detail", "GET", "/admin/tickets/{ticket}", "admin"),
+    Sample("admin update", "PUT", "/admin/tickets/{ticket}", "admin", {"priority": "high"}),
+    Sample("admin comments", "GET", "/admin/tickets/{ticket}/comments", "admin"),
+    Sample("admin add comment", "POST", "/admin/tickets/{ticket}/comments", "admin", {"message": "Looking into it."}),
+    Sample("admin attachment", "GET", "/admin/tickets/{ticket}/attachments/{attachment}", "admin"),
+    Sample("admin cache stats", "GET", "/admin/cache/stats", "admin"),
+    Sample("admin metrics", "GET", "/admin/metrics", "admin"),
+    Sample("external ingest", "POST", "/external/tickets", "external", {"external_ref": "BENCH-{n}", "title": "Bench"}),
+    Sample(
+        "external batch (10)",
+        "POST",
+        "/external/tickets/batch",
+        "external",
+        [{"external_ref": "BENCH-{n}-%d" % i, "title": "Bench"} for i in range(10)],
+    ),
+    Sample("external job", "GET", "/external/jobs/{job}", "external"),
+    Sample("upload create", "POST", "/uploads", "customer", {"ticket_id": "{ticket}", "filename": "a.log", "size": 10}),
+    Sample("upload detail", "GET", "/uploads/{upload}", "customer"),
+    Sample("async customer list", "GET", "/async/customer/tickets", "customer"),
+    Sample("async customer detail", "GET", "/async/customer/tickets/{ticket}", "customer"),
+    Sample("async admin list", "GET", "/async/admin/tickets", "admin"),
+    Sample("async admin stats", "GET", "/async/admin/tickets/stats", "admin"),
+    Sample("async admin detail", "GET", "/async/admin/tickets/{ticket}", "admin"),
+    Sample("categories", "GET", "/categories", "customer"),
+]
+
+SKIPPED = {
+    "customer/tickets/events": "SSE stream, needs ASGI (see benchmarks.async_concurrency)",
+    "customer/tickets/<int:ticket_id>/events": "SSE stream, needs ASGI",
+    "admin/tickets/<int:ticket_id>/events": "SSE stream, needs ASGI",
+    "uploads/<uuid:session_id>/chunks/<int:index>": "stateful: each chunk index is accepted once per session",
+    "uploads/<uuid:session_id>/finalize": "stateful: a session is finalized once",
+}
+
+
+def headers_for(role: str) -> dict:
+    from django.conf import settings
+
+    if role == "external":
+        return {"HTTP_X_API_KEY": settings.EXTERNAL_TICKET_API_KEY}
+    user = CUSTOMER if role == "customer" else "agent1@example.com"
+    return {"HTTP_X_ROLE": role, "HTTP_X_USER": user}
+
+
+def fill(value, ids: dict):
+    """Format `{ticket}`-style placeholders in a path or JSON body."""
+    if isinstance(value, str):
+        return value.format(**ids)
+    if isinstance(value, dict):
+        return {k: fill(v, ids) for k, v in value.items()}
+    if isinstance(value, list):
+        return [fill(v, ids) for v in value]
+    return value
+
+
+def check_coverage() -> None:
+    from django.urls import resolve
+
+    from tickets.urls import urlpatterns
+
+    nil = "00000000-0000-0000-0000-000000000000"
+    placeholder = {"ticket": 1, "attachment": 1, "job": nil, "upload": nil, "n": 0}
+    covered = {resolve(fill(s.path, placeholder).partition("?")[0]).route for s in SAMPLES}
+    missing = [str(p.pattern) for p in urlpatterns if str(p.pattern) not in covered | SKIPPED.keys()]
+    if missing:
+        sys.exit(f"No benchmark sample for route(s): {', '.join(missing)}; add one to SAMPLES or SKIPPED")
+
+
+def fixtures(client) -> dict:
+    """Ids the sample paths refer to: the busiest customer's newest ticket with an attachment, a job, an upload."""
+    from tickets.models import Ticket, TicketAttachment
+
+    attachment = TicketAttachment.objects.filter(ticket__customer_id=CUSTOMER).order_by("-ticket_id").first()
+    ticket = attachment.ticket_id if attachment else Ticket.objects.filter(customer_id=CUSTOMER).latest("id").id
+    job = client.post(
+        "/external/tickets?mode=async",
+        {"external_ref": "BENCH-JOB", "title": "Queued"},
+        content_type="application/json",
+        **headers_for("external"),
+    ).json()["job_id"]
+    upload = client.post(
+        "/uploads",
+        {"ticket_id": ticket, "filename": "a.log", "size": 10},
+        content_type="application/json",
+        **headers_for("customer"),
+    ).json()["id"]
+    return {"ticket": ticket, "attachment": attachment.id if attachment else 0, "job": job, "upload": upload}
+
+
+def run_sample(client, sample: Sample, ids: dict, counter, repeat: int) -> dict:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    headers = headers_for(sample.role)
+
+    def call():
+        n = {"n": next(counter)}
+        path, body = fill(sample.path, {**ids, **n}), fill(sample.body, {**ids, **n})
+        response = client.generic(
+            sample.method,
+            path,
+            json.dumps(body) if body is not None else "",
+            content_type="application/json",
+            **headers,
+        )
+        if response.streaming:
+            b"".join(response.streaming_content)
+        response.close()
+        return response
+
+    with CaptureQueriesContext(connection) as queries:
+        response = call()
+    return {"status": response.status_code, "queries": len(queries), **time_call(call, repeat=repeat)}
+
+
+def run(sizes: list[int], repeat: int, *, response_cache: bool) -> list[dict]:
+    from django.test import Client, override_settings
+    from django.test.utils import setup_test_environment
+    from django.urls import resolve
+
+    from tickets.domain.seed import SeedSpec, seed_tickets
+
+    from ticketing.celery import app
+
+    check_coverage()
+    setup_test_environment(debug=False)
+    app.conf.update(CELERY_TASK_ALWAYS_EAGER=True)  # the ingest job runs in-process, as in the tests
+    client = Client()
+    counter = itertools.count()
+    results = []
+    with (
+        tempfile.TemporaryDirectory(prefix="ticketing-bench-media-") as media,
+        override_settings(
+            MEDIA_ROOT=media,
+            TICKET_UPLOAD_DIR=f"{media}/uploads",
+            TICKET_RESPONSE_CACHE_TIMEOUT=300 if response_cache else 0,
+            TICKET_SLOW_REQUEST_MS=0,
+        ),
+        scratch_database(),
+    ):
+        loaded = 0
+        for size in sorted(sizes):
+            spec = SeedSpec(tickets=size - loaded, customers=max(10, size // 50), seed=size)
+            seed_tickets(spec, chunk_size=10_000)
+            loaded = size
+            ids = fixtures(client)
+            for sample in SAMPLES:
+                route = resolve(fill(sample.path, {**ids, "n": 0}).partition("?")[0]).route
+                row = {"size": size, "name": sample.name, "method": sample.method, "route": route}
+                row.update(run_sample(client, sample, ids, counter, repeat))
+                results.append(row)
+                print(
+                    f"{size:>9} {sample.name:<24} {row['status']:>3} queries={row['queries']:<4} "
+                    f"p50={row['p50_ms']:>9.2f}ms p95={row['p95_ms']:>9.2f}ms"
+                )
+    return results
+
+
+def git_revision() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def compare(results: list[dict], baseline_path: str, tolerance: float) -> list[str]:
+    """Rows slower than the baseline p50 by more than `tolerance`, or issuing more queries."""
+    with open(baseline_path) as fh:
+        baseline = {(row["size"], row["name"]): row for row in json.load(fh)["results"]}
+    regressions = []
+    for row in results:
+        before = baseline.get((row["size"], row["name"]))
+        if before is None:
+            continue
+        if row["queries"] > before["queries"]:
+            regressions.append(f"{row['size']} {row['name']}: queries {before['queries']} -> {row['queries']}")
+        if row["p50_ms"] > before["p50_ms"] * (1 + tolerance):
+            regressions.append(f"{row['size']} {row['name']}: p50 {before['p50_ms']}ms -> {row['p50_ms']}ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--response-cache", action="store_true", help="Measure with the response cache on")
+    parser.add_argument("--json", help="Write results (with commit and environment) to this file")
+    parser.add_argument("--compare", help="Baseline JSON from an earlier --json run")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p50 slowdown for --compare")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+
+    results = run(args.sizes, args.repeat, response_cache=args.response_cache)
+    if args.json:
+        document = {
+            "meta": {
+                "revision": git_revision(),
+                "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "database": connection.vendor,
+                "repeat": args.repeat,
+                "response_cache": args.response_cache,
+            },
+            "skipped": SKIPPED,
+            "results": results,
+        }
+        with open(args.json, "w") as fh:
+            json.dump(document, fh, indent=2)
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
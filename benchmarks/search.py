@@ -0,0 +1,62 @@
+"""
+Compare the admin `q` filter on the FTS5 index against the original `icontains` scan.
+
+    python -m benchmarks.search --sizes 100000 1000000
+
+For each size it measures what a page of `/admin/tickets?q=...` costs: the
+COUNT(*) PageNumberPagination issues plus fetching the first 20 rows.
+"""
+
+import argparse
+import json
+
+from benchmarks._harness import bulk_create_tickets, scratch_database, setup_django, time_call
+
+
+QUERIES = ("refund", "pass", "timeout crash", "customer7@example.com", "EXT-4242")
+
+
+def run(sizes: list[int], repeat: int) -> list[dict]:
+    from tickets.domain.search import IcontainsSearchBackend, SQLiteFTS5SearchBackend
+    from tickets.models import Ticket
+
+    backends = {"icontains": IcontainsSearchBackend(), "fts5": SQLiteFTS5SearchBackend()}
+    results = []
+    with scratch_database():
+        loaded = 0
+        for size in sorted(sizes):
+            bulk_create_tickets(size - loaded, seed=size, start=loaded)
+            loaded = size
+            for q in QUERIES:
+                for name, backend in backends.items():
+                    qs = backend.filter(Ticket.objects.order_by("-created_at"), q)
+
+                    def page(qs=qs):
+                        qs.count()
+                        list(qs[:20])
+
+                    row = {"size": size, "backend": name, "q": q, "matches": qs.count(), **time_call(page, repeat=repeat)}
+                    results.append(row)
+                    print(
+                        f"{size:>9} {name:<10} {q!r:<26} matches={row['matches']:<8} "
+                        f"p50={row['p50_ms']:>9.2f}ms p95={row['p95_ms']:>9.2f}ms"
+                    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="Write raw results to this file")
+    args = parser.parse_args()
+
+    setup_django()
+    results = run(args.sizes, args.repeat)
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
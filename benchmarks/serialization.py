@@ -0,0 +1,59 @@
+"""
+Per-row cost of serializing a list page: TicketListSerializer vs the values() fast path.
+
+    python -m benchmarks.serialization --rows 1000
+
+Times only the serialization step (rows are fetched once, up front) and the
+fetch + serialize path as the list views run it, with and without `?fields=`.
+"""
+
+import argparse
+import json
+
+from benchmarks._harness import bulk_create_tickets, scratch_database, setup_django, time_call
+
+
+def run(rows: int, repeat: int) -> list[dict]:
+    from tickets.api.serializers import TICKET_LIST_FIELDS, TicketListSerializer, serialize_ticket_rows
+    from tickets.models import Ticket
+
+    sparse = ("id", "title", "status", "priority", "created_at")
+    results = []
+    with scratch_database(on_disk=False):
+        bulk_create_tickets(rows)
+        qs = Ticket.objects.order_by("-created_at")[:rows]
+        instances = list(qs)
+        value_rows = list(qs.values(*TICKET_LIST_FIELDS))
+
+        cases = {
+            "serialize: TicketListSerializer": lambda: TicketListSerializer(instances, many=True).data,
+            "serialize: values() fast path": lambda: serialize_ticket_rows(value_rows),
+            "fetch+serialize: TicketListSerializer": lambda: TicketListSerializer(list(qs), many=True).data,
+            "fetch+serialize: values() fast path": lambda: serialize_ticket_rows(qs.values(*TICKET_LIST_FIELDS)),
+            "fetch+serialize: fast path, fields=5": lambda: serialize_ticket_rows(qs.values(*sparse), sparse),
+        }
+        for name, fn in cases.items():
+            fn()  # warm up
+            row = {"case": name, "rows": rows, **time_call(fn, repeat=repeat)}
+            row["us_per_row"] = round(row["p50_ms"] * 1000 / rows, 2)
+            results.append(row)
+            print(f"{name:<42} p50={row['p50_ms']:>8.2f}ms  {row['us_per_row']:>7.2f}us/row")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--json", help="Write raw results to this file")
+    args = parser.parse_args()
+
+    setup_django()
+    results = run(args.rows, args.repeat)
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Concurrent writers against SQLite: stock configuration vs the concurrent profile.
+
+    python -m benchmarks.sqlite_concurrency --threads 16 --ops 200
+
+Each thread mixes the service calls that collide in production: idempotent
+external ingest (a read then an insert in one transaction), comments and
+admin updates. "default" runs them against the stock settings: rollback
+journal, deferred transactions, a connection per thread. "concurrent" applies
+`ticketing.sqlite.concurrent_profile` and turns on the single-writer queue
+(`tickets.domain.writer`). Each mode gets its own fresh on-disk database.
+Reports completed writes, "database is locked" errors, throughput and
+latency percentiles.
+"""
+
+import argparse
+import json
+import random
+import statistics
+import threading
+import time
+
+from benchmarks._harness import bulk_create_tickets, scratch_database, setup_django
+
+
+def worker(n: int, ops: int, ticket_ids: list[int], results: dict, lock: threading.Lock) -> None:
+    from django.db import OperationalError, connections
+
+    from tickets.domain.services import add_comment, admin_update_ticket, create_external_ticket
+    from tickets.models import Ticket
+
+    rng = random.Random(n)
+    latencies, locked, failed = [], 0, 0
+    for i in range(ops):
+        started = time.perf_counter()
+        try:
+            roll = rng.random()
+            if roll < 0.5:
+                create_external_ticket(data={"external_ref": f"STRESS-{n}-{i}", "title": "Partner sync"})
+            else:
+                ticket = Ticket.objects.get(pk=rng.choice(ticket_ids))
+                if roll < 0.8:
+                    add_comment(ticket=ticket, author="agent1@example.com", role="admin", message="On it.")
+                else:
+                    admin_update_ticket(ticket=ticket, data={"priority": rng.choice(Ticket.Priority.values)})
+        except OperationalError as exc:
+            if "locked" not in str(exc):
+                raise
+            locked += 1
+            continue
+        except Exception:
+            failed += 1
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+    connections.close_all()
+    with lock:
+        results["latencies"] += latencies
+        results["locked"] += locked
+        results["failed"] += failed
+
+
+def run_mode(mode: str, threads: int, ops: int, tickets: int) -> dict:
+    from django.db import connections
+    from django.test import override_settings
+
+    from ticketing.sqlite import concurrent_profile
+    from tickets.domain.writer import get_write_queue
+    from tickets.models import Ticket
+
+    database = connections.settings["default"]  # new per-thread connections are built from this dict
+    original = {key: database.get(key) for key in ("OPTIONS", "CONN_MAX_AGE", "CONN_HEALTH_CHECKS")}
+    with scratch_database():
+        bulk_create_tickets(tickets)
+        ticket_ids = list(Ticket.objects.values_list("id", flat=True))
+        connections.close_all()
+        if mode == "concurrent":
+            database.update({key: value for key, value in concurrent_profile(database).items() if key in original})
+        get_write_queue.cache_clear()
+
+        results = {"latencies": [], "locked": 0, "failed": 0}
+        lock = threading.Lock()
+        try:
+            with override_settings(TICKET_WRITE_QUEUE=mode == "concurrent"):
+                pool = [
+                    threading.Thread(target=worker, args=(n, ops, ticket_ids, results, lock)) for n in range(threads)
+                ]
+                started = time.perf_counter()
+                for thread in pool:
+                    thread.start()
+                for thread in pool:
+                    thread.join()
+                elapsed = time.perf_counter() - started
+                queue = get_write_queue()
+        finally:
+            connections.close_all()
+            database.update(original)
+
+    samples = sorted(results["latencies"])
+    return {
+        "mode": mode,
+        "threads": threads,
+        "attempted": threads * ops,
+        "completed": len(samples),
+        "locked_errors": results["locked"],
+        "other_errors": results["failed"],
+        "seconds": round(elapsed, 3),
+        "writes_per_s": round(len(samples) / elapsed, 1),
+        "p50_ms": round(samples[len(samples) // 2], 3) if samples else None,
+        "p95_ms": round(samples[int(len(samples) * 0.95)], 3) if samples else None,
+        "mean_ms": round(statistics.fmean(samples), 3) if samples else None,
+        "commits": queue.batches if mode == "concurrent" else len(samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=200, help="Writes per thread")
+    parser.add_argument("--tickets", type=int, default=5000, help="Existing tickets to comment on / update")
+    parser.add_argument("--json", help="Write raw results to this file")
+    args = parser.parse_args()
+
+    setup_django()
+    results = []
+    for mode in ("default", "concurrent"):
+        row = run_mode(mode, args.threads, args.ops, args.tickets)
+        results.append(row)
+        print(
+            f"{mode:<11} {row['completed']:>6}/{row['attempted']} writes  locked={row['locked_errors']:<5} "
+            f"{row['writes_per_s']:>8.1f} writes/s  p50={row['p50_ms']}ms p95={row['p95_ms']}ms  "
+            f"commits={row['commits']}"
+        )
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
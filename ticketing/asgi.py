@@ -2,6 +2,8 @@
 ASGI config for ticketing project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Long-polls and event streams are handled without a thread per request
+(ticketing.handlers).
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
@@ -9,8 +11,12 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+
+from ticketing.handlers import TicketingASGIHandler
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ticketing.settings')
 
-application = get_asgi_application()
+# What django.core.asgi.get_asgi_application() does, with the handler swapped.
+django.setup(set_prefix=False)
+application = TicketingASGIHandler()
@@ -0,0 +1,37 @@
+"""
+ASGI handler that lets long-lived requests wait without a thread.
+
+Django's `ASGIHandler` runs every request in its own `ThreadSensitiveContext`.
+The request's thread-sensitive sync work (the `request_started` receivers,
+`MiddlewareMixin` hooks, every async ORM query) then runs on a thread of its
+own, which is only released when the response is done. For a long-poll or an
+event stream that is one parked thread per waiting client.
+
+Views marked `long_lived` (the change feeds and the event streams) are handled
+without that context: their sync calls run on the one thread-sensitive thread
+the process shares. The calls are short (an EXISTS probe per poll interval),
+so a worker keeps any number of clients waiting on its event loop alone.
+"""
+
+from django.core.handlers.asgi import ASGIHandler
+from django.urls import Resolver404, resolve
+
+
+class TicketingASGIHandler(ASGIHandler):
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and self.is_long_lived(scope):
+            await self.handle(scope, receive, send)
+        else:
+            await super().__call__(scope, receive, send)
+
+    @staticmethod
+    def is_long_lived(scope) -> bool:
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path.removeprefix(root_path)
+        try:
+            match = resolve(path)
+        except Resolver404:
+            return False
+        return getattr(getattr(match.func, "view_class", None), "long_lived", False)
@@ -1,6 +1,23 @@
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.conf import settings
 from django.http import HttpResponse
 
+from tickets.domain.metrics import QueryRecorder, recording, request_metrics
+from tickets.domain.routing import (
+    actor_key,
+    apin_to_primary,
+    apinned_to_primary,
+    begin_read_scope,
+    pin_to_primary,
+    pinned_to_primary,
+    replica_alias,
+)
+
+logger = logging.getLogger(__name__)
+
 
 class SimpleCORSMiddleware:
     """
@@ -10,8 +27,12 @@ class SimpleCORSMiddleware:
     - allow origins listed in settings.CORS_ALLOWED_ORIGINS
     - handle preflight (OPTIONS) requests
     - expose our custom headers (X-ROLE, X-USER, X-API-KEY)
+    - sync and async, so under ASGI the request stays on the event loop
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
         self.allowed_origins = getattr(
@@ -19,8 +40,12 @@ class SimpleCORSMiddleware:
             "CORS_ALLOWED_ORIGINS",
             ["http://localhost:3000", "http://127.0.0.1:3000"],
         )
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
         origin = request.headers.get("Origin")
 
         # Handle preflight requests early
@@ -34,13 +59,223 @@ class SimpleCORSMiddleware:
             self._add_cors_headers(response, origin)
         return response
 
+    async def __acall__(self, request):
+        origin = request.headers.get("Origin")
+
+        if request.method == "OPTIONS" and origin in self.allowed_origins:
+            response = HttpResponse()
+            self._add_cors_headers(response, origin)
+            return response
+
+        response = await self.get_response(request)
+        if origin in self.allowed_origins:
+            self._add_cors_headers(response, origin)
+        return response
+
     @staticmethod
     def _add_cors_headers(response, origin: str) -> None:
         response["Access-Control-Allow-Origin"] = origin
         response["Vary"] = "Origin"
         response["Access-Control-Allow-Methods"] = "GET, POST, PUT, PATCH, DELETE, OPTIONS"
         response["Access-Control-Allow-Headers"] = (
-            "Content-Type, Authorization, X-ROLE, X-USER, X-API-KEY"
+            "Content-Type, Authorization, X-ROLE, X-USER, X-API-KEY, Idempotency-Key, "
+            "If-None-Match, If-Modified-Since"
         )
+        response["Access-Control-Expose-Headers"] = "ETag, Last-Modified, Server-Timing"
+        response["Timing-Allow-Origin"] = origin
         response["Access-Control-Allow-Credentials"] = "true"
 
+
+class ServerTimingMiddleware:
+    """
+    Per-request performance instrumentation.
+
+    - counts queries and DB time on every connection, in whichever thread runs them (`recording`)
+    - splits the request into view (handler, including DB) and render (DRF renderer)
+    - sends them as `Server-Timing: db, view, render, total` (TICKET_SERVER_TIMING)
+    - logs requests slower than TICKET_SLOW_REQUEST_MS with their costliest SQL fingerprints,
+      except `long_lived` views (long-polls, event streams), which are slow by design
+    - records per-endpoint histograms, served at GET /admin/metrics
+    - a streamed body is measured until it is consumed, with the queries it runs; the headers
+      (and so Server-Timing) only cover the time until the response started
+    - sync and async, so an ASGI request does not hop to a thread for it
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            # The async handler would run plain hooks through sync_to_async.
+            self.process_view = self._aprocess_view
+            self.process_template_response = self._aprocess_template_response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        recorder = QueryRecorder()
+        request._timing_marks = {}
+        with recording(recorder):
+            response = self.get_response(request)
+        return self.finish(request, response, recorder, started)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        recorder = QueryRecorder()
+        request._timing_marks = {}
+        with recording(recorder):
+            response = await self.get_response(request)
+        return self.finish(request, response, recorder, started)
+
+    def finish(self, request, response, recorder: QueryRecorder, started: float):
+        finished = time.perf_counter()
+        marks = request._timing_marks
+        if settings.TICKET_SERVER_TIMING:
+            timings = [f'db;dur={recorder.seconds * 1000:.1f};desc="{recorder.count} queries"']
+            if "view" in marks:
+                timings.append(f"view;dur={(marks.get('rendering', finished) - marks['view']) * 1000:.1f}")
+            if "rendered" in marks:
+                timings.append(f"render;dur={(marks['rendered'] - marks['rendering']) * 1000:.1f}")
+            timings.append(f"total;dur={(finished - started) * 1000:.1f}")
+            if response.has_header("Server-Timing"):
+                timings.insert(0, response["Server-Timing"])
+            response["Server-Timing"] = ", ".join(timings)
+
+        # A FileResponse keeps its file so the server can sendfile() it; reading it runs no queries.
+        if not response.streaming or getattr(response, "file_to_stream", None) is not None:
+            self.record(request, response, recorder, finished - started)
+        elif response.is_async:
+            content = aiter(response.streaming_content)
+            response.streaming_content = self._ameasure(content, request, response, recorder, started)
+        else:
+            content = iter(response.streaming_content)
+            response.streaming_content = self._measure(content, request, response, recorder, started)
+        return response
+
+    def _measure(self, content, request, response, recorder, started):
+        try:
+            while True:
+                with recording(recorder):
+                    try:
+                        chunk = next(content)
+                    except StopIteration:
+                        break
+                yield chunk
+        finally:
+            self.record(request, response, recorder, time.perf_counter() - started)
+
+    async def _ameasure(self, content, request, response, recorder, started):
+        try:
+            while True:
+                with recording(recorder):
+                    try:
+                        chunk = await anext(content)
+                    except StopAsyncIteration:
+                        break
+                yield chunk
+        finally:
+            self.record(request, response, recorder, time.perf_counter() - started)
+
+    def record(self, request, response, recorder: QueryRecorder, total: float) -> None:
+        match = request.resolver_match
+        endpoint = match.route if match else "unmatched"
+        request_metrics.observe(
+            endpoint=endpoint,
+            method=request.method,
+            status=response.status_code,
+            seconds=total,
+            queries=recorder.count,
+            db_seconds=recorder.seconds,
+        )
+
+        threshold = settings.TICKET_SLOW_REQUEST_MS
+        if not threshold or total * 1000 < threshold:
+            return
+        if match and getattr(getattr(match.func, "view_class", None), "long_lived", False):
+            return
+        logger.warning(
+            "Slow request %s %s (%s): %.0fms, %d queries in %.0fms%s",
+            request.method,
+            request.path,
+            endpoint,
+            total * 1000,
+            recorder.count,
+            recorder.seconds * 1000,
+            "".join(
+                f"\n  {executions}x {seconds * 1000:.1f}ms {fingerprint}"
+                for fingerprint, executions, seconds in recorder.fingerprints()
+            ),
+        )
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._timing_marks["view"] = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        # Runs after the view returned and before the response is rendered (DRF Response).
+        marks = request._timing_marks
+        marks["rendering"] = time.perf_counter()
+        response.add_post_render_callback(lambda _: marks.__setitem__("rendered", time.perf_counter()))
+        return response
+
+    async def _aprocess_view(self, request, view_func, view_args, view_kwargs):
+        return ServerTimingMiddleware.process_view(self, request, view_func, view_args, view_kwargs)
+
+    async def _aprocess_template_response(self, request, response):
+        return ServerTimingMiddleware.process_template_response(self, request, response)
+
+
+class ReadReplicaMiddleware:
+    """
+    Read replica scope for the request (tickets.domain.routing).
+
+    - GET/HEAD/OPTIONS read from TICKET_READ_REPLICA unless the actor is pinned to the primary
+    - any other method reads and writes the primary, and pins its actor for TICKET_REPLICA_STICKY_SECONDS
+    - the scope is closed by `request_finished`, after a streamed body has been sent
+    - sync and async: under ASGI the pin is read and written with the async cache API
+    """
+
+    SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        alias = replica_alias()
+        if not alias:
+            return self.get_response(request)
+
+        actor = actor_key(request)
+        if request.method in self.SAFE_METHODS:
+            begin_read_scope(None if pinned_to_primary(actor) else alias)
+            return self.get_response(request)
+
+        begin_read_scope(None)
+        try:
+            return self.get_response(request)
+        finally:
+            pin_to_primary(actor)
+
+    async def __acall__(self, request):
+        alias = replica_alias()
+        if not alias:
+            return await self.get_response(request)
+
+        actor = actor_key(request)
+        if request.method in self.SAFE_METHODS:
+            begin_read_scope(None if await apinned_to_primary(actor) else alias)
+            return await self.get_response(request)
+
+        begin_read_scope(None)
+        try:
+            return await self.get_response(request)
+        finally:
+            await apin_to_primary(actor)
@@ -59,6 +59,10 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Server-Timing header, slow request log and /admin/metrics histograms
+    'ticketing.middleware.ServerTimingMiddleware',
+    # GET reads from the read replica (TICKET_READ_REPLICA), writes pin the actor to the primary
+    'ticketing.middleware.ReadReplicaMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     # Simple CORS for local frontend (e.g. http://localhost:3000)
     'ticketing.middleware.SimpleCORSMiddleware',
@@ -100,6 +104,46 @@ DATABASES = {
     }
 }
 
+# DJANGO_SQLITE_PROFILE=concurrent: WAL, busy_timeout, BEGIN IMMEDIATE, mmap/cache pragmas and
+# persistent connections (ticketing/sqlite.py), plus the single-writer queue below.
+SQLITE_PROFILE = os.environ.get("DJANGO_SQLITE_PROFILE", "").strip().lower()
+if SQLITE_PROFILE == "concurrent":
+    from ticketing.sqlite import concurrent_profile
+
+    DATABASES['default'] = concurrent_profile(
+        DATABASES['default'], conn_max_age=int(os.environ.get("DJANGO_CONN_MAX_AGE", "600"))
+    )
+
+# Read replica (tickets.domain.routing): GET requests read from TICKET_READ_REPLICA unless their actor
+# wrote within the last TICKET_REPLICA_STICKY_SECONDS; all writes go to `default`. DJANGO_REPLICA_DB_PATH
+# adds a SQLite `replica` alias (kept in sync by whatever replicates the primary file).
+if os.environ.get("DJANGO_REPLICA_DB_PATH"):
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ["DJANGO_REPLICA_DB_PATH"],
+        'OPTIONS': {'init_command': 'PRAGMA query_only=ON'},
+    }
+DATABASE_ROUTERS = ['tickets.domain.routing.ReplicaRouter']
+TICKET_READ_REPLICA = os.environ.get("TICKET_READ_REPLICA", "replica" if 'replica' in DATABASES else "")
+TICKET_REPLICA_STICKY_SECONDS = float(os.environ.get("TICKET_REPLICA_STICKY_SECONDS", "5"))
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# The in-memory default is per process; with several workers set DJANGO_CACHE_URL so the
+# response cache generations (tickets.domain.cache) are shared and writes invalidate everywhere.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+if os.environ.get("DJANGO_CACHE_URL"):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ["DJANGO_CACHE_URL"],
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -164,6 +208,121 @@ CORS_ALLOWED_ORIGINS = [
 # Shared secret for external ingestion endpoint
 EXTERNAL_TICKET_API_KEY = os.environ.get("EXTERNAL_TICKET_API_KEY", "dev-external-api-key")
 
+# POST /external/tickets/batch limits
+EXTERNAL_BATCH_MAX_ITEMS = int(os.environ.get("EXTERNAL_BATCH_MAX_ITEMS", "1000"))
+EXTERNAL_BATCH_CHUNK_SIZE = int(os.environ.get("EXTERNAL_BATCH_CHUNK_SIZE", "500"))
+
+# Async external ingest (POST /external/tickets with `Prefer: respond-async`): jobs claimed
+# per worker round-trip, and how long a claimed job may stay "processing" before it is requeued.
+EXTERNAL_INGEST_BATCH_SIZE = int(os.environ.get("EXTERNAL_INGEST_BATCH_SIZE", "200"))
+EXTERNAL_INGEST_STALE_AFTER = int(os.environ.get("EXTERNAL_INGEST_STALE_AFTER", "600"))  # seconds
+
+# Comments embedded in ticket detail responses / page size of the comments endpoints
+TICKET_DETAIL_COMMENT_LIMIT = int(os.environ.get("TICKET_DETAIL_COMMENT_LIMIT", "50"))
+TICKET_COMMENT_PAGE_SIZE = int(os.environ.get("TICKET_COMMENT_PAGE_SIZE", "50"))
+
+# Rows fetched per DB round-trip by /admin/tickets/export and `manage.py export_tickets`
+TICKET_EXPORT_CHUNK_SIZE = int(os.environ.get("TICKET_EXPORT_CHUNK_SIZE", "2000"))
+
+# Resumable uploads (/uploads): part files live outside MEDIA_ROOT until finalized
+TICKET_UPLOAD_DIR = os.environ.get("TICKET_UPLOAD_DIR", str(BASE_DIR / "uploads"))
+TICKET_UPLOAD_CHUNK_SIZE = int(os.environ.get("TICKET_UPLOAD_CHUNK_SIZE", str(8 * 1024 * 1024)))
+TICKET_UPLOAD_MAX_BYTES = int(os.environ.get("TICKET_UPLOAD_MAX_BYTES", str(2 * 1024**3)))
+TICKET_UPLOAD_SESSION_TTL = int(os.environ.get("TICKET_UPLOAD_SESSION_TTL", str(24 * 3600)))  # seconds
+
+# Blob files without a row (rolled-back or crashed uploads) younger than this are kept by
+# `manage.py gc_attachment_blobs`; it must exceed the longest upload transaction.
+TICKET_BLOB_ORPHAN_GRACE = int(os.environ.get("TICKET_BLOB_ORPHAN_GRACE", "3600"))  # seconds
+
+# Attachment downloads: "" streams from Django (FileResponse / sendfile), or hand the
+# file to the front proxy with "x-accel-redirect" (nginx) / "x-sendfile" (Apache, lighttpd).
+TICKET_ATTACHMENT_SENDFILE = os.environ.get("TICKET_ATTACHMENT_SENDFILE", "").strip().lower()
+TICKET_ATTACHMENT_ACCEL_PREFIX = os.environ.get("TICKET_ATTACHMENT_ACCEL_PREFIX", "/protected-media/")
+
+# Transactional outbox (ticket change events). Each sink: {"name", "backend" (dotted path), "options"}.
+# Built-ins: tickets.domain.outbox.WebhookSink(url, secret, timeout), LogFileSink(path),
+# CallbackSink(callback="dotted.path.to.function").
+TICKET_OUTBOX_SINKS = []
+if os.environ.get("TICKET_OUTBOX_WEBHOOK_URL"):
+    TICKET_OUTBOX_SINKS.append(
+        {
+            "name": "webhook",
+            "backend": "tickets.domain.outbox.WebhookSink",
+            "options": {
+                "url": os.environ["TICKET_OUTBOX_WEBHOOK_URL"],
+                "secret": os.environ.get("TICKET_OUTBOX_WEBHOOK_SECRET", ""),
+            },
+        }
+    )
+if os.environ.get("TICKET_OUTBOX_LOG_PATH"):
+    TICKET_OUTBOX_SINKS.append(
+        {
+            "name": "logfile",
+            "backend": "tickets.domain.outbox.LogFileSink",
+            "options": {"path": os.environ["TICKET_OUTBOX_LOG_PATH"]},
+        }
+    )
+TICKET_OUTBOX_BATCH_SIZE = int(os.environ.get("TICKET_OUTBOX_BATCH_SIZE", "500"))
+# Relay only events at least this old. 0 is right for SQLite: event ids are allocated under its
+# write lock, so they commit in id order. Databases with concurrent writers need a few seconds.
+TICKET_OUTBOX_SETTLE_SECONDS = float(os.environ.get("TICKET_OUTBOX_SETTLE_SECONDS", "0"))
+TICKET_OUTBOX_RETENTION = int(os.environ.get("TICKET_OUTBOX_RETENTION", str(7 * 24 * 3600)))  # seconds
+
+# /admin/tickets/changes and /customer/tickets/changes
+TICKET_CHANGES_PAGE_SIZE = int(os.environ.get("TICKET_CHANGES_PAGE_SIZE", "100"))
+TICKET_CHANGES_MAX_WAIT = float(os.environ.get("TICKET_CHANGES_MAX_WAIT", "30"))  # long-poll cap, seconds
+TICKET_CHANGES_POLL_INTERVAL = float(os.environ.get("TICKET_CHANGES_POLL_INTERVAL", "1"))  # seconds
+# The feed's cursor is an outbox event id. Like TICKET_OUTBOX_SETTLE_SECONDS, 0 is right for
+# SQLite; databases with concurrent writers need a few seconds.
+TICKET_CHANGES_SETTLE_SECONDS = float(os.environ.get("TICKET_CHANGES_SETTLE_SECONDS", "0"))
+
+# Live SSE streams (/customer/tickets/events, ...). LocalBroker only reaches clients of the
+# publishing process; set TICKET_LIVE_REDIS_URL to fan out across ASGI workers and Celery.
+TICKET_LIVE_BROKER = {"backend": "tickets.domain.live.LocalBroker"}
+if os.environ.get("TICKET_LIVE_REDIS_URL"):
+    TICKET_LIVE_BROKER = {
+        "backend": "tickets.domain.live.RedisBroker",
+        "options": {"url": os.environ["TICKET_LIVE_REDIS_URL"]},
+    }
+TICKET_LIVE_HEARTBEAT = float(os.environ.get("TICKET_LIVE_HEARTBEAT", "15"))  # seconds
+TICKET_LIVE_QUEUE_SIZE = int(os.environ.get("TICKET_LIVE_QUEUE_SIZE", "256"))  # per connection
+TICKET_LIVE_REPLAY_LIMIT = int(os.environ.get("TICKET_LIVE_REPLAY_LIMIT", "500"))
+
+# Cached GET responses (categories, admin list/detail/stats); 0 disables the response cache.
+# Off by default with the per-process LocMemCache: writes made in another process (the Celery
+# worker's ingest drain, archive and beat jobs, management commands) would never invalidate it.
+TICKET_RESPONSE_CACHE_TIMEOUT = int(
+    os.environ.get("TICKET_RESPONSE_CACHE_TIMEOUT", "300" if os.environ.get("DJANGO_CACHE_URL") else "0")
+)
+TICKET_RESPONSE_CACHE_ALIAS = os.environ.get("TICKET_RESPONSE_CACHE_ALIAS", "default")
+
+# How often (seconds) each process re-checks the shared `categories` generation behind its
+# in-memory category index; category writes in the same process apply immediately.
+TICKET_CATEGORY_INDEX_TTL = float(os.environ.get("TICKET_CATEGORY_INDEX_TTL", "5"))
+
+# Per-request instrumentation (ticketing.middleware.ServerTimingMiddleware): send the
+# Server-Timing header, and log requests slower than this many ms with their SQL fingerprints (0 = off).
+TICKET_SERVER_TIMING = os.environ.get("TICKET_SERVER_TIMING", "true").lower() in {"1", "true", "yes", "on"}
+TICKET_SLOW_REQUEST_MS = float(os.environ.get("TICKET_SLOW_REQUEST_MS", "500"))
+
+# Single-writer queue (tickets.domain.writer): service writes run on one thread per process and
+# are committed together, up to this many per transaction. On by default with the concurrent profile.
+TICKET_WRITE_QUEUE = os.environ.get(
+    "TICKET_WRITE_QUEUE", "true" if SQLITE_PROFILE == "concurrent" else "false"
+).lower() in {"1", "true", "yes", "on"}
+TICKET_WRITE_QUEUE_BATCH = int(os.environ.get("TICKET_WRITE_QUEUE_BATCH", "64"))
+
+# Archival of closed tickets (tickets.domain.archive): tickets closed and untouched for this many days
+# move with their comments and attachments to the archive tables, TICKET_ARCHIVE_BATCH_SIZE per transaction,
+# sleeping TICKET_ARCHIVE_PAUSE seconds between batches and at most TICKET_ARCHIVE_MAX_BATCHES per run (0 = all).
+TICKET_ARCHIVE_AFTER_DAYS = int(os.environ.get("TICKET_ARCHIVE_AFTER_DAYS", "90"))
+TICKET_ARCHIVE_BATCH_SIZE = int(os.environ.get("TICKET_ARCHIVE_BATCH_SIZE", "500"))
+TICKET_ARCHIVE_PAUSE = float(os.environ.get("TICKET_ARCHIVE_PAUSE", "0.5"))
+TICKET_ARCHIVE_MAX_BATCHES = int(os.environ.get("TICKET_ARCHIVE_MAX_BATCHES", "100"))
+
+# Admin `q` search backend (dotted path). Empty = FTS5 on SQLite, icontains elsewhere.
+TICKET_SEARCH_BACKEND = os.environ.get("TICKET_SEARCH_BACKEND") or None
+
 # Celery (optional). By default tasks run eagerly (no broker required).
 CELERY_TASK_ALWAYS_EAGER = os.environ.get("CELERY_TASK_ALWAYS_EAGER", "true").lower() in {
     "1",
@@ -173,6 +332,25 @@ CELERY_TASK_ALWAYS_EAGER = os.environ.get("CELERY_TASK_ALWAYS_EAGER", "true").lo
 }
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", CELERY_BROKER_URL)
+CELERY_BEAT_SCHEDULE = {
+    "relay-outbox": {
+        "task": "tickets.tasks.relay_outbox",
+        "schedule": 5,
+    },
+    # Safety net for ingest jobs whose on-commit enqueue was lost (broker down, worker crash).
+    "drain-ingest-jobs": {
+        "task": "tickets.tasks.drain_ingest_jobs",
+        "schedule": 60,
+    },
+    "purge-expired-upload-sessions": {
+        "task": "tickets.tasks.purge_expired_upload_sessions",
+        "schedule": 15 * 60,
+    },
+    "archive-closed-tickets": {
+        "task": "tickets.tasks.archive_closed_tickets",
+        "schedule": 60 * 60,
+    },
+}
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
@@ -0,0 +1,44 @@
+"""
+Opt-in SQLite profile for concurrent ingest and admin traffic.
+
+The stock configuration uses a rollback journal, so a writer blocks every
+reader. It also uses deferred transactions, so two requests that both read
+and then write can deadlock. SQLite breaks that deadlock by failing one of
+them at once with "database is locked", whatever the timeout. This profile:
+
+- switches to WAL: readers no longer block the writer or each other;
+- uses synchronous=NORMAL: in WAL mode a crash can lose the last commits but
+  never corrupts the file, and a commit needs no fsync;
+- sets busy_timeout: a writer waits for the lock instead of failing;
+- opens write transactions with BEGIN IMMEDIATE: the lock is taken up front,
+  so the read-then-upgrade deadlock cannot happen;
+- maps the file (mmap_size) and enlarges the page cache;
+- keeps connections open between requests (CONN_MAX_AGE), so the pragmas
+  run once per connection, not once per request.
+
+Selected with DJANGO_SQLITE_PROFILE=concurrent (see settings.py), which also
+turns on the single-writer queue (tickets.domain.writer).
+"""
+
+PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 10_000,  # ms
+    "mmap_size": 256 * 1024**2,
+    "cache_size": -64_000,  # negative = KiB, i.e. ~64 MB per connection
+    "temp_store": "MEMORY",
+}
+
+
+def concurrent_profile(database: dict, *, conn_max_age: int = 600) -> dict:
+    """`database` (a DATABASES entry) with the concurrent profile applied."""
+    return {
+        **database,
+        "CONN_MAX_AGE": conn_max_age,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            **database.get("OPTIONS", {}),
+            "init_command": ";".join(f"PRAGMA {name}={value}" for name, value in PRAGMAS.items()),
+            "transaction_mode": "IMMEDIATE",
+        },
+    }
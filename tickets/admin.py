@@ -1,6 +1,15 @@
 from django.contrib import admin
 
-from .models import Category, Comment, Ticket, TicketAttachment
+from .models import (
+    AttachmentBlob,
+    Category,
+    Comment,
+    OutboxCheckpoint,
+    OutboxEvent,
+    Ticket,
+    TicketAttachment,
+    TicketStatsBucket,
+)
 
 
 @admin.register(Category)
@@ -40,9 +49,37 @@ class CommentAdmin(admin.ModelAdmin):
 
 @admin.register(TicketAttachment)
 class TicketAttachmentAdmin(admin.ModelAdmin):
-    list_display = ("id", "ticket", "file", "created_at")
+    list_display = ("id", "ticket", "original_name", "file", "created_at")
     list_filter = ("created_at",)
-    search_fields = ("file",)
-    readonly_fields = ("created_at",)
+    search_fields = ("file", "original_name", "blob__sha256")
+    readonly_fields = ("blob", "created_at")
     ordering = ("-created_at",)
 
+
+@admin.register(AttachmentBlob)
+class AttachmentBlobAdmin(admin.ModelAdmin):
+    list_display = ("sha256", "size", "ref_count", "created_at")
+    search_fields = ("sha256",)
+    readonly_fields = ("sha256", "file", "size", "ref_count", "created_at")
+    ordering = ("-created_at",)
+
+
+@admin.register(TicketStatsBucket)
+class TicketStatsBucketAdmin(admin.ModelAdmin):
+    list_display = ("status", "priority", "source", "category", "count")
+    list_filter = ("status", "priority", "source", "category")
+    readonly_fields = ("status", "priority", "source", "category", "count")
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ("id", "event_type", "ticket_id", "created_at")
+    list_filter = ("event_type",)
+    search_fields = ("ticket_id",)
+    readonly_fields = ("event_type", "ticket_id", "payload", "created_at")
+    ordering = ("-id",)
+
+
+@admin.register(OutboxCheckpoint)
+class OutboxCheckpointAdmin(admin.ModelAdmin):
+    list_display = ("sink", "last_event_id", "updated_at")
@@ -1,8 +1,15 @@
-from django.db.models import Count
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from tickets.api.caching import CachedResponseMixin, cache_stats, cached_get
+from tickets.api.conditional import not_modified_response, set_validators, ticket_etag
+from tickets.api.downloads import attachment_response
+from tickets.api.mixins import SparseTicketListMixin
+from tickets.api.pagination import CommentKeysetPagination, OptionalCursorPaginationMixin
 from tickets.api.serializers import (
     CommentCreateSerializer,
     CommentSerializer,
@@ -11,51 +18,128 @@ from tickets.api.serializers import (
     TicketListSerializer,
 )
 from tickets.domain.actor import get_actor_from_request
+from tickets.domain.cache import ticket_scope
+from tickets.domain.export import EXPORT_FORMATS, export_tickets
+from tickets.domain.metrics import request_metrics
 from tickets.domain.permissions import require_role
-from tickets.domain.selectors import admin_ticket_qs, get_admin_ticket_or_404
+from tickets.domain.selectors import (
+    admin_ticket_qs,
+    get_admin_ticket_or_404,
+    get_attachment_for_download_or_404,
+    get_ticket_version_or_404,
+    ticket_comments_or_404,
+)
 from tickets.domain.services import add_comment, admin_update_ticket
-from tickets.models import Comment, Ticket
-
-
-class AdminTicketListView(generics.ListAPIView):
+from tickets.domain.stats import ticket_stats_summary
+from tickets.models import Comment
+
+
+def admin_filters_from_params(params) -> dict:
+    return {
+        "status": params.get("status"),
+        "priority": params.get("priority"),
+        "category": params.get("category"),
+        "assigned_to": params.get("assigned_to"),
+        "source": params.get("source"),
+        "q": params.get("q"),
+        "rank": params.get("sort") == "relevance",
+    }
+
+
+class AdminTicketListView(
+    CachedResponseMixin,
+    SparseTicketListMixin,
+    OptionalCursorPaginationMixin,
+    generics.ListAPIView,
+):
     """
     GET /admin/tickets
     Filters:
       - status, priority, category, assigned_to, source, q
+      - sort=relevance (rank `q` matches instead of newest-first)
+    Pagination:
+      - page-number (default) or `?pagination=cursor`
+    Sparse fieldset:
+      - fields=id,title,status,... (defaults to every list field)
     """
 
     serializer_class = TicketListSerializer
+    cache_endpoint = "admin-ticket-list"
+
+    @cached_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
 
     def get_queryset(self):
         actor = get_actor_from_request(self.request)
         require_role(actor, "admin")
 
-        params = self.request.query_params
-        return admin_ticket_qs(
-            status=params.get("status"),
-            priority=params.get("priority"),
-            category=params.get("category"),
-            assigned_to=params.get("assigned_to"),
-            source=params.get("source"),
-            q=params.get("q"),
+        return admin_ticket_qs(**admin_filters_from_params(self.request.query_params))
+
+
+class AdminTicketExportView(APIView):
+    """
+    GET /admin/tickets/export
+
+    Streams every ticket matching the admin list filters (same query params as
+    GET /admin/tickets) without pagination.
+      - output=ndjson (default) | csv
+      - include_comments=1 to embed each ticket's comments
+    """
+
+    def get(self, request):
+        actor = get_actor_from_request(request)
+        require_role(actor, "admin")
+
+        params = request.query_params
+        fmt = (params.get("output") or "ndjson").strip().lower()
+        if fmt not in EXPORT_FORMATS:
+            raise ValidationError({"output": f"Use one of: {', '.join(EXPORT_FORMATS)}"})
+        include_comments = params.get("include_comments", "").lower() in {"1", "true", "yes"}
+
+        qs = admin_ticket_qs(**admin_filters_from_params(params))
+        response = StreamingHttpResponse(
+            export_tickets(
+                qs,
+                fmt=fmt,
+                chunk_size=getattr(settings, "TICKET_EXPORT_CHUNK_SIZE", 2000),
+                include_comments=include_comments,
+            ),
+            content_type=EXPORT_FORMATS[fmt],
         )
+        response["Content-Disposition"] = f'attachment; filename="tickets.{fmt}"'
+        return response
 
 
-class AdminTicketRetrieveUpdateView(APIView):
+class AdminTicketRetrieveUpdateView(CachedResponseMixin, APIView):
     """
-    GET /admin/tickets/{id}
+    GET /admin/tickets/{id}  (conditional GET: ETag / Last-Modified, 304 on If-None-Match)
     PUT /admin/tickets/{id}
 
     Update fields:
       - status, priority, category, assigned_to, title, description
     """
 
+    cache_endpoint = "admin-ticket-detail"
+
+    def get_cache_scopes(self, ticket_id: int, **kwargs):
+        return (ticket_scope(int(ticket_id)),)
+
+    @cached_get
     def get(self, request, ticket_id: int):
         actor = get_actor_from_request(request)
         require_role(actor, "admin")
 
+        updated_at = get_ticket_version_or_404(ticket_id=int(ticket_id))
+        etag = ticket_etag(int(ticket_id), updated_at)
+        not_modified = not_modified_response(request, etag=etag, last_modified=updated_at)
+        if not_modified is not None:
+            return not_modified
+
         ticket = get_admin_ticket_or_404(ticket_id=int(ticket_id))
-        return Response(TicketDetailSerializer(ticket).data, status=status.HTTP_200_OK)
+        data = TicketDetailSerializer(ticket, context={"request": request, "role": actor.role}).data
+        response = Response(data, status=status.HTTP_200_OK)
+        return set_validators(response, etag=etag, last_modified=updated_at)
 
     def put(self, request, ticket_id: int):
         actor = get_actor_from_request(request)
@@ -66,14 +150,25 @@ class AdminTicketRetrieveUpdateView(APIView):
         serializer.is_valid(raise_exception=True)
 
         ticket = admin_update_ticket(ticket=ticket, data=serializer.validated_data)
-        return Response(TicketDetailSerializer(ticket).data, status=status.HTTP_200_OK)
+        data = TicketDetailSerializer(ticket, context={"request": request, "role": actor.role}).data
+        return Response(data, status=status.HTTP_200_OK)
 
 
-class AdminTicketCommentCreateView(APIView):
+class AdminTicketCommentListCreateView(APIView):
     """
+    GET  /admin/tickets/{id}/comments  (keyset-paginated: ?cursor=...&limit=...)
     POST /admin/tickets/{id}/comments
     """
 
+    def get(self, request, ticket_id: int):
+        actor = get_actor_from_request(request)
+        require_role(actor, "admin")
+
+        comments = ticket_comments_or_404(ticket_id=int(ticket_id))
+        paginator = CommentKeysetPagination()
+        page = paginator.paginate_queryset(comments, request, view=self)
+        return paginator.get_paginated_response(CommentSerializer(page, many=True).data)
+
     def post(self, request, ticket_id: int):
         actor = get_actor_from_request(request)
         require_role(actor, "admin")
@@ -90,32 +185,67 @@ class AdminTicketCommentCreateView(APIView):
         return Response(CommentSerializer(comment).data, status=status.HTTP_201_CREATED)
 
 
-class AdminTicketStatsView(APIView):
+class AdminTicketAttachmentDownloadView(APIView):
+    """
+    GET /admin/tickets/{id}/attachments/{attachment_id}
+
+    Supports Range / If-Range and conditional GET; see tickets.api.downloads.
+    """
+
+    def perform_content_negotiation(self, request, force=False):
+        # The file is the response; a download client's Accept header must not turn it into a 406.
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request, ticket_id: int, attachment_id: int):
+        actor = get_actor_from_request(request)
+        require_role(actor, "admin")
+
+        attachment = get_attachment_for_download_or_404(ticket_id=int(ticket_id), attachment_id=int(attachment_id))
+        return attachment_response(request, attachment)
+
+
+class AdminTicketStatsView(CachedResponseMixin, APIView):
     """
     GET /admin/tickets/stats
+
+    Returns by_status, by_priority, by_source and by_category counts.
     """
 
+    cache_endpoint = "admin-ticket-stats"
+
+    @cached_get
     def get(self, request):
         actor = get_actor_from_request(request)
         require_role(actor, "admin")
 
-        by_status = {
-            row["status"]: row["c"]
-            for row in Ticket.objects.values("status").annotate(c=Count("id")).order_by()
-        }
-        by_priority = {
-            row["priority"]: row["c"]
-            for row in Ticket.objects.values("priority").annotate(c=Count("id")).order_by()
-        }
-        by_source = {
-            row["source"]: row["c"]
-            for row in Ticket.objects.values("source").annotate(c=Count("id")).order_by()
-        }
-        return Response(
-            {
-                "by_status": by_status,
-                "by_priority": by_priority,
-                "by_source": by_source,
-            }
-        )
+        # Served from the incrementally maintained bucket table, not a table scan.
+        return Response(ticket_stats_summary())
+
+
+class AdminResponseCacheStatsView(APIView):
+    """
+    GET /admin/cache/stats
+
+    Response cache hits, misses and hit ratio per cached endpoint.
+    """
+
+    def get(self, request):
+        actor = get_actor_from_request(request)
+        require_role(actor, "admin")
+
+        return Response({"enabled": bool(settings.TICKET_RESPONSE_CACHE_TIMEOUT), "endpoints": cache_stats()})
+
+
+class AdminMetricsView(APIView):
+    """
+    GET /admin/metrics
+
+    Per-endpoint request duration, query count and DB time histograms of this
+    worker process, in the Prometheus text exposition format.
+    """
+
+    def get(self, request):
+        actor = get_actor_from_request(request)
+        require_role(actor, "admin")
 
+        return HttpResponse(request_metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
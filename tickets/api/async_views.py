@@ -0,0 +1,308 @@
+"""
+Native async (ASGI) versions of the hot read endpoints.
+
+Mounted under /async/... next to the DRF views, with the same actor/role checks
+and response shapes. The ORM is driven through Django's async API (aget,
+acount, async iteration), so under an ASGI server (e.g.
+`uvicorn ticketing.asgi:application`) a worker keeps many polling clients in
+flight on its event loop instead of funnelling every request through the
+sync-view thread. Each query still runs in a thread (Django's per-request
+thread under ASGI). The long-poll change feeds (/admin/tickets/changes,
+/customer/tickets/changes) live here too; they are `long_lived`, so
+ticketing.handlers serves them without a thread per waiting client.
+"""
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Max
+from django.http import HttpResponse, JsonResponse
+from django.views import View
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from tickets.api.conditional import list_etag, not_modified_response, set_validators, ticket_etag
+from tickets.api.pagination import TicketCursorPagination
+from tickets.api.serializers import TicketDetailSerializer, parse_ticket_fields, serialize_ticket_rows
+from tickets.domain.actor import get_actor_from_request
+from tickets.domain.changes import CHANGE_COMMENT_FIELDS, afetch_changes, wait_for_changes
+from tickets.domain.permissions import require_role
+from tickets.domain.selectors import (
+    admin_ticket_qs,
+    aget_admin_ticket_or_404,
+    aget_customer_ticket_or_404,
+    aget_ticket_version_or_404,
+    customer_ticket_list_qs,
+    customer_ticket_qs,
+)
+from tickets.domain.stats import aticket_stats_summary
+
+
+def _json(data, status: int = 200) -> JsonResponse:
+    return JsonResponse(data, status=status, safe=False, encoder=DjangoJSONEncoder)
+
+
+class AsyncTicketAPIView(View):
+    """
+    Base for async read views: resolves the actor, enforces `required_role` and
+    turns DRF API exceptions into the same JSON error bodies DRF would return.
+    """
+
+    required_role: str = ""
+    # Held open until something happens (long-poll, event stream): never reported as a slow request.
+    long_lived: bool = False
+    http_method_names = ["get", "options"]
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            self.actor = get_actor_from_request(request)
+            require_role(self.actor, self.required_role)
+            return await super().dispatch(request, *args, **kwargs)
+        except APIException as exc:
+            detail = exc.detail if isinstance(exc.detail, (dict, list)) else {"detail": exc.detail}
+            return _json(detail, status=exc.status_code)
+
+
+async def paginate_rows(request, queryset, fields: tuple[str, ...], *, count: int | None = None) -> dict:
+    """
+    Page-number pagination with the same response shape as DRF's PageNumberPagination.
+
+    Pass `count` when the caller already has it, to skip the COUNT(*).
+    """
+    page_size = api_settings.PAGE_SIZE
+    try:
+        page = int(request.GET.get("page", 1))
+    except ValueError:
+        page = 0
+    if page < 1:
+        raise NotFound("Invalid page.")
+
+    if count is None:
+        count = await queryset.acount()
+    start = (page - 1) * page_size
+    if start >= count and page != 1:
+        raise NotFound("Invalid page.")
+
+    rows = [row async for row in queryset.values(*fields)[start:start + page_size]]
+
+    url = request.build_absolute_uri()
+    next_url = replace_query_param(url, "page", page + 1) if start + page_size < count else None
+    if page == 1:
+        previous_url = None
+    elif page == 2:
+        previous_url = remove_query_param(url, "page")
+    else:
+        previous_url = replace_query_param(url, "page", page - 1)
+    return {
+        "count": count,
+        "next": next_url,
+        "previous": previous_url,
+        "results": serialize_ticket_rows(rows, fields),
+    }
+
+
+def wants_cursor_pagination(request) -> bool:
+    """The switch OptionalCursorPaginationMixin uses: `?pagination=cursor`, or a cursor link."""
+    if request.GET.get("pagination", "").strip().lower() == "cursor":
+        return True
+    return TicketCursorPagination.cursor_query_param in request.GET
+
+
+async def paginate_rows_by_cursor(request, queryset, fields: tuple[str, ...]) -> dict:
+    """Cursor pages with the DRF list views' paginator, so cursors work on both."""
+    paginator = TicketCursorPagination()
+    rows = queryset.values(*dict.fromkeys(fields + ("id", "created_at")))
+    # DRF's paginator decodes the cursor and evaluates the page synchronously.
+    page = await sync_to_async(paginator.paginate_queryset)(rows, Request(request))
+    return {
+        "next": paginator.get_next_link(),
+        "previous": paginator.get_previous_link(),
+        "results": serialize_ticket_rows(page, fields),
+    }
+
+
+async def ticket_list_response(request, queryset, fields: tuple[str, ...]) -> HttpResponse:
+    """
+    List response as SparseTicketListMixin builds it: cursor pages, or page
+    numbers with a weak ETag over the filtered set (304 on If-None-Match).
+    """
+    if wants_cursor_pagination(request):
+        return _json(await paginate_rows_by_cursor(request, queryset, fields))
+
+    version = await queryset.order_by().aaggregate(last=Max("updated_at"), n=Count("id"))
+    etag = list_etag(version["last"], version["n"], request.META.get("QUERY_STRING", ""))
+    not_modified = not_modified_response(request, etag=etag, last_modified=version["last"])
+    if not_modified is not None:
+        return not_modified
+    response = _json(await paginate_rows(request, queryset, fields, count=version["n"]))
+    return set_validators(response, etag=etag, last_modified=version["last"])
+
+
+class AsyncCustomerTicketListView(AsyncTicketAPIView):
+    """
+    GET /async/customer/tickets  (?pagination=cursor for cursor pages)
+    """
+
+    required_role = "customer"
+
+    async def get(self, request):
+        fields = parse_ticket_fields(request.GET.get("fields"))
+        return await ticket_list_response(request, customer_ticket_list_qs(customer_email=self.actor.user), fields)
+
+
+class AsyncCustomerTicketDetailView(AsyncTicketAPIView):
+    """
+    GET /async/customer/tickets/{id}
+    """
+
+    required_role = "customer"
+
+    async def get(self, request, ticket_id: int):
+        updated_at = await aget_ticket_version_or_404(ticket_id=ticket_id, customer_email=self.actor.user)
+        etag = ticket_etag(ticket_id, updated_at)
+        not_modified = not_modified_response(request, etag=etag, last_modified=updated_at)
+        if not_modified is not None:
+            return not_modified
+
+        ticket = await aget_customer_ticket_or_404(ticket_id=ticket_id, customer_email=self.actor.user)
+        response = _json(TicketDetailSerializer(ticket, context={"request": request, "role": self.actor.role}).data)
+        return set_validators(response, etag=etag, last_modified=updated_at)
+
+
+class AsyncAdminTicketListView(AsyncTicketAPIView):
+    """
+    GET /async/admin/tickets  (?pagination=cursor for cursor pages)
+    Filters: status, priority, category, assigned_to, source, q, sort=relevance, fields
+    """
+
+    required_role = "admin"
+
+    async def get(self, request):
+        params = request.GET
+        fields = parse_ticket_fields(params.get("fields"))
+        # The search backend may introspect the DB on first use, so build the queryset off-loop.
+        qs = await sync_to_async(admin_ticket_qs)(
+            status=params.get("status"),
+            priority=params.get("priority"),
+            category=params.get("category"),
+            assigned_to=params.get("assigned_to"),
+            source=params.get("source"),
+            q=params.get("q"),
+            rank=params.get("sort") == "relevance",
+        )
+        return await ticket_list_response(request, qs, fields)
+
+
+class AsyncAdminTicketDetailView(AsyncTicketAPIView):
+    """
+    GET /async/admin/tickets/{id}
+    """
+
+    required_role = "admin"
+
+    async def get(self, request, ticket_id: int):
+        updated_at = await aget_ticket_version_or_404(ticket_id=ticket_id)
+        etag = ticket_etag(ticket_id, updated_at)
+        not_modified = not_modified_response(request, etag=etag, last_modified=updated_at)
+        if not_modified is not None:
+            return not_modified
+
+        ticket = await aget_admin_ticket_or_404(ticket_id=ticket_id)
+        response = _json(TicketDetailSerializer(ticket, context={"request": request, "role": self.actor.role}).data)
+        return set_validators(response, etag=etag, last_modified=updated_at)
+
+
+class AsyncAdminTicketStatsView(AsyncTicketAPIView):
+    """
+    GET /async/admin/tickets/stats
+    """
+
+    required_role = "admin"
+
+    async def get(self, request):
+        return _json(await aticket_stats_summary())
+
+
+def parse_change_cursor(cursor: str) -> int:
+    """A change feed cursor is an outbox event id."""
+    try:
+        return int(cursor)
+    except ValueError as exc:
+        raise NotFound("Invalid cursor") from exc
+
+
+class TicketChangesView(AsyncTicketAPIView):
+    """
+    Incremental change feed over `get_base_queryset()`.
+
+    Query params: since (cursor from a previous response), timeout (seconds to
+    long-poll when nothing changed, capped at TICKET_CHANGES_MAX_WAIT), limit, fields.
+    """
+
+    max_limit = 500
+    long_lived = True
+
+    def get_base_queryset(self):
+        raise NotImplementedError
+
+    def get_timeout(self) -> float:
+        value = self.request.GET.get("timeout", "0")
+        try:
+            timeout = float(value)
+        except ValueError:
+            timeout = -1
+        if not 0 <= timeout < float("inf"):
+            raise ValidationError({"timeout": "Must be a non-negative number of seconds"})
+        return min(timeout, settings.TICKET_CHANGES_MAX_WAIT)
+
+    def get_limit(self) -> int:
+        try:
+            requested = int(self.request.GET.get("limit", ""))
+        except ValueError:
+            requested = 0
+        return min(requested, self.max_limit) if requested > 0 else settings.TICKET_CHANGES_PAGE_SIZE
+
+    async def get(self, request):
+        fields = parse_ticket_fields(request.GET.get("fields"))
+        cursor = request.GET.get("since") or None
+        since = parse_change_cursor(cursor) if cursor else None
+        timeout = self.get_timeout()
+        limit = self.get_limit()
+        base = self.get_base_queryset()
+
+        changes = await afetch_changes(base, since=since, limit=limit, fields=fields)
+        if not changes.tickets and timeout and await wait_for_changes(base, since=since, timeout=timeout):
+            changes = await afetch_changes(base, since=since, limit=limit, fields=fields)
+
+        return _json(
+            {
+                "cursor": str(changes.position) if changes.position else cursor,
+                "has_more": changes.has_more,
+                "tickets": serialize_ticket_rows(changes.tickets, fields),
+                "comments": serialize_ticket_rows(changes.comments, CHANGE_COMMENT_FIELDS),
+            }
+        )
+
+
+class CustomerTicketChangesView(TicketChangesView):
+    """
+    GET /customer/tickets/changes?since=<cursor>&timeout=<seconds>
+    """
+
+    required_role = "customer"
+
+    def get_base_queryset(self):
+        return customer_ticket_qs(customer_email=self.actor.user)
+
+
+class AdminTicketChangesView(TicketChangesView):
+    """
+    GET /admin/tickets/changes?since=<cursor>&timeout=<seconds>
+    """
+
+    required_role = "admin"
+
+    def get_base_queryset(self):
+        return admin_ticket_qs()
@@ -0,0 +1,75 @@
+"""
+Performance budgets for every endpoint in tickets/urls.py.
+
+Keyed by URL name and HTTP method. `queries` is the most SQL statements the
+endpoint's representative request may run (transaction savepoints are not
+counted); `latency_ms` is the ceiling for its median time through the whole
+middleware stack. tickets/tests/test_budgets.py sends those requests against
+seeded data, where the detail ticket has many comments and attachments so an
+N+1 shows up, and fails on any overrun. Latency is only checked with
+TICKET_BUDGET_LATENCY=1, since it depends on the machine.
+
+Raise a budget only in the change that needs the extra work, and say why.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Budget:
+    queries: int
+    latency_ms: float
+
+
+READ = 150.0  # ms; generous enough for a loaded CI machine, far below a table scan at volume
+WRITE = 250.0
+
+BUDGETS: dict[str, dict[str, Budget]] = {
+    # Customer
+    "customer-ticket-list-create": {"GET": Budget(2, READ), "POST": Budget(6, WRITE)},
+    "customer-ticket-changes": {"GET": Budget(3, READ)},
+    "customer-ticket-detail": {"GET": Budget(4, READ)},
+    "customer-ticket-comment-create": {"GET": Budget(2, READ), "POST": Budget(7, WRITE)},
+    "customer-ticket-close": {"POST": Budget(7, WRITE)},
+    "customer-ticket-attachment-download": {"GET": Budget(1, READ)},
+    # Admin
+    "admin-ticket-list": {"GET": Budget(2, READ)},
+    "admin-ticket-stats": {"GET": Budget(1, READ)},
+    "admin-ticket-export": {"GET": Budget(2, READ)},  # per chunk: tickets, then their comments
+    "admin-ticket-changes": {"GET": Budget(3, READ)},
+    "admin-ticket-retrieve-update": {"GET": Budget(4, READ), "PUT": Budget(4, WRITE)},
+    "admin-ticket-comment-create": {"GET": Budget(2, READ), "POST": Budget(7, WRITE)},
+    "admin-ticket-attachment-download": {"GET": Budget(1, READ)},
+    "admin-cache-stats": {"GET": Budget(0, READ)},
+    "admin-metrics": {"GET": Budget(0, READ)},
+    # External
+    "external-ticket-ingest": {"POST": Budget(5, WRITE)},
+    "external-ticket-batch-ingest": {"POST": Budget(4, WRITE)},
+    "external-ingest-job-detail": {"GET": Budget(1, READ)},
+    # Uploads
+    "upload-session-create": {"POST": Budget(2, WRITE)},
+    "upload-session-detail": {"GET": Budget(1, READ)},
+    "upload-chunk": {"PUT": Budget(3, WRITE)},
+    "upload-finalize": {"POST": Budget(10, WRITE)},
+    # Async (ASGI) reads
+    "async-customer-ticket-list": {"GET": Budget(2, READ)},
+    "async-customer-ticket-detail": {"GET": Budget(4, READ)},
+    "async-admin-ticket-list": {"GET": Budget(2, READ)},
+    "async-admin-ticket-stats": {"GET": Budget(1, READ)},
+    "async-admin-ticket-detail": {"GET": Budget(4, READ)},
+    # Categories
+    "category-list": {"GET": Budget(2, READ)},
+}
+
+# Endpoints without a per-request budget, and why.
+UNBUDGETED = {
+    "customer-ticket-events": "SSE stream: open-ended, needs ASGI",
+    "customer-ticket-detail-events": "SSE stream: open-ended, needs ASGI",
+    "admin-ticket-detail-events": "SSE stream: open-ended, needs ASGI",
+}
+
+
+def get_budget(url_name: str | None, method: str) -> Budget | None:
+    return BUDGETS.get(url_name or "", {}).get(method)
@@ -0,0 +1,142 @@
+"""
+Response cache for read-heavy DRF endpoints.
+
+Views opt in with `CachedResponseMixin` plus `@cached_get` on `get`. A 200 GET
+stores the response data and validators under a key made of the endpoint name,
+the current generations of the scopes the view depends on
+(`tickets.domain.cache`), the role/user headers and the normalized query
+string. A hit costs two cache reads and no queries, and is still rendered
+through DRF content negotiation. Because a write bumps the generations after
+commit, a read never returns data older than the last completed write.
+
+Hits and misses are counted per endpoint in the cache itself (so the numbers
+add up across workers) and exposed at GET /admin/cache/stats.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import math
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+
+from tickets.domain.cache import TICKETS, get_cache, get_generations
+from tickets.domain.routing import reading_from_replica
+
+
+CACHED_ENDPOINTS: list[str] = []
+
+
+def normalized_query(request) -> str:
+    """Query string with keys and repeated values sorted, so `?a=1&b=2` and `?b=2&a=1` share an entry."""
+    return urlencode(sorted((key, value) for key, values in request.GET.lists() for value in values))
+
+
+def _counter_key(endpoint: str, outcome: str) -> str:
+    return f"respstats:{endpoint}:{outcome}"
+
+
+def count(endpoint: str, outcome: str) -> None:
+    cache = get_cache()
+    key = _counter_key(endpoint, outcome)
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def cache_stats() -> dict[str, dict]:
+    cache = get_cache()
+    keys = [_counter_key(endpoint, outcome) for endpoint in CACHED_ENDPOINTS for outcome in ("hit", "miss")]
+    found = cache.get_many(keys)
+    stats = {}
+    for endpoint in CACHED_ENDPOINTS:
+        hits = found.get(_counter_key(endpoint, "hit"), 0)
+        misses = found.get(_counter_key(endpoint, "miss"), 0)
+        stats[endpoint] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+        }
+    return stats
+
+
+class CachedResponseMixin:
+    """
+    Response cache configuration for a view whose `get` is wrapped in `@cached_get`.
+
+    Set `cache_endpoint` and override `get_cache_scopes` when the response
+    depends on something narrower or other than "any ticket".
+    """
+
+    cache_endpoint = ""
+    cache_vary_headers = ("X-ROLE", "X-USER")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.cache_endpoint and cls.cache_endpoint not in CACHED_ENDPOINTS:
+            CACHED_ENDPOINTS.append(cls.cache_endpoint)
+
+    def get_cache_scopes(self, **kwargs) -> tuple[str, ...]:
+        return (TICKETS,)
+
+    def get_cache_key(self, request, **kwargs) -> str:
+        generations = get_generations(self.get_cache_scopes(**kwargs))
+        vary = [request.headers.get(header, "") for header in self.cache_vary_headers]
+        raw = "|".join([request.path, normalized_query(request), *vary])
+        digest = hashlib.sha1(raw.encode()).hexdigest()
+        return f"resp:{self.cache_endpoint}:{'.'.join(map(str, generations))}:{digest}"
+
+
+def _cached_response(request, entry: dict):
+    if entry["etag"]:
+        last_modified = parse_http_date_safe(entry["last_modified"] or "")
+        not_modified = get_conditional_response(request, etag=entry["etag"], last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+    headers = {}
+    if entry["etag"]:
+        headers["ETag"] = entry["etag"]
+    if entry["last_modified"]:
+        headers["Last-Modified"] = entry["last_modified"]
+    return Response(entry["data"], headers=headers)
+
+
+def cached_get(method):
+    """Serve a `CachedResponseMixin` view's GET from the response cache; only 200s are stored."""
+
+    @functools.wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        timeout = settings.TICKET_RESPONSE_CACHE_TIMEOUT
+        if not timeout:
+            return method(self, request, *args, **kwargs)
+
+        cache = get_cache()
+        key = self.get_cache_key(request, **kwargs)
+        entry = cache.get(key)
+        if entry is not None:
+            count(self.cache_endpoint, "hit")
+            return _cached_response(request, entry)
+
+        count(self.cache_endpoint, "miss")
+        response = method(self, request, *args, **kwargs)
+        if response.status_code == 200 and isinstance(response, Response):
+            entry = {
+                "data": response.data,
+                "etag": response.get("ETag"),
+                "last_modified": response.get("Last-Modified"),
+            }
+            if reading_from_replica():
+                # The replica may still miss the write that bumped the generation; keep the entry
+                # no longer than the lag the read-your-writes window already assumes.
+                timeout = min(timeout, math.ceil(settings.TICKET_REPLICA_STICKY_SECONDS))
+            cache.set(key, entry, timeout)
+        return response
+
+    return wrapper
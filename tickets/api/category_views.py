@@ -1,19 +1,32 @@
 from rest_framework import generics
 
+from tickets.api.caching import CachedResponseMixin, cached_get
 from tickets.api.serializers import CategorySerializer
+from tickets.domain.cache import CATEGORIES
 from tickets.models import Category
 
 
-class CategoryListView(generics.ListAPIView):
+class CategoryListView(CachedResponseMixin, generics.ListAPIView):
     """
     GET /categories
 
     Public endpoint to list all available categories.
     Frontend can use this to populate dropdowns when creating tickets.
+    Cached until a category is saved or deleted.
     """
 
+    cache_endpoint = "categories"
+    cache_vary_headers = ()
+
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     authentication_classes = []
     permission_classes = []
 
+    def get_cache_scopes(self, **kwargs):
+        return (CATEGORIES,)
+
+    @cached_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
@@ -0,0 +1,37 @@
+"""
+Conditional GET helpers (ETag / Last-Modified) for ticket endpoints.
+
+Validators are derived from `Ticket.updated_at`, which comment and attachment
+writes bump, so a 304 can be decided from a single-column query before any
+comments are loaded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def ticket_etag(ticket_id: int, updated_at: datetime) -> str:
+    return quote_etag(f"t{ticket_id}-{int(updated_at.timestamp() * 1_000_000)}")
+
+
+def list_etag(last_updated_at: datetime | None, count: int, query: str) -> str:
+    digest = hashlib.sha1(f"{last_updated_at and last_updated_at.isoformat()}|{count}|{query}".encode()).hexdigest()
+    return "W/" + quote_etag(digest[:20])
+
+
+def not_modified_response(request, *, etag: str, last_modified: datetime | None):
+    """Return a 304 response if the client's validators still match, else None."""
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    return get_conditional_response(request, etag=etag, last_modified=timestamp)
+
+
+def set_validators(response, *, etag: str, last_modified: datetime | None):
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
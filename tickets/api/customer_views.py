@@ -2,6 +2,10 @@ from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from tickets.api.conditional import not_modified_response, set_validators, ticket_etag
+from tickets.api.downloads import attachment_response
+from tickets.api.mixins import SparseTicketListMixin
+from tickets.api.pagination import CommentKeysetPagination, OptionalCursorPaginationMixin
 from tickets.api.serializers import (
     CommentCreateSerializer,
     CommentSerializer,
@@ -11,35 +15,34 @@ from tickets.api.serializers import (
 )
 from tickets.domain.actor import get_actor_from_request
 from tickets.domain.permissions import require_role
-from tickets.domain.selectors import customer_ticket_qs, get_customer_ticket_or_404
+from tickets.domain.selectors import (
+    customer_ticket_list_qs,
+    get_attachment_for_download_or_404,
+    get_customer_ticket_or_404,
+    get_ticket_version_or_404,
+    ticket_comments_or_404,
+)
 from tickets.domain.services import add_attachments, add_comment, create_customer_ticket, customer_close_ticket
 from tickets.models import Comment
 
 
-class CustomerTicketListCreateView(generics.ListCreateAPIView):
+class CustomerTicketListCreateView(SparseTicketListMixin, OptionalCursorPaginationMixin, generics.ListCreateAPIView):
     """
     - POST /customer/tickets
-    - GET  /customer/tickets
+    - GET  /customer/tickets  (page-number by default, `?pagination=cursor` for keyset,
+      `?fields=id,title,...` for a sparse fieldset)
     """
 
     def get_queryset(self):
         actor = get_actor_from_request(self.request)
         require_role(actor, "customer")
-        return customer_ticket_qs(customer_email=actor.user)
+        return customer_ticket_list_qs(customer_email=actor.user)
 
     def get_serializer_class(self):
         if self.request.method == "POST":
             return TicketCreateSerializer
         return TicketListSerializer
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        page = self.paginate_queryset(queryset)
-        serializer = TicketListSerializer(page or queryset, many=True)
-        if page is not None:
-            return self.get_paginated_response(serializer.data)
-        return Response(serializer.data)
-
     def create(self, request, *args, **kwargs):
         actor = get_actor_from_request(request)
         require_role(actor, "customer")
@@ -53,12 +56,15 @@ class CustomerTicketListCreateView(generics.ListCreateAPIView):
         if files:
             add_attachments(ticket=ticket, files=files, uploaded_by=actor.user)
 
-        return Response(TicketDetailSerializer(ticket, context={"request": request}).data, status=status.HTTP_201_CREATED)
+        data = TicketDetailSerializer(ticket, context={"request": request, "role": actor.role}).data
+        return Response(data, status=status.HTTP_201_CREATED)
 
 
 class CustomerTicketDetailView(generics.RetrieveAPIView):
     """
     GET /customer/tickets/{id}
+
+    Supports conditional GET: ETag / Last-Modified, 304 on If-None-Match.
     """
 
     serializer_class = TicketDetailSerializer
@@ -68,12 +74,40 @@ class CustomerTicketDetailView(generics.RetrieveAPIView):
         require_role(actor, "customer")
         return get_customer_ticket_or_404(ticket_id=int(self.kwargs["ticket_id"]), customer_email=actor.user)
 
+    def get_serializer_context(self):
+        return {**super().get_serializer_context(), "role": "customer"}
+
+    def retrieve(self, request, *args, **kwargs):
+        actor = get_actor_from_request(request)
+        require_role(actor, "customer")
+
+        ticket_id = int(self.kwargs["ticket_id"])
+        updated_at = get_ticket_version_or_404(ticket_id=ticket_id, customer_email=actor.user)
+        etag = ticket_etag(ticket_id, updated_at)
+        not_modified = not_modified_response(request, etag=etag, last_modified=updated_at)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().retrieve(request, *args, **kwargs)
+        return set_validators(response, etag=etag, last_modified=updated_at)
+
 
-class CustomerTicketCommentCreateView(APIView):
+class CustomerTicketCommentListCreateView(APIView):
     """
+    GET  /customer/tickets/{id}/comments  (keyset-paginated: ?cursor=...&limit=...)
     POST /customer/tickets/{id}/comments
     """
 
+    def get(self, request, ticket_id: int):
+        actor = get_actor_from_request(request)
+        require_role(actor, "customer")
+
+        # Ownership check without loading the ticket.
+        comments = ticket_comments_or_404(ticket_id=int(ticket_id), customer_email=actor.user)
+        paginator = CommentKeysetPagination()
+        page = paginator.paginate_queryset(comments, request, view=self)
+        return paginator.get_paginated_response(CommentSerializer(page, many=True).data)
+
     def post(self, request, ticket_id: int):
         actor = get_actor_from_request(request)
         require_role(actor, "customer")
@@ -109,5 +143,28 @@ class CustomerTicketCloseView(APIView):
                 {"detail": result.reason},
                 status=status.HTTP_409_CONFLICT,
             )
-        return Response(TicketDetailSerializer(ticket).data, status=status.HTTP_200_OK)
+        data = TicketDetailSerializer(ticket, context={"request": request, "role": actor.role}).data
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class CustomerTicketAttachmentDownloadView(APIView):
+    """
+    GET /customer/tickets/{id}/attachments/{attachment_id}
+
+    Supports Range / If-Range and conditional GET; see tickets.api.downloads.
+    """
 
+    def perform_content_negotiation(self, request, force=False):
+        # The file is the response; a download client's Accept header must not turn it into a 406.
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request, ticket_id: int, attachment_id: int):
+        actor = get_actor_from_request(request)
+        require_role(actor, "customer")
+
+        attachment = get_attachment_for_download_or_404(
+            ticket_id=int(ticket_id),
+            attachment_id=int(attachment_id),
+            customer_email=actor.user,
+        )
+        return attachment_response(request, attachment)
@@ -0,0 +1,138 @@
+"""
+Attachment download responses.
+
+Full downloads go through `FileResponse`, which WSGI servers with a
+`wsgi.file_wrapper` (gunicorn, uWSGI) send with zero-copy `sendfile`.
+Single-range requests (`Range: bytes=...`, honouring `If-Range`) are answered
+with 206 and only the requested slice. With `TICKET_ATTACHMENT_SENDFILE` set,
+the app only authorizes and a front proxy (nginx `X-Accel-Redirect`, Apache /
+lighttpd `X-Sendfile`) reads and ranges the file itself.
+"""
+
+from __future__ import annotations
+
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.http import content_disposition_header, parse_http_date_safe, quote_etag
+from rest_framework.exceptions import NotFound
+
+from tickets.api.conditional import not_modified_response, set_validators
+from tickets.models import TicketAttachment
+
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class UnsatisfiableRange(Exception):
+    pass
+
+
+def attachment_etag(attachment: TicketAttachment) -> str:
+    # Attachment bytes never change, so the content digest (or the row id for legacy files) is a strong validator.
+    return quote_etag(attachment.blob.sha256 if attachment.blob_id else f"att{attachment.id}")
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single `bytes=` range into inclusive (start, end).
+
+    Returns None for anything we do not serve partially (missing, malformed or
+    multi-range headers), which means "send the whole file".
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start >= size or (last and int(last) < start):
+            raise UnsatisfiableRange
+    else:
+        suffix = int(last)
+        if suffix == 0:
+            raise UnsatisfiableRange
+        start, end = max(0, size - suffix), size - 1
+    return start, end
+
+
+def if_range_matches(request, *, etag: str, last_modified) -> bool:
+    value = request.headers.get("If-Range")
+    if not value:
+        return True
+    if value.startswith(('"', "W/")):
+        return value == etag  # strong comparison only
+    return parse_http_date_safe(value) == int(last_modified.timestamp())
+
+
+def _iter_slice(fh, start: int, length: int, block_size: int):
+    try:
+        fh.seek(start)
+        while length > 0:
+            data = fh.read(min(block_size, length))
+            if not data:
+                break
+            length -= len(data)
+            yield data
+    finally:
+        fh.close()
+
+
+def _offload_response(attachment: TicketAttachment, filename: str, content_type: str) -> HttpResponse:
+    response = HttpResponse(content_type=content_type)
+    if settings.TICKET_ATTACHMENT_SENDFILE == "x-accel-redirect":
+        response["X-Accel-Redirect"] = settings.TICKET_ATTACHMENT_ACCEL_PREFIX + quote(attachment.file.name)
+    else:
+        response["X-Sendfile"] = attachment.file.path
+    response["Content-Disposition"] = content_disposition_header(True, filename)
+    return response
+
+
+def attachment_response(request, attachment: TicketAttachment):
+    etag = attachment_etag(attachment)
+    last_modified = attachment.created_at
+    not_modified = not_modified_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    filename = attachment.original_name or os.path.basename(attachment.file.name)
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    if settings.TICKET_ATTACHMENT_SENDFILE:
+        response = _offload_response(attachment, filename, content_type)
+        return set_validators(response, etag=etag, last_modified=last_modified)
+
+    try:
+        fh = attachment.file.open("rb")
+    except FileNotFoundError as exc:
+        raise NotFound("Attachment file is missing") from exc
+    size = attachment.file.size
+
+    byte_range = None
+    if "Range" in request.headers and if_range_matches(request, etag=etag, last_modified=last_modified):
+        try:
+            byte_range = parse_range(request.headers["Range"], size)
+        except UnsatisfiableRange:
+            fh.close()
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    if byte_range is None:
+        response = FileResponse(fh, as_attachment=True, filename=filename, content_type=content_type)
+    else:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            _iter_slice(fh, start, end - start + 1, FileResponse.block_size),
+            status=206,
+            content_type=content_type,
+        )
+        response["Content-Length"] = str(end - start + 1)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Disposition"] = content_disposition_header(True, filename)
+    response["Accept-Ranges"] = "bytes"
+    return set_validators(response, etag=etag, last_modified=last_modified)
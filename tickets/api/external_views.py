@@ -1,37 +1,87 @@
 from django.conf import settings
+from django.urls import reverse
 from rest_framework import status
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from tickets.api.serializers import ExternalTicketIngestSerializer
-from tickets.domain.services import add_attachments, create_external_ticket
+from tickets.api.serializers import ExternalTicketIngestSerializer, IngestJobSerializer
+from tickets.domain.ingest import enqueue_external_ticket, get_ingest_job_or_404
+from tickets.domain.services import (
+    add_attachments,
+    bulk_create_external_tickets,
+    create_external_ticket,
+    get_idempotent_ticket,
+)
+
+
+def require_external_api_key(request) -> None:
+    api_key = (request.headers.get("X-API-KEY") or "").strip()
+    if not api_key or api_key != getattr(settings, "EXTERNAL_TICKET_API_KEY", ""):
+        raise PermissionDenied("Invalid or missing X-API-KEY")
 
 
 class ExternalTicketIngestView(APIView):
     """
     POST /external/tickets
     Header: X-API-KEY: <secret>
+    Optional header: Idempotency-Key: <client key>
+
+    Idempotent on external_ref: 201 when the ticket is created, 200 with the
+    existing ticket when the ref (or Idempotency-Key) was already ingested.
+
+    Async mode (`Prefer: respond-async` header or `?mode=async`): the payload is
+    validated and queued, and the response is 202 with a job id to poll at
+    GET /external/jobs/{job_id}. Attachments are not accepted in this mode.
     """
 
     authentication_classes = []
     permission_classes = []
 
+    def wants_async(self, request) -> bool:
+        prefer = request.headers.get("Prefer", "").lower()
+        return "respond-async" in prefer or request.query_params.get("mode") == "async"
+
     def post(self, request):
-        api_key = (request.headers.get("X-API-KEY") or "").strip()
-        if not api_key or api_key != getattr(settings, "EXTERNAL_TICKET_API_KEY", ""):
-            raise PermissionDenied("Invalid or missing X-API-KEY")
+        require_external_api_key(request)
+
+        idempotency_key = (request.headers.get("Idempotency-Key") or "").strip() or None
+        if idempotency_key and len(idempotency_key) > 255:
+            raise ValidationError({"Idempotency-Key": "Must be at most 255 characters"})
 
         serializer = ExternalTicketIngestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        ticket = create_external_ticket(data=serializer.validated_data)
+        if self.wants_async(request):
+            return self.enqueue(request, serializer.validated_data, idempotency_key)
+
+        ticket, created = create_external_ticket(data=serializer.validated_data, idempotency_key=idempotency_key)
 
-        # Optional file uploads (multiple) via multipart/form-data, field name: "attachments"
+        # Optional file uploads (multiple) via multipart/form-data, field name: "attachments".
+        # Retries of an already-ingested ticket must not attach the same files again.
         files = request.FILES.getlist("attachments")
-        if files:
+        if files and created:
             add_attachments(ticket=ticket, files=files)
 
+        return self.ticket_response(request, ticket, created=created)
+
+    def enqueue(self, request, data, idempotency_key):
+        if request.FILES:
+            raise ValidationError({"attachments": "Not supported in async mode; use /uploads once the job is done"})
+        if idempotency_key:
+            replayed = get_idempotent_ticket(idempotency_key)
+            if replayed is not None:
+                return self.ticket_response(request, replayed, created=False)
+
+        job, _ = enqueue_external_ticket(data=data, idempotency_key=idempotency_key)
+        location = reverse("external-ingest-job-detail", kwargs={"job_id": job.id})
+        return Response(
+            IngestJobSerializer(job).data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Location": request.build_absolute_uri(location), "Preference-Applied": "respond-async"},
+        )
+
+    def ticket_response(self, request, ticket, *, created: bool):
         # Build absolute URLs for attachments in response
         attachments = []
         for attachment in ticket.attachments.all():
@@ -47,6 +97,73 @@ class ExternalTicketIngestView(APIView):
                 "status": ticket.status,
                 "attachments": attachments,
             },
-            status=status.HTTP_201_CREATED,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
+class ExternalIngestJobDetailView(APIView):
+    """
+    GET /external/jobs/{job_id}
+    Header: X-API-KEY: <secret>
+
+    Status of an async ingest job: queued, processing, succeeded (with ticket_id
+    and whether it was created or a duplicate) or failed (with error).
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    def get(self, request, job_id):
+        require_external_api_key(request)
+        return Response(IngestJobSerializer(get_ingest_job_or_404(job_id=job_id)).data)
+
+
+class ExternalTicketBatchIngestView(APIView):
+    """
+    POST /external/tickets/batch
+    Header: X-API-KEY: <secret>
+
+    Body: JSON array of ticket payloads (same shape as POST /external/tickets).
+    Every item is validated independently; valid ones are bulk-inserted in chunks.
+    Returns one result per item: created, duplicate (external_ref already known)
+    or error (with validation details), so one bad row does not fail the batch.
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    def post(self, request):
+        require_external_api_key(request)
+
+        items = request.data
+        if not isinstance(items, list):
+            raise ValidationError({"detail": "Expected a JSON array of tickets"})
+        max_items = getattr(settings, "EXTERNAL_BATCH_MAX_ITEMS", 1000)
+        if len(items) > max_items:
+            raise ValidationError({"detail": f"Batch too large (max {max_items} items)"})
+
+        results: list[dict | None] = [None] * len(items)
+        valid: list[tuple[int, dict]] = []
+        for index, item in enumerate(items):
+            serializer = ExternalTicketIngestSerializer(data=item)
+            if serializer.is_valid():
+                valid.append((index, serializer.validated_data))
+            else:
+                results[index] = {"index": index, "status": "error", "errors": serializer.errors}
+
+        ingested = bulk_create_external_tickets(
+            items=[data for _, data in valid],
+            chunk_size=getattr(settings, "EXTERNAL_BATCH_CHUNK_SIZE", 500),
         )
+        for (index, data), result in zip(valid, ingested):
+            results[index] = {
+                "index": index,
+                "status": "created" if result.created else "duplicate",
+                "ticket_id": result.ticket_id,
+                "external_ref": data["external_ref"],
+            }
 
+        summary = {state: 0 for state in ("created", "duplicate", "error")}
+        for result in results:
+            summary[result["status"]] += 1
+        return Response({**summary, "results": results}, status=status.HTTP_200_OK)
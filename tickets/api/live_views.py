@@ -0,0 +1,133 @@
+"""
+Server-Sent Events streams of ticket changes.
+
+One long-lived async response per client, fed by `tickets.domain.live`. Each
+SSE message is an outbox event: `id` is the event id, `event` its type and
+`data` the same JSON the outbox sinks receive. A reconnecting client (browsers
+send `Last-Event-ID` automatically) first gets the events it missed, replayed
+from the outbox, then the live ones. Comment lines are sent as heartbeats
+every `TICKET_LIVE_HEARTBEAT` seconds so proxies keep idle connections open.
+
+These views need an ASGI server: under WSGI an endless async stream would pin
+a worker, so they answer 501 there.
+"""
+
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+
+from tickets.api.async_views import AsyncTicketAPIView
+from tickets.domain import live
+from tickets.domain.outbox import replay_events
+from tickets.domain.selectors import aget_ticket_version_or_404, customer_ticket_qs
+from tickets.models import Ticket
+
+
+RETRY_MS = 3000
+
+
+def sse_message(message: dict) -> str:
+    data = json.dumps(message, cls=DjangoJSONEncoder)
+    return f"id: {message['id']}\nevent: {message['type']}\ndata: {data}\n\n"
+
+
+def last_event_id(request) -> int:
+    # EventSource sends the header on reconnect; the query param lets a fresh page resume too.
+    value = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id") or ""
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        return 0
+
+
+async def event_stream(matches, *, after: int, tickets):
+    # Subscribe before replaying, so nothing committed in between is lost.
+    subscription = live.subscribe(matches)
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        replayed_up_to = 0
+        if after:
+            limit = settings.TICKET_LIVE_REPLAY_LIMIT
+            missed = await sync_to_async(replay_events)(after=after, tickets=tickets, limit=limit + 1)
+            if len(missed) > limit:
+                # Too far behind to replay; the client should reload its state over REST.
+                yield "event: reset\ndata: {}\n\n"
+            else:
+                for message in missed:
+                    yield sse_message(message)
+                if missed:
+                    replayed_up_to = missed[-1]["id"]
+
+        while not subscription.overflowed:
+            message = await subscription.get(timeout=settings.TICKET_LIVE_HEARTBEAT)
+            if message is None:
+                yield ": heartbeat\n\n"
+            elif message["id"] > replayed_up_to:
+                yield sse_message(message)
+    finally:
+        live.unsubscribe(subscription)
+
+
+class TicketEventStreamView(AsyncTicketAPIView):
+    """Subclasses return (matches(message), tickets queryset for replay) from `get_scope`."""
+
+    long_lived = True
+
+    async def get_scope(self, **kwargs):
+        raise NotImplementedError
+
+    async def get(self, request, **kwargs):
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse({"detail": "Event streams require an ASGI server"}, status=501)
+
+        matches, tickets = await self.get_scope(**kwargs)
+        response = StreamingHttpResponse(
+            event_stream(matches, after=last_event_id(request), tickets=tickets),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+class CustomerTicketsEventStreamView(TicketEventStreamView):
+    """
+    GET /customer/tickets/events
+    """
+
+    required_role = "customer"
+
+    async def get_scope(self):
+        customer = self.actor.user
+        return (
+            lambda message: message["data"]["ticket"]["customer_id"] == customer,
+            customer_ticket_qs(customer_email=customer),
+        )
+
+
+class CustomerTicketEventStreamView(TicketEventStreamView):
+    """
+    GET /customer/tickets/{id}/events
+    """
+
+    required_role = "customer"
+
+    async def get_scope(self, ticket_id: int):
+        await aget_ticket_version_or_404(ticket_id=ticket_id, customer_email=self.actor.user)
+        return lambda message: message["ticket_id"] == ticket_id, Ticket.objects.filter(id=ticket_id)
+
+
+class AdminTicketEventStreamView(TicketEventStreamView):
+    """
+    GET /admin/tickets/{id}/events
+    """
+
+    required_role = "admin"
+
+    async def get_scope(self, ticket_id: int):
+        await aget_ticket_version_or_404(ticket_id=ticket_id)
+        return lambda message: message["ticket_id"] == ticket_id, Ticket.objects.filter(id=ticket_id)
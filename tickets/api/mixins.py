@@ -0,0 +1,47 @@
+from django.db.models import Count, Max
+from rest_framework.response import Response
+
+from tickets.api.conditional import list_etag, not_modified_response, set_validators
+from tickets.api.serializers import parse_ticket_fields, serialize_ticket_rows
+
+
+class SparseTicketListMixin:
+    """
+    `list()` shared by the ticket list views.
+
+    `?fields=id,title,...` restricts both the SQL projection and the output, and
+    rows are read with `values()` and serialized by `serialize_ticket_rows`
+    instead of going through TicketListSerializer per row. Page-number responses
+    carry a weak ETag and answer If-None-Match with 304.
+
+    Expects OptionalCursorPaginationMixin on the same view.
+    """
+
+    # Columns pagination needs even when the client did not ask for them.
+    paging_fields = ("id", "created_at")
+
+    def list(self, request, *args, **kwargs):
+        fields = parse_ticket_fields(request.query_params.get("fields"))
+        queryset = self.filter_queryset(self.get_queryset())
+
+        etag = last_modified = None
+        if not self.wants_cursor_pagination():
+            # Weak ETag over the filtered set: an insert, update or delete (or a
+            # ticket leaving the filter) changes max(updated_at) or the row count.
+            # Both come from one aggregate that replaces the paginator's COUNT(*);
+            # cursor mode skips it so it stays count-free.
+            version = queryset.order_by().aggregate(last=Max("updated_at"), n=Count("id"))
+            self.count_hint = version["n"]
+            last_modified = version["last"]
+            etag = list_etag(last_modified, version["n"], request.META.get("QUERY_STRING", ""))
+            not_modified = not_modified_response(request, etag=etag, last_modified=last_modified)
+            if not_modified is not None:
+                return not_modified
+
+        queryset = queryset.values(*dict.fromkeys(fields + self.paging_fields))
+        page = self.paginate_queryset(queryset)
+        data = serialize_ticket_rows(page if page is not None else queryset, fields)
+        response = self.get_paginated_response(data) if page is not None else Response(data)
+        if etag is not None:
+            set_validators(response, etag=etag, last_modified=last_modified)
+        return response
@@ -0,0 +1,127 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from django.conf import settings
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class TicketCursorPagination(CursorPagination):
+    """
+    Keyset pagination over (-created_at, -id).
+
+    Rides the `created_at` index instead of COUNT(*) + OFFSET, returns opaque
+    next/previous cursors and stays stable while new tickets are inserted.
+    """
+
+    ordering = ("-created_at", "-id")
+
+
+class TicketPageNumberPagination(PageNumberPagination):
+    """
+    Default page-number pagination that can reuse a row count the view already has.
+
+    List views that compute COUNT(*) for their ETag set `view.count_hint`, so the
+    paginator does not issue the same COUNT a second time.
+    """
+
+    count_hint = None
+
+    def django_paginator_class(self, object_list, per_page):
+        paginator = DjangoPaginator(object_list, per_page)
+        if self.count_hint is not None:
+            paginator.count = self.count_hint
+        return paginator
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_hint = getattr(view, "count_hint", None)
+        return super().paginate_queryset(queryset, request, view)
+
+
+class OptionalCursorPaginationMixin:
+    """
+    Opt-in cursor mode for list views.
+
+    Page-number pagination stays the default; clients switch with
+    `?pagination=cursor` (cursor links returned by the API keep working as-is).
+    """
+
+    cursor_pagination_class = TicketCursorPagination
+    page_number_pagination_class = TicketPageNumberPagination
+
+    def wants_cursor_pagination(self) -> bool:
+        params = self.request.query_params
+        if params.get("pagination", "").strip().lower() == "cursor":
+            return True
+        return self.cursor_pagination_class.cursor_query_param in params
+
+    @property
+    def pagination_class(self):
+        if self.wants_cursor_pagination():
+            return self.cursor_pagination_class
+        return self.page_number_pagination_class
+
+
+def encode_keyset_cursor(at: datetime, pk: int) -> str:
+    """Opaque cursor for a (timestamp, id) keyset position."""
+    return urlsafe_b64encode(f"{at.isoformat()}|{pk}".encode()).decode()
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        at, pk = urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(at), int(pk)
+    except (TypeError, ValueError) as exc:
+        raise NotFound("Invalid cursor") from exc
+
+
+class CommentKeysetPagination(BasePagination):
+    """
+    Forward-only keyset pagination over a ticket's comments, oldest first.
+
+    The cursor encodes the (created_at, id) of the last comment returned, so each
+    page is a range scan on the `(ticket, created_at)` index, with no OFFSET.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "limit"
+    max_page_size = 200
+
+    @property
+    def page_size(self) -> int:
+        return getattr(settings, "TICKET_COMMENT_PAGE_SIZE", 50)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        limit = self.page_size
+        try:
+            requested = int(request.query_params.get(self.page_size_query_param, ""))
+        except ValueError:
+            requested = 0
+        if requested > 0:
+            limit = min(requested, self.max_page_size)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            created_at, comment_id = decode_keyset_cursor(cursor)
+            queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=comment_id))
+
+        rows = list(queryset.order_by("created_at", "id")[: limit + 1])
+        self.page = rows[:limit]
+        self.next_cursor = None
+        if len(rows) > limit:
+            last = self.page[-1]
+            self.next_cursor = encode_keyset_cursor(last.created_at, last.id)
+        return self.page
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(self.base_url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
@@ -1,6 +1,13 @@
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.urls import reverse
+from django.utils import timezone
 from rest_framework import serializers
 
-from tickets.models import Category, Comment, Ticket, TicketAttachment
+from tickets.api.pagination import encode_keyset_cursor
+from tickets.domain.categories import category_index
+from tickets.models import Category, Comment, IngestJob, Ticket, TicketAttachment, UploadSession
 
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -34,17 +41,76 @@ class TicketListSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+TICKET_LIST_FIELDS = TicketListSerializer.Meta.fields
+_DATETIME_FIELDS = frozenset({"created_at", "updated_at"})
+
+
+def parse_ticket_fields(value: str | None) -> tuple[str, ...]:
+    """Parse a `?fields=id,title,...` sparse fieldset; empty means every list field."""
+    if not value:
+        return TICKET_LIST_FIELDS
+    requested = tuple(dict.fromkeys(f.strip() for f in value.split(",") if f.strip()))
+    unknown = set(requested) - set(TICKET_LIST_FIELDS)
+    if unknown:
+        raise serializers.ValidationError({"fields": f"Unknown fields: {', '.join(sorted(unknown))}"})
+    return requested or TICKET_LIST_FIELDS
+
+
+def _format_datetime(value, tz):
+    # Same output as DRF's DateTimeField.to_representation.
+    if value is None:
+        return None
+    value = value.astimezone(tz).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def serialize_ticket_rows(rows: Iterable[dict], fields: tuple[str, ...] = TICKET_LIST_FIELDS) -> list[dict]:
+    """
+    Fast path equivalent of `TicketListSerializer(many=True).data` for `values()` rows.
+
+    Skips the per-row ModelSerializer field machinery; list views feed it rows
+    from `qs.values(...)` so only the requested columns are selected.
+    """
+    tz = timezone.get_current_timezone()
+    datetime_fields = [f for f in fields if f in _DATETIME_FIELDS]
+    out = []
+    for row in rows:
+        item = {f: row[f] for f in fields}
+        for f in datetime_fields:
+            item[f] = _format_datetime(item[f], tz)
+        out.append(item)
+    return out
+
+
+class CategoryField(serializers.CharField):
+    """A `Category` name, matched case/whitespace-insensitively and returned as stored."""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("max_length", 50)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        category = category_index.resolve(value)
+        if category is None:
+            known = ", ".join(sorted(category_index.names().values()))
+            raise serializers.ValidationError(f"Unknown category. Use one of: {known}")
+        return category
+
+
 class TicketCreateSerializer(serializers.Serializer):
     title = serializers.CharField(max_length=200, allow_blank=False, trim_whitespace=True)
     description = serializers.CharField(required=False, allow_blank=True)
     priority = serializers.ChoiceField(choices=Ticket.Priority.choices, required=False)
-    category = serializers.CharField(required=False, max_length=50)
+    category = CategoryField(required=False)
 
 
 class TicketAdminUpdateSerializer(serializers.Serializer):
     status = serializers.ChoiceField(choices=Ticket.Status.choices, required=False)
     priority = serializers.ChoiceField(choices=Ticket.Priority.choices, required=False)
-    category = serializers.CharField(required=False, max_length=50)
+    category = CategoryField(required=False)
     assigned_to = serializers.EmailField(required=False, allow_null=True)
     title = serializers.CharField(required=False, max_length=200, allow_blank=False, trim_whitespace=True)
     description = serializers.CharField(required=False, allow_blank=True)
@@ -55,11 +121,31 @@ class ExternalTicketIngestSerializer(serializers.Serializer):
     title = serializers.CharField(max_length=200, allow_blank=False, trim_whitespace=True)
     description = serializers.CharField(required=False, allow_blank=True)
     priority = serializers.ChoiceField(choices=Ticket.Priority.choices, required=False)
-    category = serializers.CharField(required=False, max_length=50)
+    category = CategoryField(required=False)
     customer_id = serializers.EmailField(required=False, allow_null=True)
 
 
+class IngestJobSerializer(serializers.ModelSerializer):
+    job_id = serializers.UUIDField(source="id", read_only=True)
+
+    class Meta:
+        model = IngestJob
+        fields = ("job_id", "status", "ticket_id", "created", "error", "created_at", "finished_at")
+        read_only_fields = fields
+
+
+ATTACHMENT_DOWNLOAD_ROUTES = {
+    "customer": "customer-ticket-attachment-download",
+    "admin": "admin-ticket-attachment-download",
+}
+
+
 class TicketAttachmentSerializer(serializers.ModelSerializer):
+    """
+    `url` is the authorized download route for the caller's role (`context["role"]`),
+    never the storage path. It is None for callers without one (the external integration).
+    """
+
     url = serializers.SerializerMethodField()
 
     class Meta:
@@ -67,23 +153,96 @@ class TicketAttachmentSerializer(serializers.ModelSerializer):
         fields = ("id", "url", "created_at")
         read_only_fields = fields
 
-    def get_url(self, obj) -> str:
+    def get_url(self, obj) -> str | None:
+        route = ATTACHMENT_DOWNLOAD_ROUTES.get(self.context.get("role"))
+        if route is None:
+            return None
+        url = reverse(route, kwargs={"ticket_id": obj.ticket_id, "attachment_id": obj.id})
         request = self.context.get("request")
-        url = obj.file.url
         if request is not None:
             return request.build_absolute_uri(url)
         return url
 
 
+class UploadSessionCreateSerializer(serializers.Serializer):
+    ticket_id = serializers.IntegerField(min_value=1)
+    filename = serializers.CharField(max_length=255, trim_whitespace=True)
+    size = serializers.IntegerField(min_value=1)
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadSession
+        fields = (
+            "id",
+            "ticket_id",
+            "filename",
+            "size",
+            "received",
+            "next_chunk",
+            "chunk_size",
+            "expires_at",
+            "completed_at",
+        )
+        read_only_fields = fields
+
+    def get_chunk_size(self, obj) -> int:
+        return settings.TICKET_UPLOAD_CHUNK_SIZE
+
+
 class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ("id", "name")
         read_only_fields = fields
 
+
 class TicketDetailSerializer(TicketListSerializer):
-    comments = CommentSerializer(many=True, read_only=True)
+    """
+    Ticket with its attachments and the first page of comments.
+
+    At most `TICKET_DETAIL_COMMENT_LIMIT` comments are embedded; when there are
+    more, `comments_next_cursor` continues from there on
+    GET .../tickets/{id}/comments?cursor=<value>.
+    """
+
+    comments = serializers.SerializerMethodField()
+    comments_has_more = serializers.SerializerMethodField()
+    comments_next_cursor = serializers.SerializerMethodField()
     attachments = TicketAttachmentSerializer(many=True, read_only=True)
 
     class Meta(TicketListSerializer.Meta):
-        fields = TicketListSerializer.Meta.fields + ("comments", "attachments")
+        fields = TicketListSerializer.Meta.fields + (
+            "comments",
+            "comments_has_more",
+            "comments_next_cursor",
+            "attachments",
+        )
+
+    def _comment_window(self, obj) -> tuple[list, bool]:
+        cache = getattr(self, "_comment_windows", None)
+        if cache is None:
+            cache = self._comment_windows = {}
+        if obj.pk not in cache:
+            limit = getattr(settings, "TICKET_DETAIL_COMMENT_LIMIT", 50)
+            # Prefetched by ticket_detail_qs; freshly created tickets fall back to a query.
+            rows = getattr(obj, "first_comments", None)
+            if rows is None:
+                rows = list(obj.comments.order_by("created_at", "id")[: limit + 1])
+            cache[obj.pk] = (rows[:limit], len(rows) > limit)
+        return cache[obj.pk]
+
+    def get_comments(self, obj) -> list[dict]:
+        comments, _ = self._comment_window(obj)
+        return CommentSerializer(comments, many=True).data
+
+    def get_comments_has_more(self, obj) -> bool:
+        return self._comment_window(obj)[1]
+
+    def get_comments_next_cursor(self, obj) -> str | None:
+        comments, has_more = self._comment_window(obj)
+        if not has_more:
+            return None
+        return encode_keyset_cursor(comments[-1].created_at, comments[-1].id)
@@ -0,0 +1,129 @@
+from io import BytesIO
+
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from tickets.api.external_views import require_external_api_key
+from tickets.api.serializers import TicketAttachmentSerializer, UploadSessionCreateSerializer, UploadSessionSerializer
+from tickets.domain.actor import get_actor_from_request
+from tickets.domain.selectors import get_ticket_for_upload_or_404
+from tickets.domain.uploads import (
+    finalize_upload_session,
+    get_upload_session_or_404,
+    start_upload_session,
+    write_upload_chunk,
+)
+from tickets.models import Ticket
+
+
+def get_uploader(request) -> str:
+    """
+    Identity that owns an upload session.
+
+    The external integration authenticates with X-API-KEY; customers and admins
+    with the usual role headers.
+    """
+    if "X-API-KEY" in request.headers:
+        require_external_api_key(request)
+        return "external"
+    actor = get_actor_from_request(request)
+    return f"{actor.role}:{actor.user}"
+
+
+def get_upload_ticket(uploader: str, ticket_id: int) -> Ticket:
+    if uploader == "external":
+        return get_ticket_for_upload_or_404(ticket_id=ticket_id, source=Ticket.Source.EXTERNAL)
+    role, user = uploader.split(":", 1)
+    if role == "customer":
+        return get_ticket_for_upload_or_404(ticket_id=ticket_id, customer_email=user)
+    return get_ticket_for_upload_or_404(ticket_id=ticket_id)
+
+
+class UploadSessionCreateView(APIView):
+    """
+    POST /uploads  {"ticket_id", "filename", "size"}
+
+    Starts a resumable upload. Then PUT the raw bytes of chunk 0, 1, ... (each at
+    most `chunk_size` bytes) and POST .../finalize to attach the file.
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    def post(self, request):
+        uploader = get_uploader(request)
+        serializer = UploadSessionCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        ticket = get_upload_ticket(uploader, data["ticket_id"])
+        session = start_upload_session(
+            ticket=ticket,
+            uploaded_by=uploader,
+            filename=data["filename"],
+            size=data["size"],
+        )
+        return Response(UploadSessionSerializer(session).data, status=status.HTTP_201_CREATED)
+
+
+class UploadSessionDetailView(APIView):
+    """
+    GET /uploads/{id}
+
+    Progress of an upload; resume by sending chunk `next_chunk`.
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    def get(self, request, session_id):
+        session = get_upload_session_or_404(session_id=session_id, uploaded_by=get_uploader(request))
+        return Response(UploadSessionSerializer(session).data)
+
+
+class UploadChunkView(APIView):
+    """
+    PUT /uploads/{id}/chunks/{n}
+    Body: raw chunk bytes (any Content-Type; the body is streamed, never parsed).
+
+    Re-sending a chunk that was already stored is a no-op; skipping ahead is a 409.
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    def put(self, request, session_id, index: int):
+        session = get_upload_session_or_404(session_id=session_id, uploaded_by=get_uploader(request))
+        length = request.META.get("CONTENT_LENGTH") or ""
+        # `request.stream` is the unread body (None when empty); request.data is never touched.
+        result = write_upload_chunk(
+            session=session,
+            index=index,
+            stream=request.stream or BytesIO(),
+            length=int(length) if length.isdigit() else None,
+        )
+        data = UploadSessionSerializer(result.session).data
+        if not result.accepted:
+            return Response({"detail": result.reason, **data}, status=status.HTTP_409_CONFLICT)
+        return Response(data)
+
+
+class UploadFinalizeView(APIView):
+    """
+    POST /uploads/{id}/finalize
+
+    Attaches the completed file to the ticket (safe to repeat).
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    def post(self, request, session_id):
+        uploader = get_uploader(request)
+        session = get_upload_session_or_404(session_id=session_id, uploaded_by=uploader)
+        result = finalize_upload_session(session=session)
+        if result.attachment is None:
+            return Response({"detail": result.reason}, status=status.HTTP_409_CONFLICT)
+        role = uploader.split(":", 1)[0]  # "external" has no download route
+        return Response(TicketAttachmentSerializer(result.attachment, context={"request": request, "role": role}).data)
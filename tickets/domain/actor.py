@@ -25,8 +25,10 @@ def get_actor_from_request(request) -> Actor:
       - role=customer|admin
       - user=email
     """
-    role = (request.headers.get("X-ROLE") or request.query_params.get("role") or "").strip().lower()
-    user = (request.headers.get("X-USER") or request.query_params.get("user") or "").strip()
+    # DRF requests expose `query_params`; plain (async) Django requests only `GET`.
+    params = getattr(request, "query_params", request.GET)
+    role = (request.headers.get("X-ROLE") or params.get("role") or "").strip().lower()
+    user = (request.headers.get("X-USER") or params.get("user") or "").strip()
 
     if role not in {"customer", "admin"}:
         raise ValidationError({"role": "Missing/invalid role. Use X-ROLE: customer|admin (or ?role=...)"})
@@ -0,0 +1,192 @@
+"""
+Hot/cold archival of closed tickets.
+
+`archive_closed_tickets` moves tickets that were closed and untouched for
+TICKET_ARCHIVE_AFTER_DAYS, together with their comments and attachment rows,
+from the hot tables into `ArchivedTicket` / `ArchivedComment` /
+`ArchivedAttachment`. Rows keep their ids. Each batch of
+TICKET_ARCHIVE_BATCH_SIZE tickets is one short transaction, and the job pauses
+between batches, so ingest and admin writes are never locked out for long.
+
+Reads fall back to the archive (see the selectors). `get_*_ticket_or_404`
+return an `ArchivedTicket` when the id is no longer hot, and the customer list
+reads `TicketRecord`, a `UNION ALL` view over both tables. A write to an
+archived ticket (an admin reopening it, a new comment) first moves it back
+with `restore_ticket`.
+
+What stays as it was:
+
+- Stats buckets keep counting archived tickets.
+- Blob references move with the attachments. `ref_count` counts both tables.
+- Admin lists, search, export and change feeds only cover the hot table.
+- Async ingest jobs keep their `ticket_id` (a plain column), so
+  `GET /external/jobs/{id}` still reports the ticket.
+- Idempotency-Key rows of archived tickets are dropped. Re-sent external refs are
+  still recognized through the view.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from tickets.domain.writer import serialized_write
+from tickets.models import (
+    ArchivedAttachment,
+    ArchivedComment,
+    ArchivedTicket,
+    AttachmentBlob,
+    Comment,
+    Ticket,
+    TicketAttachment,
+    TicketRecord,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveResult:
+    tickets: int
+    comments: int
+    attachments: int
+    batches: int
+
+
+def _moved(obj, model):
+    """An unsaved `model` row carrying every column of `obj` that `model` also has (ids included)."""
+    return model(**{f.attname: getattr(obj, f.attname) for f in model._meta.concrete_fields if hasattr(obj, f.attname)})
+
+
+def archive_cutoff(*, days: int | None = None, now=None):
+    days = settings.TICKET_ARCHIVE_AFTER_DAYS if days is None else days
+    return (now or timezone.now()) - timedelta(days=days)
+
+
+def archivable_tickets(cutoff):
+    return Ticket.objects.filter(status=Ticket.Status.CLOSED, updated_at__lt=cutoff)
+
+
+@serialized_write
+@transaction.atomic
+def archive_tickets(*, ticket_ids: list[int], cutoff) -> Counter[str]:
+    """
+    Move one batch to the archive tables; returns the rows moved per kind.
+
+    The close/age condition is re-checked inside the transaction, so a ticket
+    reopened after it was picked stays hot.
+    """
+    tickets = list(archivable_tickets(cutoff).filter(id__in=ticket_ids))
+    if not tickets:
+        return Counter()
+    ids = [ticket.id for ticket in tickets]
+    comments = list(Comment.objects.filter(ticket_id__in=ids))
+    attachments = list(TicketAttachment.objects.filter(ticket_id__in=ids))
+
+    ArchivedTicket.objects.bulk_create([_moved(ticket, ArchivedTicket) for ticket in tickets])
+    ArchivedComment.objects.bulk_create([_moved(comment, ArchivedComment) for comment in comments])
+    ArchivedAttachment.objects.bulk_create([_moved(attachment, ArchivedAttachment) for attachment in attachments])
+
+    # Cascades to comments, attachments, upload sessions and idempotency keys. The signals
+    # release each attachment's blob reference and bump the response cache generations.
+    Ticket.objects.filter(id__in=ids).delete()
+    for blob_id, n in Counter(a.blob_id for a in attachments if a.blob_id).items():
+        # ...and the archived copy takes the reference over.
+        AttachmentBlob.objects.filter(pk=blob_id).update(ref_count=F("ref_count") + n)
+
+    return Counter(tickets=len(tickets), comments=len(comments), attachments=len(attachments))
+
+
+def archive_closed_tickets(
+    *,
+    days: int | None = None,
+    batch_size: int | None = None,
+    pause: float | None = None,
+    max_batches: int | None = None,
+    now=None,
+) -> ArchiveResult:
+    """
+    Archive closed tickets last updated more than `days` ago, in throttled batches.
+
+    Stops when nothing is left or after `max_batches` batches (0 = no limit), so
+    a scheduled run stays bounded. The next run continues where it left off.
+    """
+    batch_size = batch_size or settings.TICKET_ARCHIVE_BATCH_SIZE
+    pause = settings.TICKET_ARCHIVE_PAUSE if pause is None else pause
+    max_batches = settings.TICKET_ARCHIVE_MAX_BATCHES if max_batches is None else max_batches
+    cutoff = archive_cutoff(days=days, now=now)
+
+    moved: Counter[str] = Counter()
+    batches = 0
+    while not max_batches or batches < max_batches:
+        ids = list(archivable_tickets(cutoff).order_by("id").values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+        moved += archive_tickets(ticket_ids=ids, cutoff=cutoff)
+        batches += 1
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return ArchiveResult(
+        tickets=moved["tickets"],
+        comments=moved["comments"],
+        attachments=moved["attachments"],
+        batches=batches,
+    )
+
+
+@transaction.atomic
+def restore_ticket(ticket: ArchivedTicket) -> Ticket:
+    """
+    Move an archived ticket with its comments and attachments back to the hot tables.
+
+    Ids and timestamps are kept. The rows are saved with `raw=True`, so
+    `auto_now` does not overwrite them. Blob references move with the
+    attachments.
+    """
+    restored = _moved(ticket, Ticket)
+    restored.save_base(raw=True, force_insert=True)
+    for comment in ArchivedComment.objects.filter(ticket_id=ticket.id).order_by("id"):
+        _moved(comment, Comment).save_base(raw=True, force_insert=True)
+    for attachment in ArchivedAttachment.objects.filter(ticket_id=ticket.id).order_by("id"):
+        _moved(attachment, TicketAttachment).save_base(raw=True, force_insert=True)
+    ArchivedTicket.objects.filter(id=ticket.id).delete()
+    return restored
+
+
+def ticket_record_tables_exist(connection) -> bool:
+    tables = set(connection.introspection.table_names())
+    return {Ticket._meta.db_table, ArchivedTicket._meta.db_table} <= tables
+
+
+def drop_ticket_record_view(connection) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP VIEW IF EXISTS {connection.ops.quote_name(TicketRecord._meta.db_table)}")
+
+
+def install_ticket_record_view(connection) -> None:
+    """
+    (Re)create the `TicketRecord` view over the hot and archived ticket tables.
+
+    The column list is taken from `Ticket`, so the view follows schema
+    changes. It is dropped before migrations run (SQLite refuses to rebuild
+    a table that a view depends on) and recreated after them.
+    """
+    if not ticket_record_tables_exist(connection):
+        return
+    qn = connection.ops.quote_name
+    columns = ", ".join(qn(f.column) for f in Ticket._meta.concrete_fields)
+    drop_ticket_record_view(connection)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIEW {qn(TicketRecord._meta.db_table)} AS "
+            f"SELECT {columns}, FALSE AS {qn('archived')} FROM {qn(Ticket._meta.db_table)} "
+            f"UNION ALL "
+            f"SELECT {columns}, TRUE AS {qn('archived')} FROM {qn(ArchivedTicket._meta.db_table)}"
+        )
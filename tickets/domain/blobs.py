@@ -0,0 +1,214 @@
+"""
+Content-addressed attachment storage.
+
+Every upload is hashed (SHA-256) by streaming its chunks; the body is written to
+storage only when no blob with that digest exists yet, under
+`blobs/<aa>/<bb>/<digest>`. Attachments hold a counted reference to the blob,
+so re-sent log bundles and screenshots cost a hash pass and a counter update
+instead of another copy on disk.
+
+A new blob's file is written before its row commits. If that transaction rolls
+back (or the process dies first), the file has no row. `sweep_orphan_blob_files`
+removes such files once they are older than TICKET_BLOB_ORPHAN_GRACE. The other
+way round, an upload may find the file of an unreferenced blob and rely on it
+while `collect_unreferenced_blobs` deletes that blob; `claim_blob` then writes
+the file again before it creates the row.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Exists, F, OuterRef
+from django.utils import timezone
+
+from tickets.models import ArchivedAttachment, AttachmentBlob, TicketAttachment
+
+
+BLOB_PREFIX = "blobs"
+
+
+def blob_path(digest: str) -> str:
+    return f"{BLOB_PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}"
+
+
+def hash_upload(f) -> tuple[str, int]:
+    """SHA-256 and size of an uploaded file, read in the upload's own chunk size."""
+    digest = hashlib.sha256()
+    size = 0
+    f.seek(0)
+    for chunk in f.chunks():
+        digest.update(chunk)
+        size += len(chunk)
+    f.seek(0)
+    return digest.hexdigest(), size
+
+
+def _write_blob_file(f, digest: str) -> str:
+    path = blob_path(digest)
+    if default_storage.exists(path):
+        # Known content, a leftover of a blob that was collected mid-flight, or written by a concurrent upload.
+        return path
+    return default_storage.save(path, f)
+
+
+def _ensure_blob_file(f, digest: str) -> str:
+    """Write `f` to the blob's canonical path unless that file exists already; returns the path."""
+    path = _write_blob_file(f, digest)
+    if path != blob_path(digest):
+        # A concurrent upload of the same content created the canonical file first.
+        default_storage.delete(path)
+        path = blob_path(digest)
+    return path
+
+
+@dataclass(frozen=True, slots=True)
+class StoredUpload:
+    """
+    An upload whose bytes are in blob storage; its `AttachmentBlob` row may not exist yet.
+
+    `source` is the uploaded file, which must stay open until `claim_blob` ran.
+    """
+
+    original_name: str
+    sha256: str
+    size: int
+    path: str
+    source: object = field(default=None, compare=False, repr=False)
+
+
+def store_upload(f) -> StoredUpload:
+    """
+    Hash `f` and make sure its content is in storage, without writing to the database.
+
+    Run it before the write transaction opens, so the transaction only covers
+    the rows (`claim_blob`).
+    """
+    digest, size = hash_upload(f)
+    path = _ensure_blob_file(f, digest)
+    return StoredUpload(original_name=(f.name or "")[:255], sha256=digest, size=size, path=path, source=f)
+
+
+def claim_blob(upload: StoredUpload) -> AttachmentBlob:
+    """
+    Return the blob row for a stored upload, creating it if the content is new.
+
+    The blob's `ref_count` is incremented; callers must run inside the
+    transaction that creates the referencing attachment.
+    """
+    blobs = AttachmentBlob.objects.filter(sha256=upload.sha256)
+    if blobs.update(ref_count=F("ref_count") + 1):
+        return blobs.get()
+    if upload.source is not None and not default_storage.exists(upload.path):
+        # `store_upload` reused the file of an unreferenced blob that GC has deleted since.
+        upload.source.seek(0)
+        _ensure_blob_file(upload.source, upload.sha256)
+    try:
+        with transaction.atomic():
+            return AttachmentBlob.objects.create(sha256=upload.sha256, file=upload.path, size=upload.size, ref_count=1)
+    except IntegrityError:
+        # A concurrent upload of the same content created the row first.
+        blobs.update(ref_count=F("ref_count") + 1)
+        return blobs.get()
+
+
+def acquire_blob(f) -> AttachmentBlob:
+    """`store_upload` and `claim_blob` in one go, for callers already inside their transaction."""
+    return claim_blob(store_upload(f))
+
+
+def release_blob(blob_id: int) -> None:
+    AttachmentBlob.objects.filter(pk=blob_id, ref_count__gt=0).update(ref_count=F("ref_count") - 1)
+
+
+def _delete_blob_file(blob: AttachmentBlob) -> None:
+    # An upload of the same content may have recreated the row (reusing the file) meanwhile.
+    if not AttachmentBlob.objects.filter(sha256=blob.sha256).exists():
+        default_storage.delete(blob.file.name)
+
+
+@dataclass(frozen=True, slots=True)
+class BlobGCResult:
+    deleted: int
+    freed_bytes: int
+
+
+def recount_blob_refs() -> int:
+    """Reset every blob's `ref_count` from the (hot and archived) attachment tables; returns how many were wrong."""
+    fixed = 0
+    rows = AttachmentBlob.objects.annotate(
+        hot=Count("attachments", distinct=True),
+        archived=Count("archived_attachments", distinct=True),
+    ).values_list("id", "ref_count", "hot", "archived")
+    for blob_id, stored, hot, archived in rows:
+        actual = hot + archived
+        if stored != actual:
+            AttachmentBlob.objects.filter(pk=blob_id).update(ref_count=actual)
+            fixed += 1
+    return fixed
+
+
+def collect_unreferenced_blobs(*, dry_run: bool = False) -> BlobGCResult:
+    """Delete blobs (rows and files) that no attachment references any more."""
+    candidates = (
+        AttachmentBlob.objects.filter(ref_count=0)
+        .exclude(Exists(TicketAttachment.objects.filter(blob=OuterRef("pk"))))
+        .exclude(Exists(ArchivedAttachment.objects.filter(blob=OuterRef("pk"))))
+    )
+    deleted = freed = 0
+    for blob in candidates.iterator():
+        if dry_run:
+            deleted += 1
+            freed += blob.size
+            continue
+        with transaction.atomic():
+            # Re-check under the row lock: an upload may have just re-acquired the blob.
+            locked = candidates.select_for_update().filter(pk=blob.pk).first()
+            if locked is None:
+                continue
+            locked.delete()
+            transaction.on_commit(lambda blob=locked: _delete_blob_file(blob))
+        deleted += 1
+        freed += blob.size
+    return BlobGCResult(deleted=deleted, freed_bytes=freed)
+
+
+def _blob_directories():
+    """(directory, file names) for every directory under BLOB_PREFIX, as storage names."""
+    if not default_storage.exists(BLOB_PREFIX):
+        return
+    pending = [BLOB_PREFIX]
+    while pending:
+        directory = pending.pop()
+        dirs, files = default_storage.listdir(directory)
+        pending.extend(f"{directory}/{name}" for name in dirs)
+        if files:
+            yield directory, [f"{directory}/{name}" for name in files]
+
+
+def sweep_orphan_blob_files(*, grace: int | None = None, dry_run: bool = False, now=None) -> BlobGCResult:
+    """
+    Delete files under BLOB_PREFIX that no `AttachmentBlob` row points at.
+
+    Files younger than `grace` seconds (TICKET_BLOB_ORPHAN_GRACE) are kept:
+    their upload may still be about to commit the row.
+    """
+    grace = settings.TICKET_BLOB_ORPHAN_GRACE if grace is None else grace
+    cutoff = (now or timezone.now()) - timedelta(seconds=grace)
+    deleted = freed = 0
+    for _directory, names in _blob_directories():
+        known = set(AttachmentBlob.objects.filter(file__in=names).values_list("file", flat=True))
+        for name in names:
+            if name in known or default_storage.get_modified_time(name) > cutoff:
+                continue
+            size = default_storage.size(name)
+            if not dry_run:
+                default_storage.delete(name)
+            deleted += 1
+            freed += size
+    return BlobGCResult(deleted=deleted, freed_bytes=freed)
@@ -0,0 +1,74 @@
+"""
+Generation counters behind the read response cache.
+
+A cached response is stored under the current generation of every scope it
+depends on: `tickets` (any ticket write), `ticket:<id>` (that ticket, its
+comments and attachments) and `categories`. Writers bump those generations
+after commit, which makes every older entry unreachable at once, with no key
+scans or deletes; orphaned entries age out of the cache on their own.
+
+Ticket and Category saves/deletes bump through signals (see signals.py); the
+write paths that bypass signals (`bulk_create`, queryset `update()`) call
+`tickets_changed` themselves.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+TICKETS = "tickets"
+CATEGORIES = "categories"
+
+
+def ticket_scope(ticket_id: int) -> str:
+    return f"ticket:{ticket_id}"
+
+
+def get_cache():
+    return caches[settings.TICKET_RESPONSE_CACHE_ALIAS]
+
+
+def _generation_key(scope: str) -> str:
+    return f"gen:{scope}"
+
+
+def get_generations(scopes: Iterable[str]) -> tuple[int, ...]:
+    cache = get_cache()
+    keys = [_generation_key(scope) for scope in scopes]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            # Seeded from the clock, so an evicted counter never comes back to a value already used.
+            cache.add(key, time.time_ns(), timeout=None)
+            found[key] = cache.get(key)
+    return tuple(found[key] for key in keys)
+
+
+def bump_generations(*scopes: str) -> None:
+    cache = get_cache()
+    for scope in scopes:
+        key = _generation_key(scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def invalidate_on_commit(*scopes: str, using: str = "default") -> None:
+    """
+    Bump after the surrounding transaction commits (immediately outside one).
+
+    Bumping earlier would let a concurrent reader cache pre-commit data under
+    the new generation.
+    """
+    transaction.on_commit(lambda: bump_generations(*scopes), using=using, robust=True)
+
+
+def tickets_changed(*ticket_ids: int) -> None:
+    invalidate_on_commit(TICKETS, *(ticket_scope(ticket_id) for ticket_id in ticket_ids))
@@ -0,0 +1,105 @@
+"""
+Process-local index of valid ticket categories.
+
+Serializers validate `category` against the `Category` table without a query
+per request. Each process keeps `{normalized name: name}` in memory, stamped
+with the `categories` generation from `tickets.domain.cache`. The stamp is
+re-read from the cache at most every `TICKET_CATEGORY_INDEX_TTL` seconds, and
+the table is only reloaded when it moved. Category saves and deletes bump the
+generation after commit and drop this process's copy at once (signals.py);
+other processes notice within the TTL.
+"""
+
+from __future__ import annotations
+
+import difflib
+import threading
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from tickets.domain.cache import CATEGORIES, get_generations, tickets_changed
+from tickets.models import Category, Ticket
+
+
+def normalize_category(value: str) -> str:
+    """Case- and whitespace-insensitive form: "  Technical  Support " -> "technical support"."""
+    return " ".join(value.split()).lower()
+
+
+class CategoryIndex:
+    def __init__(self):
+        self._names: dict[str, str] = {}
+        self._version: int | None = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def names(self) -> dict[str, str]:
+        now = time.monotonic()
+        if now - self._checked_at < settings.TICKET_CATEGORY_INDEX_TTL:
+            return self._names
+        with self._lock:
+            if now - self._checked_at >= settings.TICKET_CATEGORY_INDEX_TTL:
+                (version,) = get_generations([CATEGORIES])
+                if version != self._version:
+                    # Stamp read first: a write landing during the load bumps past it and forces another reload.
+                    names = Category.objects.values_list("name", flat=True)
+                    self._names = {normalize_category(name): name for name in names}
+                    self._version = version
+                self._checked_at = now
+        return self._names
+
+    def resolve(self, value: str) -> str | None:
+        """The stored Category name `value` refers to, or None if there is none."""
+        return self.names().get(normalize_category(value))
+
+    def invalidate(self) -> None:
+        self._version = None
+        self._checked_at = float("-inf")
+
+
+category_index = CategoryIndex()
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryFix:
+    source: str
+    target: str | None  # None: no match and no fallback, left as is
+    tickets: int
+
+
+def plan_category_backfill(*, fallback: str | None = None, cutoff: float = 0.8) -> list[CategoryFix]:
+    """
+    Map every ticket category value that is not a Category name to one.
+
+    Tries the normalized form first, then the closest name by similarity
+    (`cutoff` as in `difflib.get_close_matches`), then `fallback`.
+    """
+    names = {normalize_category(name): name for name in Category.objects.values_list("name", flat=True)}
+    rows = Ticket.objects.values_list("category").annotate(n=Count("id")).order_by("category")
+    fixes = []
+    for value, count in rows:
+        if value in names.values():
+            continue
+        key = normalize_category(value)
+        close = difflib.get_close_matches(key, names.keys(), n=1, cutoff=cutoff)
+        target = names.get(key) or (names[close[0]] if close else fallback)
+        fixes.append(CategoryFix(source=value, target=target, tickets=count))
+    return fixes
+
+
+def apply_category_fix(fix: CategoryFix, *, batch_size: int = 1000) -> int:
+    """Rewrite `fix.source` to `fix.target` in short batched transactions; returns tickets updated."""
+    updated = 0
+    while fix.target is not None:
+        with transaction.atomic():
+            ids = list(Ticket.objects.filter(category=fix.source).values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+            updated += Ticket.objects.filter(id__in=ids).update(category=fix.target, updated_at=timezone.now())
+            tickets_changed(*ids)
+    return updated
@@ -0,0 +1,98 @@
+"""
+Incremental change feed.
+
+A feed position is the id of the last outbox event a client has seen (the
+same ids the SSE streams send). Every write service records an `OutboxEvent`
+in its transaction, and event ids are allocated under the write lock, so they
+commit in id order: "what changed since X" is a primary key range scan over
+the events of the feed's tickets, and a write shows up as soon as it commits.
+Each page lists the current state of the tickets those events touched, plus
+the comments they added. Delivery is at-least-once: a ticket written again
+between two polls shows up again, so clients upsert by `id`. With concurrent
+writers (e.g. PostgreSQL) set TICKET_CHANGES_SETTLE_SECONDS, as for the
+outbox relay, so a lower id that commits late is not skipped.
+
+`wait_for_changes` is the long-poll: it sleeps on the event loop and runs an
+indexed EXISTS probe every `TICKET_CHANGES_POLL_INTERVAL` seconds, holding no
+open transaction. The probe itself runs in a thread; served by
+ticketing.handlers, that is the process's shared thread-sensitive thread, so
+a waiting client does not park a thread of its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from tickets.models import Comment, OutboxEvent, Ticket
+
+
+Position = int
+
+CHANGE_COMMENT_FIELDS = ("id", "ticket_id", "author", "role", "message", "created_at")
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeSet:
+    tickets: list[dict]
+    comments: list[dict]
+    position: Position | None
+    has_more: bool
+
+
+def change_events_qs(base: QuerySet[Ticket], since: Position | None) -> QuerySet[OutboxEvent]:
+    qs = OutboxEvent.objects.filter(ticket_id__in=base.values("id")).order_by("id")
+    if since is not None:
+        qs = qs.filter(id__gt=since)
+    settle = settings.TICKET_CHANGES_SETTLE_SECONDS
+    if settle:
+        # With concurrent writers a lower id can commit after a higher one; holding back the
+        # newest events keeps the cursor from passing it.
+        qs = qs.filter(created_at__lte=timezone.now() - timedelta(seconds=settle))
+    return qs
+
+
+async def afetch_changes(
+    base: QuerySet[Ticket],
+    *,
+    since: Position | None,
+    limit: int,
+    fields: tuple[str, ...],
+) -> ChangeSet:
+    """The tickets (and new comments) of the next `limit` events after `since`."""
+    page = change_events_qs(base, since).values("id", "ticket_id", "event_type", "payload")[: limit + 1]
+    events = [event async for event in page]
+    has_more = len(events) > limit
+    events = events[:limit]
+    if not events:
+        return ChangeSet(tickets=[], comments=[], position=since, has_more=False)
+
+    # Oldest change first, each ticket once, at the position of its latest event in the page.
+    order = {event["ticket_id"]: event["id"] for event in events}
+    values = tuple(dict.fromkeys((*fields, "id")))
+    rows = [row async for row in base.filter(id__in=order).order_by().values(*values)]
+    rows.sort(key=lambda row: order[row["id"]])
+
+    comment_ids = [event["payload"]["comment"]["id"] for event in events if event["event_type"] == "comment.created"]
+    comments = Comment.objects.filter(id__in=comment_ids).order_by("created_at", "id")
+    comment_rows = [row async for row in comments.values(*CHANGE_COMMENT_FIELDS)] if comment_ids else []
+    return ChangeSet(tickets=rows, comments=comment_rows, position=events[-1]["id"], has_more=has_more)
+
+
+async def wait_for_changes(base: QuerySet[Ticket], *, since: Position | None, timeout: float) -> bool:
+    """Wait until a ticket changed after `since` or `timeout` seconds passed, polling between sleeps."""
+    interval = settings.TICKET_CHANGES_POLL_INTERVAL
+    deadline = time.monotonic() + timeout
+    while True:
+        if await change_events_qs(base, since).aexists():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(interval, remaining))
@@ -0,0 +1,102 @@
+"""
+Streaming export of ticket querysets as NDJSON or CSV.
+
+Rows are pulled with `values_list().iterator(chunk_size=...)`, so memory stays
+flat regardless of result size; comments (optional) are fetched with one query
+per chunk of tickets rather than one per ticket.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+
+from tickets.models import Comment, Ticket
+
+
+TICKET_FIELDS = (
+    "id",
+    "source",
+    "external_ref",
+    "title",
+    "description",
+    "priority",
+    "status",
+    "category",
+    "customer_id",
+    "assigned_to",
+    "created_at",
+    "updated_at",
+)
+COMMENT_FIELDS = ("id", "author", "role", "message", "created_at")
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def iter_ticket_rows(
+    qs: QuerySet[Ticket],
+    *,
+    chunk_size: int = 2000,
+    include_comments: bool = False,
+) -> Iterator[dict]:
+    rows = qs.values_list(*TICKET_FIELDS).iterator(chunk_size=chunk_size)
+    while batch := list(islice(rows, chunk_size)):
+        tickets = [dict(zip(TICKET_FIELDS, row)) for row in batch]
+        if include_comments:
+            comments = defaultdict(list)
+            for ticket_id, *values in (
+                Comment.objects.filter(ticket_id__in=[t["id"] for t in tickets])
+                .order_by("ticket_id", "created_at", "id")
+                .values_list("ticket_id", *COMMENT_FIELDS)
+            ):
+                comments[ticket_id].append(dict(zip(COMMENT_FIELDS, values)))
+            for ticket in tickets:
+                ticket["comments"] = comments.get(ticket["id"], [])
+        yield from tickets
+
+
+def render_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+class _Echo:
+    """File-like object whose `write` just hands the line back to csv.writer's caller."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def render_csv(rows: Iterable[dict], *, include_comments: bool = False) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    header = TICKET_FIELDS + (("comments",) if include_comments else ())
+    yield writer.writerow(header)
+    for row in rows:
+        values = [row[f].isoformat() if f in ("created_at", "updated_at") else row[f] for f in TICKET_FIELDS]
+        if include_comments:
+            values.append(json.dumps(row["comments"], cls=DjangoJSONEncoder))
+        yield writer.writerow(values)
+
+
+def export_tickets(
+    qs: QuerySet[Ticket],
+    *,
+    fmt: str,
+    chunk_size: int = 2000,
+    include_comments: bool = False,
+) -> Iterator[str]:
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    rows = iter_ticket_rows(qs, chunk_size=chunk_size, include_comments=include_comments)
+    if fmt == "csv":
+        return render_csv(rows, include_comments=include_comments)
+    return render_ndjson(rows)
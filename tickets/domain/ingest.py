@@ -0,0 +1,125 @@
+"""
+Queued external ingest.
+
+The request path only validates and stores an `IngestJob` (one INSERT), then
+enqueues `drain_ingest_jobs` after commit. The worker claims queued jobs in
+micro-batches and inserts them with `bulk_create_external_tickets`, so an
+upstream burst turns into a few bulk INSERTs instead of one transaction per
+request.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+
+from tickets.domain.services import bulk_create_external_tickets
+from tickets.models import IdempotencyKey, IngestJob
+
+
+def enqueue_external_ticket(*, data: dict[str, Any], idempotency_key: str | None = None) -> tuple[IngestJob, bool]:
+    """
+    Store a validated payload as a queued job. Returns (job, enqueued).
+
+    A repeated Idempotency-Key returns the original job with `enqueued=False`.
+    """
+    from tickets.tasks import drain_ingest_jobs
+
+    if idempotency_key:
+        existing = IngestJob.objects.filter(idempotency_key=idempotency_key).first()
+        if existing is not None:
+            return existing, False
+    try:
+        with transaction.atomic():
+            job = IngestJob.objects.create(payload=data, idempotency_key=idempotency_key)
+            # A broker outage must not fail the request: the job is stored, and the beat drain picks it up.
+            transaction.on_commit(drain_ingest_jobs.delay, robust=True)
+    except IntegrityError:
+        # A concurrent request with the same Idempotency-Key won the insert.
+        return IngestJob.objects.get(idempotency_key=idempotency_key), False
+    return job, True
+
+
+def get_ingest_job_or_404(*, job_id) -> IngestJob:
+    try:
+        return IngestJob.objects.get(id=job_id)
+    except IngestJob.DoesNotExist as exc:
+        raise NotFound("Job not found") from exc
+
+
+def requeue_stale_jobs() -> int:
+    """Put jobs back in the queue whose worker died after claiming them."""
+    cutoff = timezone.now() - timedelta(seconds=settings.EXTERNAL_INGEST_STALE_AFTER)
+    return IngestJob.objects.filter(status=IngestJob.Status.PROCESSING, started_at__lt=cutoff).update(
+        status=IngestJob.Status.QUEUED,
+        claim=None,
+        started_at=None,
+    )
+
+
+def claim_ingest_jobs(*, limit: int) -> list[IngestJob]:
+    """
+    Atomically mark up to `limit` of the oldest queued jobs as ours.
+
+    The conditional UPDATE is the lock: a job another worker already flipped
+    to "processing" is skipped, without needing SELECT ... FOR UPDATE SKIP LOCKED.
+    """
+    claim = uuid.uuid4()
+    queued = IngestJob.objects.filter(status=IngestJob.Status.QUEUED).order_by("created_at")
+    ids = list(queued.values_list("id", flat=True)[:limit])
+    if not ids:
+        return []
+    IngestJob.objects.filter(id__in=ids, status=IngestJob.Status.QUEUED).update(
+        status=IngestJob.Status.PROCESSING,
+        claim=claim,
+        started_at=timezone.now(),
+    )
+    return list(IngestJob.objects.filter(claim=claim).order_by("created_at"))
+
+
+def process_ingest_jobs(jobs: list[IngestJob]) -> None:
+    now = timezone.now()
+    try:
+        results = bulk_create_external_tickets(
+            items=[job.payload for job in jobs],
+            chunk_size=settings.EXTERNAL_BATCH_CHUNK_SIZE,
+        )
+    except Exception as exc:
+        IngestJob.objects.filter(id__in=[job.id for job in jobs]).update(
+            status=IngestJob.Status.FAILED,
+            error=str(exc)[:2000],
+            finished_at=now,
+        )
+        raise
+
+    for job, result in zip(jobs, results):
+        job.status = IngestJob.Status.SUCCEEDED
+        job.ticket_id = result.ticket_id
+        job.created = result.created
+        job.finished_at = now
+    with transaction.atomic():
+        IdempotencyKey.objects.bulk_create(
+            [IdempotencyKey(key=job.idempotency_key, ticket_id=job.ticket_id) for job in jobs if job.idempotency_key],
+            ignore_conflicts=True,
+        )
+        IngestJob.objects.bulk_update(jobs, ["status", "ticket_id", "created", "finished_at"])
+
+
+def drain_ingest_jobs(*, batch_size: int | None = None, max_batches: int = 50) -> int:
+    """Process queued jobs batch by batch until the queue is empty (or `max_batches`). Returns jobs processed."""
+    batch_size = batch_size or settings.EXTERNAL_INGEST_BATCH_SIZE
+    requeue_stale_jobs()
+    processed = 0
+    for _ in range(max_batches):
+        jobs = claim_ingest_jobs(limit=batch_size)
+        if not jobs:
+            break
+        process_ingest_jobs(jobs)
+        processed += len(jobs)
+    return processed
@@ -0,0 +1,161 @@
+"""
+Live ticket events for the SSE endpoints.
+
+Every outbox event is also published (after commit) to the configured broker,
+`TICKET_LIVE_BROKER`. The broker carries it to each web worker, and inside a
+worker the `LiveHub` hands it to every open SSE connection whose filter
+matches. `LocalBroker` (default) only reaches connections in the publishing
+process. `RedisBroker` fans out over a Redis pub/sub channel, so writes made by
+any worker, or by Celery, reach clients connected to any ASGI worker.
+
+Live delivery is best effort. A client that reconnects with `Last-Event-ID`
+gets what it missed replayed from the outbox.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """One SSE connection's inbox; lives on the event loop that created it."""
+
+    def __init__(self, predicate: Callable[[dict], bool], maxsize: int):
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize)
+        self.predicate = predicate
+        self.overflowed = False
+
+    def offer(self, message: dict) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # A consumer this far behind is cut off; it resumes from the outbox on reconnect.
+            self.overflowed = True
+
+    async def get(self, timeout: float) -> dict | None:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class LiveHub:
+    """In-process fan-out to subscriptions; `dispatch` is safe to call from any thread."""
+
+    def __init__(self):
+        self._subscriptions: set[Subscription] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, predicate: Callable[[dict], bool], *, maxsize: int) -> Subscription:
+        subscription = Subscription(predicate, maxsize)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def dispatch(self, message: dict) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            if not subscription.predicate(message):
+                continue
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, message)
+            except RuntimeError:
+                # The connection's event loop is gone.
+                self.unsubscribe(subscription)
+
+
+class LiveBroker:
+    """Transport between publishing processes and the hub of every web worker."""
+
+    def __init__(self, hub: LiveHub):
+        self.hub = hub
+
+    def publish(self, message: dict) -> None:
+        raise NotImplementedError
+
+    def start(self) -> None:
+        """Begin receiving messages for `hub`; called on every subscription, must be idempotent."""
+
+
+class LocalBroker(LiveBroker):
+    def publish(self, message: dict) -> None:
+        self.hub.dispatch(message)
+
+
+class RedisBroker(LiveBroker):
+    """Publishes to a Redis channel; one listener thread per process feeds the hub."""
+
+    def __init__(self, hub: LiveHub, *, url: str, channel: str = "tickets.live"):
+        import redis
+
+        super().__init__(hub)
+        self.client = redis.Redis.from_url(url)
+        self.channel = channel
+        self.errors = redis.RedisError
+        self._listener: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def publish(self, message: dict) -> None:
+        try:
+            self.client.publish(self.channel, json.dumps(message, cls=DjangoJSONEncoder))
+        except self.errors as exc:
+            logger.warning("Live event %s not published: %s", message.get("id"), exc)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(target=self._listen, name="live-events", daemon=True)
+                self._listener.start()
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                for item in pubsub.listen():
+                    self.hub.dispatch(json.loads(item["data"]))
+            except self.errors as exc:
+                logger.warning("Live event listener lost Redis, retrying: %s", exc)
+                time.sleep(1)
+
+
+hub = LiveHub()
+
+
+@functools.cache
+def get_live_broker() -> LiveBroker:
+    conf = settings.TICKET_LIVE_BROKER
+    return import_string(conf["backend"])(hub, **conf.get("options", {}))
+
+
+def publish(message: dict) -> None:
+    get_live_broker().publish(message)
+
+
+def subscribe(predicate: Callable[[dict], bool]) -> Subscription:
+    """Must be called on the event loop that will consume the subscription."""
+    get_live_broker().start()
+    return hub.subscribe(predicate, maxsize=settings.TICKET_LIVE_QUEUE_SIZE)
+
+
+def unsubscribe(subscription: Subscription) -> None:
+    hub.unsubscribe(subscription)
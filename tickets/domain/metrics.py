@@ -0,0 +1,189 @@
+"""
+Per-request performance measurements (see ticketing.middleware.ServerTimingMiddleware).
+
+`QueryRecorder` counts a request's queries and DB time. `record_queries` is
+an `execute_wrapper` on every connection (installed on `connection_created`)
+that feeds the recorder made active with `recording()`. The active recorder is
+a context variable, so queries count whichever thread runs them: async views
+reach the ORM through `sync_to_async`, which copies the context. Raw SQL is
+kept per distinct statement text (parameters are separate, so repeats
+collapse) and only fingerprinted when a slow request is logged.
+
+`RequestMetrics` aggregates per-endpoint histograms in process memory and
+renders them in the Prometheus text exposition format for GET /admin/metrics.
+Each worker process keeps its own numbers: scrape every worker (or add the
+series up) when running more than one.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # seconds
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDERS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROWS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+
+
+def fingerprint_sql(sql: str) -> str:
+    """
+    Statement shape with literals and parameters replaced by `?`.
+
+    `IN (%s, %s, %s)` and multi-row `VALUES` collapse to `(...)`, so the same
+    query with a different number of ids gets the same fingerprint.
+    """
+    sql = " ".join(sql.split())
+    sql = _STRING.sub("?", sql).replace("%s", "?")
+    sql = _NUMBER.sub("?", sql)
+    sql = _PLACEHOLDERS.sub("(...)", sql)
+    return _ROWS.sub("(...)", sql)
+
+
+class QueryRecorder:
+    """`execute_wrapper` callable counting queries and time spent in the database."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: dict[str, list] = {}  # sql -> [executions, seconds]
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.seconds += elapsed
+            entry = self.statements.setdefault(sql, [0, 0.0])
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def fingerprints(self, limit: int = 5) -> list[tuple[str, int, float]]:
+        """The `limit` costliest query shapes as (fingerprint, executions, seconds)."""
+        grouped: dict[str, list] = defaultdict(lambda: [0, 0.0])
+        for sql, (executions, seconds) in self.statements.items():
+            entry = grouped[fingerprint_sql(sql)]
+            entry[0] += executions
+            entry[1] += seconds
+        ranked = sorted(grouped.items(), key=lambda item: item[1][1], reverse=True)
+        return [(fingerprint, executions, seconds) for fingerprint, (executions, seconds) in ranked[:limit]]
+
+
+_active_recorder: contextvars.ContextVar[QueryRecorder | None] = contextvars.ContextVar(
+    "ticket_query_recorder", default=None
+)
+
+
+def record_queries(execute, sql, params, many, context):
+    """`execute_wrapper` for every connection: times the query into the active recorder, if any."""
+    recorder = _active_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install_query_recording(connection) -> None:
+    if record_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_queries)
+
+
+@contextmanager
+def recording(recorder: QueryRecorder):
+    """Count the queries run in this context (and in `sync_to_async` calls made from it) into `recorder`."""
+    token = _active_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _active_recorder.reset(token)
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        running = 0
+        for bound, n in zip(self.buckets, self.counts):
+            running += n
+            yield bound, running
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class RequestMetrics:
+    METRICS = (
+        ("ticketing_http_request_duration_seconds", "Wall time of the request.", DURATION_BUCKETS),
+        ("ticketing_http_request_db_queries", "Database queries executed by the request.", QUERY_BUCKETS),
+        ("ticketing_http_request_db_duration_seconds", "Time spent in the database.", DURATION_BUCKETS),
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms: dict[tuple[str, str, str], Histogram] = {}
+            self._responses: dict[tuple[str, str, str], int] = defaultdict(int)
+
+    def observe(self, *, endpoint: str, method: str, status: int, seconds: float, queries: int, db_seconds: float):
+        with self._lock:
+            for (name, _, buckets), value in zip(self.METRICS, (seconds, queries, db_seconds)):
+                key = (name, endpoint, method)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram(buckets)
+                histogram.observe(value)
+            self._responses[(endpoint, method, f"{status // 100}xx")] += 1
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            for name, help_text, _ in self.METRICS:
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+                for (metric, endpoint, method), histogram in sorted(self._histograms.items()):
+                    if metric != name:
+                        continue
+                    labels = f'endpoint="{_label(endpoint)}",method="{method}"'
+                    for bound, running in histogram.cumulative():
+                        lines.append(f'{name}_bucket{{{labels},le="{_number(bound)}"}} {running}')
+                    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                    lines.append(f"{name}_sum{{{labels}}} {_number(histogram.sum)}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+            name = "ticketing_http_responses_total"
+            lines += [f"# HELP {name} Responses by endpoint, method and status class.", f"# TYPE {name} counter"]
+            for (endpoint, method, status), n in sorted(self._responses.items()):
+                lines.append(f'{name}{{endpoint="{_label(endpoint)}",method="{method}",status="{status}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics()
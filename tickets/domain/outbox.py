@@ -0,0 +1,207 @@
+"""
+Transactional outbox for ticket change events.
+
+Write services call `emit()` inside their transaction, so an event exists if and
+only if the change committed. `relay_outbox()` (Celery beat / `manage.py
+relay_outbox`) delivers events to every sink in `TICKET_OUTBOX_SINKS` in id
+order, in batches, and advances that sink's checkpoint only after the sink
+accepted the batch: delivery is at-least-once, so consumers dedupe on `id`.
+Committed events are also pushed to the live (SSE) broker, see `tickets.domain.live`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import urllib.request
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Min, QuerySet
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from tickets.domain import live
+from tickets.models import OutboxCheckpoint, OutboxEvent, Ticket
+
+
+logger = logging.getLogger(__name__)
+
+TICKET_SNAPSHOT_FIELDS = (
+    "status",
+    "priority",
+    "category",
+    "source",
+    "external_ref",
+    "customer_id",
+    "assigned_to",
+    "title",
+)
+
+
+def ticket_snapshot(ticket: Ticket) -> dict:
+    return {field: getattr(ticket, field) for field in TICKET_SNAPSHOT_FIELDS}
+
+
+def _publish_on_commit(events: list[OutboxEvent]) -> None:
+    messages = [event_message(event) for event in events]
+    # robust: a broker hiccup must not turn an already committed write into a 500.
+    transaction.on_commit(lambda: [live.publish(message) for message in messages], robust=True)
+
+
+def emit(event_type: str, ticket: Ticket, **data) -> OutboxEvent:
+    """Record one event; call inside the transaction that makes the change."""
+    event = OutboxEvent.objects.create(
+        event_type=event_type,
+        ticket_id=ticket.pk,
+        payload={"ticket": ticket_snapshot(ticket), **data},
+    )
+    _publish_on_commit([event])
+    return event
+
+
+def emit_many(event_type: str, tickets: Iterable[Ticket]) -> None:
+    events = OutboxEvent.objects.bulk_create(
+        OutboxEvent(event_type=event_type, ticket_id=t.pk, payload={"ticket": ticket_snapshot(t)}) for t in tickets
+    )
+    _publish_on_commit(events)
+
+
+def event_message(event: OutboxEvent) -> dict:
+    return {
+        "id": event.id,
+        "type": event.event_type,
+        "ticket_id": event.ticket_id,
+        "created_at": event.created_at,
+        "data": event.payload,
+    }
+
+
+def replay_events(*, after: int, tickets: QuerySet[Ticket], limit: int) -> list[dict]:
+    """Messages for events on `tickets` with id > `after`, oldest first (SSE `Last-Event-ID` resume)."""
+    events = OutboxEvent.objects.filter(id__gt=after, ticket_id__in=tickets.values("id")).order_by("id")
+    return [event_message(event) for event in events[:limit]]
+
+
+class OutboxSink:
+    """Delivery target. `deliver` must raise if the batch was not accepted."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def deliver(self, messages: list[dict]) -> None:
+        raise NotImplementedError
+
+
+class WebhookSink(OutboxSink):
+    """POSTs `{"events": [...]}` as JSON, signed with HMAC-SHA256 when a secret is set."""
+
+    def __init__(self, name: str, *, url: str, secret: str = "", timeout: float = 10.0):
+        super().__init__(name)
+        self.url = url
+        self.secret = secret
+        self.timeout = timeout
+
+    def deliver(self, messages: list[dict]) -> None:
+        body = json.dumps({"events": messages}, cls=DjangoJSONEncoder).encode()
+        request = urllib.request.Request(self.url, data=body, method="POST")
+        request.add_header("Content-Type", "application/json")
+        if self.secret:
+            signature = hmac.new(self.secret.encode(), body, hashlib.sha256).hexdigest()
+            request.add_header("X-Outbox-Signature", f"sha256={signature}")
+        # Non-2xx responses raise HTTPError, which keeps the checkpoint where it was.
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+class LogFileSink(OutboxSink):
+    """Appends one JSON line per event."""
+
+    def __init__(self, name: str, *, path: str):
+        super().__init__(name)
+        self.path = path
+
+    def deliver(self, messages: list[dict]) -> None:
+        with open(self.path, "a", encoding="utf-8") as fh:
+            for message in messages:
+                fh.write(json.dumps(message, cls=DjangoJSONEncoder) + "\n")
+
+
+class CallbackSink(OutboxSink):
+    """Calls an in-process function (dotted path) with each batch of messages."""
+
+    def __init__(self, name: str, *, callback: str):
+        super().__init__(name)
+        self.callback = import_string(callback)
+
+    def deliver(self, messages: list[dict]) -> None:
+        self.callback(messages)
+
+
+def get_outbox_sinks() -> list[OutboxSink]:
+    return [
+        import_string(conf["backend"])(conf["name"], **conf.get("options", {}))
+        for conf in getattr(settings, "TICKET_OUTBOX_SINKS", [])
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class RelayResult:
+    sink: str
+    delivered: int
+    last_event_id: int
+    error: str | None = None
+
+
+def relay_to_sink(sink: OutboxSink, *, batch_size: int, max_batches: int = 100) -> RelayResult:
+    checkpoint, _ = OutboxCheckpoint.objects.get_or_create(sink=sink.name)
+    last_id = checkpoint.last_event_id
+    delivered = 0
+    pending = OutboxEvent.objects.order_by("id")
+    settle = getattr(settings, "TICKET_OUTBOX_SETTLE_SECONDS", 0)
+    if settle:
+        # With concurrent writers (e.g. PostgreSQL) a lower id can commit after a higher one;
+        # holding back the newest events keeps the checkpoint from skipping past it.
+        pending = pending.filter(created_at__lte=timezone.now() - timedelta(seconds=settle))
+    for _ in range(max_batches):
+        events = list(pending.filter(id__gt=last_id)[:batch_size])
+        if not events:
+            break
+        try:
+            sink.deliver([event_message(event) for event in events])
+        except Exception as exc:
+            logger.warning("Outbox sink %s failed after event %s: %s", sink.name, last_id, exc)
+            return RelayResult(sink=sink.name, delivered=delivered, last_event_id=last_id, error=str(exc))
+        last_id = events[-1].id
+        delivered += len(events)
+        # Monotonic: a concurrent relay that got further is never moved backwards.
+        OutboxCheckpoint.objects.filter(sink=sink.name, last_event_id__lt=last_id).update(
+            last_event_id=last_id,
+            updated_at=timezone.now(),
+        )
+    return RelayResult(sink=sink.name, delivered=delivered, last_event_id=last_id)
+
+
+def relay_outbox(*, batch_size: int | None = None) -> list[RelayResult]:
+    batch_size = batch_size or settings.TICKET_OUTBOX_BATCH_SIZE
+    return [relay_to_sink(sink, batch_size=batch_size) for sink in get_outbox_sinks()]
+
+
+def prune_outbox(*, retention_seconds: int | None = None) -> int:
+    """Delete events past retention that every configured sink has already acknowledged."""
+    retention = retention_seconds if retention_seconds is not None else settings.TICKET_OUTBOX_RETENTION
+    events = OutboxEvent.objects.filter(created_at__lt=timezone.now() - timedelta(seconds=retention))
+    names = [sink.name for sink in get_outbox_sinks()]
+    if names:
+        acked = OutboxCheckpoint.objects.filter(sink__in=names).aggregate(m=Min("last_event_id"))["m"]
+        if acked is None or OutboxCheckpoint.objects.filter(sink__in=names).count() < len(names):
+            return 0
+        events = events.filter(id__lte=acked)
+    deleted, _ = events.delete()
+    return deleted
@@ -0,0 +1,114 @@
+"""
+Read replica routing with read-your-writes stickiness.
+
+With TICKET_READ_REPLICA set to a DATABASES alias, `ReplicaRouter` sends the
+reads of GET/HEAD requests to that alias and every write to `default`.
+Selectors return lazy querysets that views evaluate later, so a selector can't
+pick the database itself. Instead, `ReadReplicaMiddleware` opens a read scope
+for the whole request. The scope stays open while a streamed body (export, SSE)
+is produced, and `request_finished` closes it. Anything outside a request
+(services called from Celery, management commands, the write queue thread)
+reads the primary. So does a read inside an open transaction on `default`.
+
+Replication is asynchronous, so an actor who has just written could read the
+old data back from the replica. To prevent that, every unsafe request pins its
+actor to the primary for TICKET_REPLICA_STICKY_SECONDS. The actor is the
+X-ROLE/X-USER pair, or the API key for the external endpoints. The pin is kept
+in the response cache (`tickets.domain.cache.get_cache`), so it holds across
+workers when that cache is shared. The window should cover the replica's
+usual lag.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from tickets.domain.cache import get_cache
+
+
+_read_alias: contextvars.ContextVar[str | None] = contextvars.ContextVar("ticket_read_alias", default=None)
+
+
+def replica_alias() -> str:
+    """The configured replica alias, or "" when reads stay on `default`."""
+    return settings.TICKET_READ_REPLICA
+
+
+def begin_read_scope(alias: str | None) -> None:
+    _read_alias.set(alias or None)
+
+
+def end_read_scope() -> None:
+    _read_alias.set(None)
+
+
+def reading_from_replica() -> bool:
+    """Whether reads made now go to the replica (the current request may use it and no transaction is open)."""
+    return _read_alias.get() is not None and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+
+
+def actor_key(request) -> str:
+    """Who a request acts as, for stickiness; "" when it carries no identity."""
+    api_key = request.headers.get("X-API-KEY")
+    if api_key:
+        return "key:" + hashlib.sha1(api_key.encode()).hexdigest()[:16]
+    role = (request.headers.get("X-ROLE") or request.GET.get("role") or "").strip().lower()
+    user = (request.headers.get("X-USER") or request.GET.get("user") or "").strip()
+    return f"{role}:{user}" if role and user else ""
+
+
+def _pin_key(actor: str) -> str:
+    return f"replica-pin:{actor}"
+
+
+def pin_to_primary(actor: str) -> None:
+    """Make `actor`'s reads use the primary for the next TICKET_REPLICA_STICKY_SECONDS."""
+    seconds = settings.TICKET_REPLICA_STICKY_SECONDS
+    if actor and seconds > 0:
+        get_cache().set(_pin_key(actor), time.time() + seconds, timeout=math.ceil(seconds) + 1)
+
+
+async def apin_to_primary(actor: str) -> None:
+    seconds = settings.TICKET_REPLICA_STICKY_SECONDS
+    if actor and seconds > 0:
+        await get_cache().aset(_pin_key(actor), time.time() + seconds, timeout=math.ceil(seconds) + 1)
+
+
+def pinned_to_primary(actor: str) -> bool:
+    if not actor:
+        return False
+    until = get_cache().get(_pin_key(actor))
+    return until is not None and until > time.time()
+
+
+async def apinned_to_primary(actor: str) -> bool:
+    if not actor:
+        return False
+    until = await get_cache().aget(_pin_key(actor))
+    return until is not None and until > time.time()
+
+
+class ReplicaRouter:
+    """DATABASE_ROUTERS entry: request-scoped reads go to the replica, writes always to `default`."""
+
+    def db_for_read(self, model, **hints):
+        if reading_from_replica():
+            return _read_alias.get()
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        # Also covers instances loaded from the replica and saved afterwards.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same rows, so objects read from either side may be related.
+        databases = {DEFAULT_DB_ALIAS, replica_alias() or DEFAULT_DB_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
@@ -0,0 +1,157 @@
+"""
+Pluggable full-text search behind the admin `q` filter.
+
+The default backend for SQLite keeps an FTS5 shadow table (`tickets_ticket_fts`)
+in sync with `tickets_ticket` through triggers, so every write path (services,
+bulk inserts, admin edits, raw `.update()` calls) is indexed without extra code.
+Other databases fall back to the `icontains` scan until they ship their own
+backend via `settings.TICKET_SEARCH_BACKEND`.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+
+SEARCH_FIELDS = ("title", "description", "external_ref", "customer_id", "assigned_to")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchBackend:
+    """Base interface: turn a free-text query into a filtered (optionally ranked) queryset."""
+
+    def is_available(self, using: str = "default") -> bool:
+        return True
+
+    def install(self, connection) -> None:
+        """Create whatever index structures the backend needs (idempotent)."""
+
+    def rebuild(self, using: str = "default") -> None:
+        """Re-index every ticket from scratch."""
+
+    def filter(self, qs: QuerySet, q: str, *, ranked: bool = False) -> QuerySet:
+        raise NotImplementedError
+
+
+class IcontainsSearchBackend(SearchBackend):
+    """The original five-way `icontains` OR. Works everywhere, scans the whole table."""
+
+    def filter(self, qs: QuerySet, q: str, *, ranked: bool = False) -> QuerySet:
+        cond = Q()
+        for field in SEARCH_FIELDS:
+            cond |= Q(**{f"{field}__icontains": q})
+        return qs.filter(cond)
+
+
+class SQLiteFTS5SearchBackend(SearchBackend):
+    """
+    FTS5 external-content index over the ticket search fields.
+
+    Queries are tokenized, all tokens must match, and the last token is matched
+    as a prefix (`refund recei` -> `"refund" "recei"*`) for search-as-you-type.
+    Ranking uses bm25 with titles weighted highest.
+    """
+
+    table = "tickets_ticket_fts"
+    source_table = "tickets_ticket"
+    weights = (10.0, 1.0, 5.0, 2.0, 2.0)
+    fallback = IcontainsSearchBackend()
+
+    def __init__(self):
+        self._available: dict[str, bool] = {}
+
+    def is_available(self, using: str = "default") -> bool:
+        if using not in self._available:
+            connection = connections[using]
+            self._available[using] = (
+                connection.vendor == "sqlite" and self.table in connection.introspection.table_names()
+            )
+        return self._available[using]
+
+    def install(self, connection) -> None:
+        if connection.vendor != "sqlite":
+            return
+
+        cols = ", ".join(SEARCH_FIELDS)
+        new_cols = ", ".join(f"new.{c}" for c in SEARCH_FIELDS)
+        old_cols = ", ".join(f"old.{c}" for c in SEARCH_FIELDS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name IN (%s, %s, %s)",
+                [f"{self.table}_ai", f"{self.table}_ad", f"{self.table}_au"],
+            )
+            had_triggers = cursor.fetchone()[0] == 3
+
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+                f"{cols}, content='{self.source_table}', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {self.table}_ai AFTER INSERT ON {self.source_table} BEGIN "
+                f"INSERT INTO {self.table}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {self.table}_ad AFTER DELETE ON {self.source_table} BEGIN "
+                f"INSERT INTO {self.table}({self.table}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {self.table}_au AFTER UPDATE OF {cols} ON {self.source_table} BEGIN "
+                f"INSERT INTO {self.table}({self.table}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); "
+                f"INSERT INTO {self.table}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+            )
+            # SQLite drops triggers when a migration remakes tickets_ticket; the
+            # index may have missed writes in between, so rebuild it.
+            if not had_triggers:
+                cursor.execute(f"INSERT INTO {self.table}({self.table}) VALUES ('rebuild')")
+        self._available.pop(connection.alias, None)
+
+    def rebuild(self, using: str = "default") -> None:
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"INSERT INTO {self.table}({self.table}) VALUES ('rebuild')")
+
+    @staticmethod
+    def build_match_expression(q: str) -> str | None:
+        tokens = _TOKEN_RE.findall(q)
+        if not tokens:
+            return None
+        # Whole-word match for completed tokens, prefix match for the one being typed.
+        *words, last = tokens
+        return " ".join([f'"{token}"' for token in words] + [f'"{last}"*'])
+
+    def filter(self, qs: QuerySet, q: str, *, ranked: bool = False) -> QuerySet:
+        match = self.build_match_expression(q)
+        if match is None or not self.is_available(qs.db):
+            return self.fallback.filter(qs, q)
+
+        if not ranked:
+            return qs.filter(id__in=RawSQL(f"SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s", (match,)))
+
+        # Join the index once so MATCH runs a single time and bm25 comes from the same scan.
+        # The index has no model, so the ORM can't express the join; `extra()` can.
+        weights = ", ".join(str(w) for w in self.weights)
+        return qs.extra(
+            select={"search_rank": f"bm25({self.table}, {weights})"},
+            tables=[self.table],
+            where=[f"{self.table}.rowid = {self.source_table}.id", f"{self.table} MATCH %s"],
+            params=[match],
+            order_by=["search_rank", "-created_at"],
+        )
+
+
+@lru_cache(maxsize=1)
+def get_search_backend() -> SearchBackend:
+    path = getattr(settings, "TICKET_SEARCH_BACKEND", None)
+    if path:
+        return import_string(path)()
+    if connections["default"].vendor == "sqlite":
+        return SQLiteFTS5SearchBackend()
+    return IcontainsSearchBackend()
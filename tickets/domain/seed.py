@@ -0,0 +1,217 @@
+"""
+Synthetic tickets, comments and attachments at production-like volume.
+
+Used by `manage.py seed_tickets` and the route benchmarks. Rows are generated
+in chunks and written with `bulk_create`, one transaction per chunk, so memory
+stays flat at millions of tickets. Customers and categories follow a Zipf
+distribution (`*_skew` is the exponent; 0 is uniform), statuses a weighted one.
+Timestamps are spread over `days`, recent days denser.
+
+`bulk_create` skips model signals: the stats buckets are rebuilt at the end
+(which also bumps the response cache), the search index follows through its
+triggers, and no outbox events are written for seeded rows.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.core.files.base import ContentFile
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from tickets.domain.blobs import acquire_blob
+from tickets.domain.stats import rebuild_buckets
+from tickets.models import AttachmentBlob, Category, Comment, Ticket, TicketAttachment
+
+
+WORDS = (
+    "refund payment invoice charged twice login password reset error timeout crash "
+    "slow upload download attachment screenshot account locked billing technical "
+    "general shipping delayed order missing broken page mobile desktop browser api "
+    "integration webhook sync partner alert outage latency database export report"
+).split()
+
+DEFAULT_STATUS_WEIGHTS = {"open": 35, "in_progress": 20, "resolved": 25, "closed": 20}
+AGENTS = 25
+ATTACHMENT_BODY = b"2024-01-01T00:00:00Z ERROR request failed: timeout after 30s\n" * 64
+
+
+@dataclass(frozen=True, slots=True)
+class SeedSpec:
+    tickets: int
+    customers: int = 1000
+    customer_skew: float = 1.1
+    category_skew: float = 1.0
+    status_weights: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_STATUS_WEIGHTS))
+    comments_per_ticket: float = 3.0  # mean
+    attachment_ratio: float = 0.1  # share of tickets with one attachment
+    external_ratio: float = 0.3
+    days: int = 365
+    seed: int = 1
+
+
+@dataclass(frozen=True, slots=True)
+class SeedResult:
+    tickets: int
+    comments: int
+    attachments: int
+
+
+def zipf_cum_weights(n: int, skew: float) -> list[float]:
+    """Cumulative weights for `random.choices` where rank k is drawn ~ 1 / k**skew."""
+    return list(itertools.accumulate(1 / rank**skew for rank in range(1, n + 1)))
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """
+    Let `bulk_create` keep the `created_at` / `updated_at` values we generate.
+
+    Turns `auto_now` / `auto_now_add` off for the duration; only for
+    single-purpose processes (seeding, benchmarks), as it is process-wide.
+    """
+    fields = [
+        f
+        for model in models
+        for f in model._meta.concrete_fields
+        if getattr(f, "auto_now", False) or getattr(f, "auto_now_add", False)
+    ]
+    saved = [(f, f.auto_now, f.auto_now_add) for f in fields]
+    for f in fields:
+        f.auto_now = f.auto_now_add = False
+    try:
+        yield
+    finally:
+        for f, auto_now, auto_now_add in saved:
+            f.auto_now, f.auto_now_add = auto_now, auto_now_add
+
+
+def _sentence(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(low, high)))
+
+
+class _Generator:
+    def __init__(self, spec: SeedSpec, categories: list[str], blob: AttachmentBlob | None):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.now = timezone.now()
+        self.run = uuid.uuid4().hex[:8]  # keeps external refs unique across runs
+        self.blob = blob
+        self.categories = categories
+        self.category_weights = zipf_cum_weights(len(categories), spec.category_skew)
+        self.customer_weights = zipf_cum_weights(spec.customers, spec.customer_skew)
+        self.statuses = list(spec.status_weights)
+        self.status_weights = list(itertools.accumulate(spec.status_weights.values()))
+
+    def tickets(self, start: int, n: int) -> list[Ticket]:
+        rng, spec = self.rng, self.spec
+        customers = rng.choices(range(1, spec.customers + 1), cum_weights=self.customer_weights, k=n)
+        categories = rng.choices(self.categories, cum_weights=self.category_weights, k=n)
+        statuses = rng.choices(self.statuses, cum_weights=self.status_weights, k=n)
+        rows = []
+        for i, customer, category, status in zip(range(start, start + n), customers, categories, statuses):
+            is_external = rng.random() < spec.external_ratio
+            # rng.random() ** 2 puts more tickets in recent days, like a growing product.
+            created_at = self.now - timedelta(seconds=spec.days * 86400 * rng.random() ** 2)
+            rows.append(
+                Ticket(
+                    source=Ticket.Source.EXTERNAL if is_external else Ticket.Source.CUSTOMER,
+                    external_ref=f"SEED-{self.run}-{i}" if is_external else None,
+                    title=_sentence(rng, 3, 7).capitalize(),
+                    description=_sentence(rng, 10, 60),
+                    priority=rng.choice(Ticket.Priority.values),
+                    status=status,
+                    category=category,
+                    customer_id=f"customer{customer}@example.com",
+                    assigned_to=(
+                        f"agent{rng.randint(1, AGENTS)}@example.com"
+                        if status != Ticket.Status.OPEN or rng.random() < 0.2
+                        else None
+                    ),
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
+        return rows
+
+    def comments(self, tickets: list[Ticket]) -> list[Comment]:
+        rng, mean = self.rng, self.spec.comments_per_ticket
+        rows = []
+        for ticket in tickets:
+            n = min(int(rng.expovariate(1 / mean)), 50) if mean > 0 else 0
+            at = ticket.created_at
+            for j in range(n):
+                at = min(self.now, at + timedelta(seconds=rng.randint(60, 3 * 86400)))
+                from_customer = j % 2 == 0 or ticket.assigned_to is None
+                rows.append(
+                    Comment(
+                        ticket=ticket,
+                        author=ticket.customer_id if from_customer else ticket.assigned_to,
+                        role=Comment.Role.CUSTOMER if from_customer else Comment.Role.ADMIN,
+                        message=_sentence(rng, 5, 40),
+                        created_at=at,
+                    )
+                )
+            ticket.updated_at = at
+        return rows
+
+    def attachments(self, tickets: list[Ticket]) -> list[TicketAttachment]:
+        if self.blob is None:
+            return []
+        rng = self.rng
+        return [
+            TicketAttachment(
+                ticket=ticket,
+                file=self.blob.file.name,
+                blob=self.blob,
+                original_name=f"logs-{ticket.pk}.txt",
+                created_at=ticket.created_at,
+            )
+            for ticket in tickets
+            if rng.random() < self.spec.attachment_ratio
+        ]
+
+
+def seed_tickets(
+    spec: SeedSpec, *, chunk_size: int = 5000, using: str = DEFAULT_DB_ALIAS, progress=None
+) -> SeedResult:
+    """Generate `spec.tickets` tickets plus comments and attachments; `progress(done, total)` after each chunk."""
+    categories = list(Category.objects.using(using).order_by("id").values_list("name", flat=True)) or ["general"]
+    blob = None
+    if spec.attachment_ratio > 0:
+        # Every seeded attachment shares one content-addressed blob, like a re-sent log bundle.
+        with transaction.atomic(using=using):
+            blob = acquire_blob(ContentFile(ATTACHMENT_BODY, name="seed.log"))
+            AttachmentBlob.objects.using(using).filter(pk=blob.pk).update(ref_count=F("ref_count") - 1)
+    generator = _Generator(spec, categories, blob)
+
+    totals = {"tickets": 0, "comments": 0, "attachments": 0}
+    with explicit_timestamps(Ticket, Comment, TicketAttachment):
+        for start in range(0, spec.tickets, chunk_size):
+            n = min(chunk_size, spec.tickets - start)
+            with transaction.atomic(using=using):
+                tickets = generator.tickets(start, n)
+                comments = generator.comments(tickets)  # also moves each ticket's updated_at
+                Ticket.objects.using(using).bulk_create(tickets, batch_size=chunk_size)
+                Comment.objects.using(using).bulk_create(comments, batch_size=chunk_size)
+                attachments = generator.attachments(tickets)
+                TicketAttachment.objects.using(using).bulk_create(attachments, batch_size=chunk_size)
+                if attachments:
+                    AttachmentBlob.objects.using(using).filter(pk=blob.pk).update(
+                        ref_count=F("ref_count") + len(attachments)
+                    )
+            totals["tickets"] += n
+            totals["comments"] += len(comments)
+            totals["attachments"] += len(attachments)
+            if progress:
+                progress(totals["tickets"], spec.tickets)
+
+    rebuild_buckets(using=using)
+    return SeedResult(**totals)
@@ -1,20 +1,123 @@
-from django.db.models import Q, QuerySet
+from datetime import datetime
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Prefetch, QuerySet
 from rest_framework.exceptions import NotFound
 
-from tickets.models import Ticket
+from tickets.domain.search import get_search_backend
+from tickets.models import (
+    ArchivedAttachment,
+    ArchivedComment,
+    ArchivedTicket,
+    Comment,
+    Ticket,
+    TicketAttachment,
+    TicketRecord,
+)
+
+
+def ticket_detail_qs(*, archived: bool = False) -> QuerySet[Ticket]:
+    """
+    Tickets with everything TicketDetailSerializer embeds, in three queries total.
+
+    Only the first `TICKET_DETAIL_COMMENT_LIMIT` comments (+1 to detect "has more")
+    are loaded, into `ticket.first_comments`; the rest are paged through the
+    comments endpoint. `archived=True` reads the archive tables instead.
+    """
+    limit = getattr(settings, "TICKET_DETAIL_COMMENT_LIMIT", 50)
+    ticket_model, comment_model, attachment_model = (
+        (ArchivedTicket, ArchivedComment, ArchivedAttachment) if archived else (Ticket, Comment, TicketAttachment)
+    )
+    return ticket_model.objects.prefetch_related(
+        Prefetch(
+            "comments",
+            queryset=comment_model.objects.order_by("created_at", "id")[: limit + 1],
+            to_attr="first_comments",
+        ),
+        Prefetch("attachments", queryset=attachment_model.objects.order_by("created_at", "id")),
+    )
+
+
+def ticket_comments_qs(*, ticket_id: int, archived: bool = False) -> QuerySet[Comment]:
+    return (ArchivedComment if archived else Comment).objects.filter(ticket_id=ticket_id)
+
+
+def ticket_comments_or_404(*, ticket_id: int, customer_email: str | None = None) -> QuerySet[Comment]:
+    """
+    Comments of a hot or archived ticket, after a single-column existence check.
+
+    Pass `customer_email` to scope the lookup to that customer's tickets.
+    """
+    for archived in (False, True):
+        if _ticket_version_qs(ticket_id=ticket_id, customer_email=customer_email, archived=archived).exists():
+            return ticket_comments_qs(ticket_id=ticket_id, archived=archived)
+    raise NotFound("Ticket not found")
 
 
 def customer_ticket_qs(*, customer_email: str) -> QuerySet[Ticket]:
     return Ticket.objects.filter(customer_id=customer_email).order_by("-created_at")
 
 
-def get_customer_ticket_or_404(*, ticket_id: int, customer_email: str) -> Ticket:
+def customer_ticket_list_qs(*, customer_email: str) -> QuerySet[TicketRecord]:
+    """A customer's hot and archived tickets, newest first (the `TicketRecord` view)."""
+    return TicketRecord.objects.filter(customer_id=customer_email).order_by("-created_at")
+
+
+def _get_ticket_detail_or_404(**lookup) -> Ticket | ArchivedTicket:
+    # Hot table first; closed tickets moved out by tickets.domain.archive are served from the archive.
+    for archived in (False, True):
+        try:
+            return ticket_detail_qs(archived=archived).get(**lookup)
+        except ObjectDoesNotExist:
+            continue
+    raise NotFound("Ticket not found")
+
+
+def get_customer_ticket_or_404(*, ticket_id: int, customer_email: str) -> Ticket | ArchivedTicket:
+    return _get_ticket_detail_or_404(id=ticket_id, customer_id=customer_email)
+
+
+def get_ticket_for_upload_or_404(
+    *,
+    ticket_id: int,
+    customer_email: str | None = None,
+    source: str | None = None,
+) -> Ticket:
+    """Bare ticket row an uploader may attach to, scoped by owner and/or source."""
+    qs = Ticket.objects.filter(id=ticket_id)
+    if customer_email is not None:
+        qs = qs.filter(customer_id=customer_email)
+    if source is not None:
+        qs = qs.filter(source=source)
     try:
-        return Ticket.objects.prefetch_related("comments").get(id=ticket_id, customer_id=customer_email)
+        return qs.get()
     except Ticket.DoesNotExist as exc:
         raise NotFound("Ticket not found") from exc
 
 
+def get_attachment_for_download_or_404(
+    *,
+    ticket_id: int,
+    attachment_id: int,
+    customer_email: str | None = None,
+) -> TicketAttachment | ArchivedAttachment:
+    """
+    One primary-key lookup joined to the ticket for the ownership check (then the archive, on a miss).
+
+    Only the columns needed to serve the file (plus the blob digest for the ETag) are loaded.
+    """
+    for model in (TicketAttachment, ArchivedAttachment):
+        qs = model.objects.filter(id=attachment_id, ticket_id=ticket_id)
+        if customer_email is not None:
+            qs = qs.filter(ticket__customer_id=customer_email)
+        qs = qs.select_related("blob").only("id", "ticket_id", "file", "original_name", "created_at", "blob__sha256")
+        attachment = qs.first()
+        if attachment is not None:
+            return attachment
+    raise NotFound("Attachment not found")
+
+
 def admin_ticket_qs(
     *,
     status: str | None = None,
@@ -23,6 +126,7 @@ def admin_ticket_qs(
     assigned_to: str | None = None,
     source: str | None = None,
     q: str | None = None,
+    rank: bool = False,
 ) -> QuerySet[Ticket]:
     qs = Ticket.objects.all().order_by("-created_at")
     if status:
@@ -38,19 +142,61 @@ def admin_ticket_qs(
     if q:
         q = q.strip()
         if q:
-            qs = qs.filter(
-                Q(title__icontains=q)
-                | Q(description__icontains=q)
-                | Q(external_ref__icontains=q)
-                | Q(customer_id__icontains=q)
-                | Q(assigned_to__icontains=q)
-            )
+            # Full-text index when the backend has one, `icontains` scan otherwise.
+            qs = get_search_backend().filter(qs, q, ranked=rank)
     return qs
 
 
-def get_admin_ticket_or_404(*, ticket_id: int) -> Ticket:
-    try:
-        return Ticket.objects.prefetch_related("comments").get(id=ticket_id)
-    except Ticket.DoesNotExist as exc:
-        raise NotFound("Ticket not found") from exc
+def get_admin_ticket_or_404(*, ticket_id: int) -> Ticket | ArchivedTicket:
+    return _get_ticket_detail_or_404(id=ticket_id)
+
+
+def _ticket_version_qs(*, ticket_id: int, customer_email: str | None = None, archived: bool = False) -> QuerySet:
+    qs = (ArchivedTicket if archived else Ticket).objects.filter(id=ticket_id)
+    if customer_email is not None:
+        qs = qs.filter(customer_id=customer_email)
+    return qs.values_list("updated_at", flat=True)
+
+
+def get_ticket_version_or_404(*, ticket_id: int, customer_email: str | None = None) -> datetime:
+    """
+    `updated_at` of a ticket, read with a single-column query.
+
+    Used to answer conditional GETs without loading the ticket or its comments.
+    Pass `customer_email` to scope the lookup to that customer's tickets.
+    Falls back to the archive.
+    """
+    for archived in (False, True):
+        updated_at = _ticket_version_qs(ticket_id=ticket_id, customer_email=customer_email, archived=archived).first()
+        if updated_at is not None:
+            return updated_at
+    raise NotFound("Ticket not found")
+
+
+# Async variants for the ASGI views (tickets/api/async_views.py).
+
+
+async def aget_ticket_version_or_404(*, ticket_id: int, customer_email: str | None = None) -> datetime:
+    for archived in (False, True):
+        qs = _ticket_version_qs(ticket_id=ticket_id, customer_email=customer_email, archived=archived)
+        updated_at = await qs.afirst()
+        if updated_at is not None:
+            return updated_at
+    raise NotFound("Ticket not found")
+
+
+async def _aget_ticket_detail_or_404(**lookup) -> Ticket | ArchivedTicket:
+    for archived in (False, True):
+        try:
+            return await ticket_detail_qs(archived=archived).aget(**lookup)
+        except ObjectDoesNotExist:
+            continue
+    raise NotFound("Ticket not found")
+
+
+async def aget_customer_ticket_or_404(*, ticket_id: int, customer_email: str) -> Ticket | ArchivedTicket:
+    return await _aget_ticket_detail_or_404(id=ticket_id, customer_id=customer_email)
+
 
+async def aget_admin_ticket_or_404(*, ticket_id: int) -> Ticket | ArchivedTicket:
+    return await _aget_ticket_detail_or_404(id=ticket_id)
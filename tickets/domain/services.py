@@ -3,10 +3,17 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
-from tickets.models import Comment, Ticket, TicketAttachment
+from tickets.domain.archive import restore_ticket
+from tickets.domain.blobs import StoredUpload, claim_blob, store_upload
+from tickets.domain.cache import tickets_changed
+from tickets.domain.outbox import emit, emit_many
+from tickets.domain.stats import bucket_key, record_ticket_changed, record_ticket_created, record_tickets_created
+from tickets.domain.writer import serialized_write
+from tickets.models import ArchivedTicket, Comment, IdempotencyKey, Ticket, TicketAttachment, TicketRecord
 
 
 @dataclass(frozen=True, slots=True)
@@ -15,6 +22,13 @@ class CloseResult:
     reason: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class BulkIngestResult:
+    ticket_id: int
+    created: bool
+
+
+@serialized_write
 @transaction.atomic
 def create_customer_ticket(*, customer_email: str, data: dict[str, Any]) -> Ticket:
     ticket = Ticket(
@@ -28,11 +42,57 @@ def create_customer_ticket(*, customer_email: str, data: dict[str, Any]) -> Tick
     )
     ticket.full_clean()
     ticket.save()
+    record_ticket_created(ticket)
+    emit("ticket.created", ticket)
     return ticket
 
 
+def get_idempotent_ticket(idempotency_key: str) -> Ticket | None:
+    hit = IdempotencyKey.objects.select_related("ticket").filter(key=idempotency_key).first()
+    return hit.ticket if hit is not None else None
+
+
+@serialized_write
 @transaction.atomic
-def create_external_ticket(*, data: dict[str, Any]) -> Ticket:
+def create_external_ticket(
+    *,
+    data: dict[str, Any],
+    idempotency_key: str | None = None,
+) -> tuple[Ticket | ArchivedTicket, bool]:
+    """
+    Idempotent ingest keyed on (source, external_ref), like `get_or_create`.
+
+    Returns `(ticket, created)`. A retry (same external_ref, or same
+    Idempotency-Key) returns the existing ticket untouched after one indexed
+    lookup instead of inserting a duplicate.
+    """
+    if idempotency_key:
+        replayed = get_idempotent_ticket(idempotency_key)
+        if replayed is not None:
+            return replayed, False
+
+    ticket, created = _get_or_insert_external_ticket(data)
+    if idempotency_key and not ticket.archived:
+        try:
+            with transaction.atomic():
+                IdempotencyKey.objects.create(key=idempotency_key, ticket=ticket)
+        except IntegrityError:
+            # A concurrent retry with the same key won the race; both point at the same ref.
+            pass
+    return ticket, created
+
+
+def _get_or_insert_external_ticket(data: dict[str, Any]) -> tuple[Ticket | ArchivedTicket, bool]:
+    # One lookup over hot and archived tickets, so a ref re-sent after archival is still a duplicate.
+    existing = (
+        TicketRecord.objects.filter(source=Ticket.Source.EXTERNAL, external_ref=data["external_ref"])
+        .values_list("id", "archived")
+        .first()
+    )
+    if existing is not None:
+        ticket_id, archived = existing
+        return (ArchivedTicket if archived else Ticket).objects.get(id=ticket_id), False
+
     ticket = Ticket(
         source=Ticket.Source.EXTERNAL,
         external_ref=data["external_ref"],
@@ -43,35 +103,153 @@ def create_external_ticket(*, data: dict[str, Any]) -> Ticket:
         category=data.get("category", "general"),
         status=Ticket.Status.OPEN,
     )
-    ticket.full_clean()
-    ticket.save()
-    return ticket
+    # Uniqueness is enforced by the database constraint below, not by an extra query.
+    ticket.full_clean(validate_unique=False, validate_constraints=False)
+    try:
+        with transaction.atomic():
+            ticket.save()
+    except IntegrityError:
+        return Ticket.objects.get(source=Ticket.Source.EXTERNAL, external_ref=data["external_ref"]), False
+    record_ticket_created(ticket)
+    emit("ticket.created", ticket)
+    return ticket, True
 
 
+def bulk_create_external_tickets(*, items: list[dict[str, Any]], chunk_size: int = 500) -> list[BulkIngestResult]:
+    """
+    Insert many already-validated external tickets with `bulk_create`.
+
+    Items whose external_ref already exists (in the DB or earlier in the same
+    batch) are reported as duplicates of that ticket instead of being inserted.
+    Each chunk commits in its own transaction. Returns one result per item, in order.
+    """
+    refs = {item["external_ref"] for item in items}
+    known: dict[str, int] = dict(
+        TicketRecord.objects.filter(source=Ticket.Source.EXTERNAL, external_ref__in=refs)
+        .order_by("-id")
+        .values_list("external_ref", "id")
+    )
+
+    results: list[BulkIngestResult | None] = [None] * len(items)
+    pending: list[tuple[int, Ticket]] = []
+    pending_refs: dict[str, int] = {}
+    for index, data in enumerate(items):
+        ref = data["external_ref"]
+        if ref in known:
+            results[index] = BulkIngestResult(ticket_id=known[ref], created=False)
+            continue
+        if ref in pending_refs:
+            # Resolved to the first occurrence's id once the chunk is inserted.
+            continue
+        pending_refs[ref] = index
+        pending.append(
+            (
+                index,
+                Ticket(
+                    source=Ticket.Source.EXTERNAL,
+                    external_ref=ref,
+                    customer_id=data.get("customer_id"),
+                    title=data["title"],
+                    description=data.get("description", "") or "",
+                    priority=data.get("priority", Ticket.Priority.MEDIUM),
+                    category=data.get("category", "general"),
+                    status=Ticket.Status.OPEN,
+                ),
+            )
+        )
+
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start:start + chunk_size]
+        try:
+            with transaction.atomic():
+                tickets = Ticket.objects.bulk_create([ticket for _, ticket in chunk])
+                record_tickets_created(tickets)
+                emit_many("ticket.created", tickets)
+                # bulk_create skips post_save, so the cache generations are bumped here.
+                tickets_changed()
+            outcomes = [(ticket, True) for ticket in tickets]
+        except IntegrityError:
+            # A concurrent ingest inserted one of these refs after our lookup;
+            # settle this chunk row by row through the idempotent path.
+            outcomes = [create_external_ticket(data=items[index]) for index, _ in chunk]
+        for (index, _), (ticket, created) in zip(chunk, outcomes):
+            known[ticket.external_ref] = ticket.id
+            results[index] = BulkIngestResult(ticket_id=ticket.id, created=created)
+
+    return [
+        result or BulkIngestResult(ticket_id=known[items[index]["external_ref"]], created=False)
+        for index, result in enumerate(results)
+    ]
+
+
+def _touch_ticket(ticket: Ticket, at=None) -> None:
+    """Bump `updated_at` (and the response cache) so ETags / change feeds see comment and attachment writes."""
+    ticket.updated_at = at or timezone.now()
+    Ticket.objects.filter(pk=ticket.pk).update(updated_at=ticket.updated_at)
+    tickets_changed(ticket.pk)
+
+
+@serialized_write
 @transaction.atomic
-def add_comment(*, ticket: Ticket, author: str, role: str, message: str) -> Comment:
+def add_comment(*, ticket: Ticket | ArchivedTicket, author: str, role: str, message: str) -> Comment:
+    if ticket.archived:
+        ticket = restore_ticket(ticket)
     comment = Comment(ticket=ticket, author=author, role=role, message=message)
     comment.full_clean()
     comment.save()
+    # Same instant as the comment, so a feed cursor past the ticket is also past the comment.
+    _touch_ticket(ticket, at=comment.created_at)
+    emit("comment.created", ticket, comment={"id": comment.id, "author": author, "role": role, "message": message})
     return comment
 
 
-@transaction.atomic
-def add_attachments(*, ticket: Ticket, files, uploaded_by: str | None = None) -> list[TicketAttachment]:
+def add_attachments(
+    *,
+    ticket: Ticket | ArchivedTicket,
+    files,
+    uploaded_by: str | None = None,
+) -> list[TicketAttachment]:
     """
     Attach one or more uploaded files to a ticket.
 
     `files` is expected to be an iterable of UploadedFile objects (e.g. request.FILES.getlist()).
+    Identical content is stored once and shared through `AttachmentBlob`. The files
+    are hashed and copied into storage before the write transaction opens.
     """
+    uploads = [store_upload(f) for f in files]
+    return attach_stored_uploads(ticket=ticket, uploads=uploads, uploaded_by=uploaded_by)
+
+
+@serialized_write
+@transaction.atomic
+def attach_stored_uploads(
+    *,
+    ticket: Ticket | ArchivedTicket,
+    uploads: list[StoredUpload],
+    uploaded_by: str | None = None,
+) -> list[TicketAttachment]:
+    """The database half of `add_attachments`: attachment rows for content already in storage."""
+    if ticket.archived:
+        ticket = restore_ticket(ticket)
     attachments: list[TicketAttachment] = []
-    for f in files:
-        attachment = TicketAttachment(ticket=ticket, file=f)
+    for upload in uploads:
+        blob = claim_blob(upload)
+        attachment = TicketAttachment(ticket=ticket, file=blob.file.name, blob=blob, original_name=upload.original_name)
         attachment.full_clean()
         attachment.save()
         attachments.append(attachment)
+    if attachments:
+        _touch_ticket(ticket)
+        for attachment in attachments:
+            emit(
+                "attachment.created",
+                ticket,
+                attachment={"id": attachment.id, "name": attachment.original_name, "size": attachment.blob.size},
+            )
     return attachments
 
 
+@serialized_write
 @transaction.atomic
 def customer_close_ticket(*, ticket: Ticket) -> CloseResult:
     if ticket.status == Ticket.Status.CLOSED:
@@ -83,23 +261,37 @@ def customer_close_ticket(*, ticket: Ticket) -> CloseResult:
             reason="Ticket can be closed by customer only when status=resolved",
         )
 
+    before = bucket_key(ticket)
     ticket.status = Ticket.Status.CLOSED
     ticket.full_clean()
     ticket.save(update_fields=["status", "updated_at"])
+    record_ticket_changed(before, ticket)
+    emit("ticket.closed", ticket)
     return CloseResult(was_closed=True, reason=None)
 
 
+@serialized_write
 @transaction.atomic
-def admin_update_ticket(*, ticket: Ticket, data: dict[str, Any]) -> Ticket:
+def admin_update_ticket(*, ticket: Ticket | ArchivedTicket, data: dict[str, Any]) -> Ticket:
     allowed = {"status", "priority", "category", "assigned_to", "title", "description"}
     unknown = set(data.keys()) - allowed
     if unknown:
         raise ValidationError({"detail": f"Unknown fields: {', '.join(sorted(unknown))}"})
 
+    if ticket.archived:
+        # Reopening or editing an archived ticket makes it hot again.
+        ticket = restore_ticket(ticket)
+
+    before = bucket_key(ticket)
+    previous = {k: getattr(ticket, k) for k in data}
     for k, v in data.items():
         setattr(ticket, k, v)
 
     ticket.full_clean()
     ticket.save()
+    record_ticket_changed(before, ticket)
+    changes = {k: [previous[k], v] for k, v in data.items() if previous[k] != v}
+    if changes:
+        emit("ticket.updated", ticket, changes=changes)
     return ticket
 
@@ -0,0 +1,102 @@
+"""
+Incrementally maintained ticket statistics.
+
+Write services call `record_ticket_created` / `record_ticket_changed` inside
+their transaction; readers aggregate the few `TicketStatsBucket` rows.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from tickets.domain.cache import TICKETS, invalidate_on_commit
+from tickets.models import Ticket, TicketRecord, TicketStatsBucket
+
+
+BUCKET_FIELDS = ("status", "priority", "source", "category")
+
+BucketKey = tuple[str, str, str, str]
+
+
+def bucket_key(ticket) -> BucketKey:
+    return (ticket.status, ticket.priority, ticket.source, ticket.category)
+
+
+def apply_bucket_deltas(deltas: Counter[BucketKey], *, using: str = "default") -> None:
+    for key, delta in deltas.items():
+        if not delta:
+            continue
+        fields = dict(zip(BUCKET_FIELDS, key))
+        buckets = TicketStatsBucket.objects.using(using).filter(**fields)
+        if buckets.update(count=F("count") + delta):
+            continue
+        try:
+            with transaction.atomic(using=using):
+                TicketStatsBucket.objects.using(using).create(**fields, count=delta)
+        except IntegrityError:
+            # Another transaction created the bucket between our update and insert.
+            buckets.update(count=F("count") + delta)
+
+
+def record_tickets_created(tickets: Iterable[Ticket]) -> None:
+    apply_bucket_deltas(Counter(bucket_key(t) for t in tickets))
+
+
+def record_ticket_created(ticket: Ticket) -> None:
+    record_tickets_created([ticket])
+
+
+def record_ticket_changed(before: BucketKey, ticket: Ticket) -> None:
+    after = bucket_key(ticket)
+    if before != after:
+        apply_bucket_deltas(Counter({before: -1, after: 1}))
+
+
+def recount_buckets(*, using: str = "default") -> Counter[BucketKey]:
+    """Full recount over hot and archived tickets, the source of truth the counters are checked against."""
+    rows = TicketRecord.objects.using(using).values(*BUCKET_FIELDS).annotate(c=Count("id")).order_by()
+    return Counter({tuple(row[f] for f in BUCKET_FIELDS): row["c"] for row in rows})
+
+
+def stored_buckets(*, using: str = "default") -> Counter[BucketKey]:
+    rows = TicketStatsBucket.objects.using(using).values_list(*BUCKET_FIELDS, "count")
+    return Counter({tuple(row[:4]): row[4] for row in rows if row[4]})
+
+
+def rebuild_buckets(*, using: str = "default") -> Counter[BucketKey]:
+    with transaction.atomic(using=using):
+        counts = recount_buckets(using=using)
+        TicketStatsBucket.objects.using(using).all().delete()
+        TicketStatsBucket.objects.using(using).bulk_create(
+            TicketStatsBucket(**dict(zip(BUCKET_FIELDS, key)), count=c) for key, c in counts.items()
+        )
+        invalidate_on_commit(TICKETS, using=using)
+    return counts
+
+
+def summarize_buckets(buckets: Iterable[tuple]) -> dict[str, dict[str, int]]:
+    """Fold (status, priority, source, category, count) rows into per-dimension totals."""
+    summary: dict[str, Counter[str]] = {f"by_{field}": Counter() for field in BUCKET_FIELDS}
+    for *key, c in buckets:
+        if not c:
+            continue
+        for field, value in zip(BUCKET_FIELDS, key):
+            summary[f"by_{field}"][value] += c
+    return {name: dict(counts) for name, counts in summary.items()}
+
+
+def bucket_rows_qs():
+    return TicketStatsBucket.objects.values_list(*BUCKET_FIELDS, "count")
+
+
+def ticket_stats_summary() -> dict[str, dict[str, int]]:
+    """Per-dimension totals, computed from the bucket table in O(distinct buckets)."""
+    return summarize_buckets(bucket_rows_qs())
+
+
+async def aticket_stats_summary() -> dict[str, dict[str, int]]:
+    return summarize_buckets([row async for row in bucket_rows_qs()])
@@ -0,0 +1,192 @@
+"""
+Resumable chunked uploads.
+
+A session owns a part file under `TICKET_UPLOAD_DIR`. Numbered chunks are
+streamed from the request body straight onto the end of that file (never held
+in memory whole), and the session row records the committed length. A chunk
+that dies mid-transfer is simply overwritten by its retry. Writes to one session
+are serialized by an advisory lock on its part file. Finalizing stores the
+completed file through the same blob deduplication as multipart uploads.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import os
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import NotFound, ValidationError
+
+from tickets.domain.blobs import store_upload
+from tickets.domain.services import attach_stored_uploads
+from tickets.models import Ticket, TicketAttachment, UploadSession
+
+
+STREAM_READ_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkResult:
+    session: UploadSession
+    accepted: bool
+    reason: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class FinalizeResult:
+    attachment: TicketAttachment | None
+    reason: str | None = None
+
+
+def part_path(session: UploadSession) -> Path:
+    return Path(settings.TICKET_UPLOAD_DIR) / f"{session.id}.part"
+
+
+def _expiry():
+    return timezone.now() + timedelta(seconds=settings.TICKET_UPLOAD_SESSION_TTL)
+
+
+def get_upload_session_or_404(*, session_id, uploaded_by: str) -> UploadSession:
+    try:
+        return UploadSession.objects.get(id=session_id, uploaded_by=uploaded_by, expires_at__gt=timezone.now())
+    except UploadSession.DoesNotExist as exc:
+        raise NotFound("Upload session not found") from exc
+
+
+@transaction.atomic
+def start_upload_session(*, ticket: Ticket, uploaded_by: str, filename: str, size: int) -> UploadSession:
+    if size > settings.TICKET_UPLOAD_MAX_BYTES:
+        raise ValidationError({"size": f"Must be at most {settings.TICKET_UPLOAD_MAX_BYTES} bytes"})
+
+    session = UploadSession.objects.create(
+        ticket=ticket,
+        uploaded_by=uploaded_by,
+        filename=os.path.basename(filename),
+        size=size,
+        expires_at=_expiry(),
+    )
+    path = part_path(session)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+    return session
+
+
+def _out_of_order(session: UploadSession, index: int) -> ChunkResult | None:
+    if session.completed_at is not None:
+        return ChunkResult(session=session, accepted=False, reason="Upload is already finalized")
+    if index < session.next_chunk:
+        return ChunkResult(session=session, accepted=True)
+    if index > session.next_chunk:
+        return ChunkResult(session=session, accepted=False, reason=f"Expected chunk {session.next_chunk}")
+    return None
+
+
+def write_upload_chunk(*, session: UploadSession, index: int, stream, length: int | None) -> ChunkResult:
+    """
+    Append chunk `index` from `stream` (a file-like request body).
+
+    Chunks must arrive in order. Re-sending an already committed chunk is a
+    no-op, so clients can retry blindly after a timeout. Writes to one session
+    hold an exclusive lock on its part file. A second request for the same
+    session gets a 409 while the first is still streaming.
+    """
+    if (result := _out_of_order(session, index)) is not None:
+        return result
+
+    with open(part_path(session), "r+b") as fh:
+        try:
+            # Without it, a stale retry of a committed chunk could truncate the chunks after it.
+            fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return ChunkResult(session=session, accepted=False, reason="Another chunk is being written; retry")
+        # Lock held (released on close): the row now shows every committed chunk.
+        session.refresh_from_db()
+        if (result := _out_of_order(session, index)) is not None:
+            return result
+
+        limit = min(settings.TICKET_UPLOAD_CHUNK_SIZE, session.size - session.received)
+        if length is not None and length > limit:
+            raise ValidationError({"detail": f"Chunk must be at most {limit} bytes"})
+
+        offset = session.received
+        written = 0
+        fh.seek(offset)
+        while data := stream.read(STREAM_READ_SIZE):
+            written += len(data)
+            if written > limit:
+                raise ValidationError({"detail": f"Chunk must be at most {limit} bytes"})
+            fh.write(data)
+        # Drop whatever a previous, interrupted attempt of this chunk left past the end.
+        fh.truncate(offset + written)
+        fh.flush()
+
+        progress = {"next_chunk": index + 1, "received": offset + written, "expires_at": _expiry()}
+        committed = UploadSession.objects.filter(pk=session.pk, next_chunk=index, received=offset).update(**progress)
+    if committed:
+        for field, value in progress.items():
+            setattr(session, field, value)
+        return ChunkResult(session=session, accepted=True)
+    # Only reachable where the file lock is not honoured (e.g. some network filesystems).
+    session.refresh_from_db()
+    if session.next_chunk <= index:
+        return ChunkResult(session=session, accepted=False, reason=f"Expected chunk {session.next_chunk}")
+    return ChunkResult(session=session, accepted=True)
+
+
+def _incomplete(session: UploadSession) -> FinalizeResult | None:
+    if session.completed_at is not None:
+        return FinalizeResult(attachment=session.attachment)
+    if session.received != session.size:
+        return FinalizeResult(
+            attachment=None,
+            reason=f"Upload incomplete: received {session.received} of {session.size} bytes",
+        )
+    return None
+
+
+def finalize_upload_session(*, session: UploadSession) -> FinalizeResult:
+    """
+    Attach the completed part file to the session's ticket.
+
+    The file is hashed and copied into blob storage before any transaction
+    opens (hash pass and copy). Only the rows are written under the session
+    lock, so a large upload does not hold the database write lock meanwhile.
+    """
+    if (result := _incomplete(session)) is not None:
+        return result
+
+    path = part_path(session)
+    # The part file stays open until the rows are written: `claim_blob` may have to copy it again.
+    with open(path, "rb") as fh:
+        upload = store_upload(UploadedFile(file=fh, name=session.filename, size=session.size))
+
+        with transaction.atomic():
+            session = UploadSession.objects.select_for_update().select_related("ticket").get(pk=session.pk)
+            if (result := _incomplete(session)) is not None:
+                # A concurrent finalize won; the content it stored is the same blob.
+                return result
+            (attachment,) = attach_stored_uploads(
+                ticket=session.ticket, uploads=[upload], uploaded_by=session.uploaded_by
+            )
+            session.attachment = attachment
+            session.completed_at = timezone.now()
+            session.save(update_fields=["attachment", "completed_at"])
+            transaction.on_commit(lambda: path.unlink(missing_ok=True))
+    return FinalizeResult(attachment=attachment)
+
+
+def purge_expired_upload_sessions(*, now=None) -> int:
+    """Delete expired sessions (finished or not) and their part files; returns how many."""
+    expired = UploadSession.objects.filter(expires_at__lte=now or timezone.now())
+    purged = 0
+    for session in expired.iterator():
+        part_path(session).unlink(missing_ok=True)
+        session.delete()
+        purged += 1
+    return purged
@@ -0,0 +1,127 @@
+"""
+Single-writer queue for service-layer writes.
+
+SQLite lets one connection write at a time, so concurrent writers mostly spend
+their time waiting for the lock, and each pays for its own commit. With
+TICKET_WRITE_QUEUE on, services decorated with `@serialized_write` are handed
+to one writer thread per process instead of running on the caller's
+connection. The thread takes everything that has queued up, up to
+TICKET_WRITE_QUEUE_BATCH calls, and runs them in one transaction with a
+savepoint per call. A failing call therefore rolls back alone, and the others
+share a single commit. The caller blocks until that commit, then gets the
+call's return value or exception. Commit hooks (outbox relay, cache
+invalidation, live events) run on the writer thread after the commit.
+
+Calls made inside an open transaction run inline on the caller's connection,
+because they must see and join that transaction. This covers a service
+calling another service, and TestCase.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import queue
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Job:
+    __slots__ = ("fn", "args", "kwargs", "done", "result", "error")
+
+    def __init__(self, fn, args, kwargs):
+        self.fn, self.args, self.kwargs = fn, args, kwargs
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class WriteQueue:
+    def __init__(self, *, batch_size: int):
+        self.batch_size = batch_size
+        self.batches = 0
+        self.jobs = 0
+        self._queue: queue.SimpleQueue[_Job] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Run `fn(*args, **kwargs)` on the writer thread and return its result once committed."""
+        job = _Job(fn, args, kwargs)
+        self._ensure_started()
+        self._queue.put(job)
+        job.done.wait()
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ticket-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._execute(batch)
+
+    def _execute(self, batch: list[_Job]) -> None:
+        close_old_connections()
+        committed = False
+
+        def mark_committed():
+            nonlocal committed
+            committed = True
+
+        try:
+            with transaction.atomic():
+                transaction.on_commit(mark_committed)  # registered first, so it runs first
+                for job in batch:
+                    try:
+                        with transaction.atomic():
+                            job.result = job.fn(*job.args, **job.kwargs)
+                    except Exception as exc:
+                        job.error = exc
+        except Exception as exc:
+            if committed:
+                # The data is in; a non-robust commit hook failed after it.
+                logger.exception("Commit hook failed after a write queue batch")
+            else:
+                for job in batch:
+                    if job.error is None:
+                        job.error = exc
+        finally:
+            self.batches += 1
+            self.jobs += len(batch)
+            for job in batch:
+                job.done.set()
+
+
+@functools.cache
+def get_write_queue() -> WriteQueue:
+    return WriteQueue(batch_size=settings.TICKET_WRITE_QUEUE_BATCH)
+
+
+def serialized_write(fn):
+    """Route a service through the write queue when TICKET_WRITE_QUEUE is on and no transaction is open."""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not settings.TICKET_WRITE_QUEUE or transaction.get_connection().in_atomic_block:
+            return fn(*args, **kwargs)
+        return get_write_queue().submit(fn, *args, **kwargs)
+
+    return wrapper
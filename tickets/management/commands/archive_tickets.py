@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from tickets.domain.archive import archive_closed_tickets
+
+
+class Command(BaseCommand):
+    help = "Move closed tickets (with comments and attachments) older than --days to the archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=None, help="Default: TICKET_ARCHIVE_AFTER_DAYS.")
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--pause", type=float, default=None, help="Seconds to sleep between batches.")
+        parser.add_argument("--max-batches", type=int, default=0, help="Stop after this many batches (0 = all).")
+
+    def handle(self, *args, **options):
+        result = archive_closed_tickets(
+            days=options["days"],
+            batch_size=options["batch_size"],
+            pause=options["pause"],
+            max_batches=options["max_batches"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {result.tickets} ticket(s), {result.comments} comment(s), "
+                f"{result.attachments} attachment(s) in {result.batches} batch(es)"
+            )
+        )
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tickets.domain.export import EXPORT_FORMATS, export_tickets
+from tickets.domain.selectors import admin_ticket_qs
+
+
+class Command(BaseCommand):
+    help = "Stream tickets matching the admin list filters as NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", dest="fmt", choices=sorted(EXPORT_FORMATS), default="ndjson")
+        parser.add_argument("--output", "-o", help="File to write to (default: stdout)")
+        parser.add_argument("--include-comments", action="store_true")
+        parser.add_argument("--chunk-size", type=int, default=settings.TICKET_EXPORT_CHUNK_SIZE)
+        for name in ("status", "priority", "category", "assigned_to", "source", "q"):
+            parser.add_argument(f"--{name.replace('_', '-')}", dest=name)
+
+    def handle(self, *args, **options):
+        qs = admin_ticket_qs(
+            **{name: options[name] for name in ("status", "priority", "category", "assigned_to", "source", "q")}
+        )
+        chunks = export_tickets(
+            qs,
+            fmt=options["fmt"],
+            chunk_size=options["chunk_size"],
+            include_comments=options["include_comments"],
+        )
+        if options["output"]:
+            with open(options["output"], "w", newline="") as fh:
+                fh.writelines(chunks)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
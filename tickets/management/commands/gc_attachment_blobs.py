@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from tickets.domain.blobs import collect_unreferenced_blobs, recount_blob_refs, sweep_orphan_blob_files
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete attachment blobs (rows and stored files) that no attachment references, "
+        "and blob files left without a row by rolled-back uploads."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report what would be deleted without deleting.")
+        parser.add_argument(
+            "--recount",
+            action="store_true",
+            help="Recompute reference counts from the attachments table before collecting.",
+        )
+        parser.add_argument(
+            "--grace",
+            type=int,
+            default=None,
+            help="Keep row-less blob files younger than this many seconds (default: TICKET_BLOB_ORPHAN_GRACE).",
+        )
+
+    def handle(self, *args, **options):
+        if options["recount"]:
+            fixed = recount_blob_refs()
+            self.stdout.write(f"Corrected {fixed} blob reference count(s)")
+
+        result = collect_unreferenced_blobs(dry_run=options["dry_run"])
+        verb = "Would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} {result.deleted} unreferenced blob(s), {result.freed_bytes} bytes")
+        )
+        swept = sweep_orphan_blob_files(grace=options["grace"], dry_run=options["dry_run"])
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} {swept.deleted} orphaned blob file(s), {swept.freed_bytes} bytes")
+        )
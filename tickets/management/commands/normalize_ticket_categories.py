@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tickets.domain.categories import apply_category_fix, category_index, plan_category_backfill
+from tickets.domain.stats import rebuild_buckets
+
+
+class Command(BaseCommand):
+    help = (
+        "Rewrite free-text ticket categories to Category names (case/whitespace, then closest match), "
+        "in batched updates, and rebuild the stats counters."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only print the planned mapping.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--fallback",
+            default=None,
+            help="Category for values with no close match (default: leave them unchanged).",
+        )
+        parser.add_argument(
+            "--cutoff",
+            type=float,
+            default=0.8,
+            help="Similarity (0-1) a value needs to map to the closest category name.",
+        )
+
+    def handle(self, *args, **options):
+        fallback = options["fallback"]
+        if fallback is not None:
+            fallback = category_index.resolve(fallback)
+            if fallback is None:
+                raise CommandError(f"--fallback must be an existing category, not {options['fallback']!r}")
+
+        fixes = plan_category_backfill(fallback=fallback, cutoff=options["cutoff"])
+        for fix in fixes:
+            target = repr(fix.target) if fix.target is not None else "unchanged"
+            self.stdout.write(f"{fix.source!r} -> {target} ({fix.tickets} tickets)")
+        if options["dry_run"]:
+            return
+
+        updated = sum(apply_category_fix(fix, batch_size=options["batch_size"]) for fix in fixes)
+        if updated:
+            # Category is a stats bucket dimension; recount rather than replaying per-ticket deltas.
+            rebuild_buckets()
+        self.stdout.write(self.style.SUCCESS(f"Normalized {updated} ticket(s)"))
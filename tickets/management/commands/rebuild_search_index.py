@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from tickets.domain.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Install (if missing) and rebuild the ticket full-text search index."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        backend = get_search_backend()
+        backend.install(connections[using])
+        backend.rebuild(using=using)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search index with {type(backend).__name__}"))
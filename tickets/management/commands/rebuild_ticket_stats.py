@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from tickets.domain.stats import BUCKET_FIELDS, rebuild_buckets, recount_buckets, stored_buckets
+
+
+class Command(BaseCommand):
+    help = "Rebuild the ticket stats counters from a full recount, or verify them with --check."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only compare counters against a full recount; exit non-zero on drift.",
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        if not options["check"]:
+            counts = rebuild_buckets(using=using)
+            self.stdout.write(
+                self.style.SUCCESS(f"Rebuilt {len(counts)} buckets covering {sum(counts.values())} tickets")
+            )
+            return
+
+        expected = recount_buckets(using=using)
+        actual = stored_buckets(using=using)
+        drift = {key for key in expected.keys() | actual.keys() if expected[key] != actual[key]}
+        for key in sorted(drift):
+            label = ", ".join(f"{f}={v}" for f, v in zip(BUCKET_FIELDS, key))
+            self.stdout.write(f"{label}: stored={actual[key]} actual={expected[key]}")
+        if drift:
+            raise CommandError(f"{len(drift)} stats bucket(s) drifted; run rebuild_ticket_stats to fix")
+        self.stdout.write(self.style.SUCCESS("Stats counters match a full recount"))
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tickets.domain.outbox import get_outbox_sinks, prune_outbox, relay_outbox
+
+
+class Command(BaseCommand):
+    help = "Deliver pending ticket outbox events to the configured sinks (once, or continuously with --loop)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--loop", action="store_true", help="Keep relaying until interrupted.")
+        parser.add_argument("--interval", type=float, default=2.0, help="Seconds between rounds with --loop.")
+
+    def handle(self, *args, **options):
+        if not get_outbox_sinks():
+            raise CommandError("No outbox sinks configured (settings.TICKET_OUTBOX_SINKS)")
+
+        while True:
+            for result in relay_outbox(batch_size=options["batch_size"]):
+                line = f"{result.sink}: delivered {result.delivered}, checkpoint {result.last_event_id}"
+                if result.error:
+                    self.stderr.write(f"{line} (failed: {result.error})")
+                elif result.delivered or not options["loop"]:
+                    self.stdout.write(line)
+            prune_outbox()
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,80 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from tickets.domain.seed import DEFAULT_STATUS_WEIGHTS, SeedSpec, seed_tickets
+from tickets.models import Ticket
+
+
+def parse_weights(value: str) -> dict[str, float]:
+    weights = {}
+    for part in value.split(","):
+        name, sep, weight = part.partition("=")
+        name = name.strip()
+        if not sep or name not in Ticket.Status.values:
+            raise CommandError(f"--status-weights: expected status=weight pairs, got {part!r}")
+        try:
+            weights[name] = float(weight)
+        except ValueError:
+            raise CommandError(f"--status-weights: {weight!r} is not a number") from None
+    if not any(weights.values()):
+        raise CommandError("--status-weights: at least one weight must be positive")
+    return weights
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-generate synthetic tickets, comments and attachments (skewed across customers, "
+        "categories and statuses) for load testing. Writes into the configured database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tickets", type=int, default=10_000)
+        parser.add_argument("--customers", type=int, default=1000)
+        parser.add_argument("--customer-skew", type=float, default=1.1, help="Zipf exponent; 0 = uniform.")
+        parser.add_argument("--category-skew", type=float, default=1.0, help="Zipf exponent over Category rows.")
+        parser.add_argument(
+            "--status-weights",
+            type=parse_weights,
+            default=dict(DEFAULT_STATUS_WEIGHTS),
+            help="e.g. open=35,in_progress=20,resolved=25,closed=20",
+        )
+        parser.add_argument("--comments", type=float, default=3.0, help="Mean comments per ticket.")
+        parser.add_argument("--attachments", type=float, default=0.1, help="Share of tickets with an attachment.")
+        parser.add_argument("--external-ratio", type=float, default=0.3)
+        parser.add_argument("--days", type=int, default=365, help="Spread created_at over this many days.")
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--chunk-size", type=int, default=5000, help="Tickets per bulk_create transaction.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        if options["tickets"] < 0 or options["customers"] < 1 or options["chunk_size"] < 1:
+            raise CommandError("--tickets must be >= 0, --customers and --chunk-size >= 1")
+        spec = SeedSpec(
+            tickets=options["tickets"],
+            customers=options["customers"],
+            customer_skew=options["customer_skew"],
+            category_skew=options["category_skew"],
+            status_weights=options["status_weights"],
+            comments_per_ticket=options["comments"],
+            attachment_ratio=options["attachments"],
+            external_ratio=options["external_ratio"],
+            days=options["days"],
+            seed=options["seed"],
+        )
+
+        def progress(done, total):
+            if options["verbosity"] >= 2 or done == total:
+                self.stdout.write(f"  {done}/{total} tickets")
+
+        started = time.monotonic()
+        result = seed_tickets(spec, chunk_size=options["chunk_size"], using=options["database"], progress=progress)
+        elapsed = time.monotonic() - started
+        rows = result.tickets + result.comments + result.attachments
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {result.tickets} tickets, {result.comments} comments and {result.attachments} attachments "
+                f"in {elapsed:.1f}s ({rows / max(elapsed, 1e-9):.0f} rows/s)"
+            )
+        )
@@ -0,0 +1,53 @@
+from django.db import migrations
+
+
+# Frozen copy of what SQLiteFTS5SearchBackend.install() created when this migration was written,
+# so later changes to the backend do not rewrite history.
+COLUMNS = "title, description, external_ref, customer_id, assigned_to"
+NEW = "new.title, new.description, new.external_ref, new.customer_id, new.assigned_to"
+OLD = "old.title, old.description, old.external_ref, old.customer_id, old.assigned_to"
+
+CREATE_SQL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tickets_ticket_fts USING fts5("
+    f"{COLUMNS}, content='tickets_ticket', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS tickets_ticket_fts_ai AFTER INSERT ON tickets_ticket BEGIN "
+    f"INSERT INTO tickets_ticket_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW}); END",
+    "CREATE TRIGGER IF NOT EXISTS tickets_ticket_fts_ad AFTER DELETE ON tickets_ticket BEGIN "
+    f"INSERT INTO tickets_ticket_fts(tickets_ticket_fts, rowid, {COLUMNS}) VALUES ('delete', old.id, {OLD}); END",
+    f"CREATE TRIGGER IF NOT EXISTS tickets_ticket_fts_au AFTER UPDATE OF {COLUMNS} ON tickets_ticket BEGIN "
+    f"INSERT INTO tickets_ticket_fts(tickets_ticket_fts, rowid, {COLUMNS}) VALUES ('delete', old.id, {OLD}); "
+    f"INSERT INTO tickets_ticket_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW}); END",
+    "INSERT INTO tickets_ticket_fts(tickets_ticket_fts) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS tickets_ticket_fts_ai",
+    "DROP TRIGGER IF EXISTS tickets_ticket_fts_ad",
+    "DROP TRIGGER IF EXISTS tickets_ticket_fts_au",
+    "DROP TABLE IF EXISTS tickets_ticket_fts",
+]
+
+
+def install_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for sql in CREATE_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0003_alter_ticket_category'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search_index, drop_search_index),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.3 on 2026-10-17 10:12
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_buckets(apps, schema_editor):
+    Ticket = apps.get_model("tickets", "Ticket")
+    TicketStatsBucket = apps.get_model("tickets", "TicketStatsBucket")
+    db = schema_editor.connection.alias
+
+    fields = ("status", "priority", "source", "category")
+    rows = Ticket.objects.using(db).values(*fields).annotate(c=Count("id")).order_by()
+    TicketStatsBucket.objects.using(db).bulk_create(
+        TicketStatsBucket(count=row.pop("c"), **row) for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0004_ticket_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketStatsBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(max_length=20)),
+                ('priority', models.CharField(max_length=10)),
+                ('source', models.CharField(max_length=20)),
+                ('category', models.CharField(max_length=50)),
+                ('count', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('status', 'priority', 'source', 'category'), name='uniq_ticket_stats_bucket')],
+            },
+        ),
+        migrations.RunPython(populate_buckets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.1.3 on 2026-10-17 10:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def dedupe_external_refs(apps, schema_editor):
+    """
+    Collapse duplicate (source, external_ref) tickets onto the oldest one.
+
+    Comments and attachments of the duplicates are moved to the survivor before
+    the duplicates are deleted, then the stats buckets are recounted.
+    """
+    Ticket = apps.get_model("tickets", "Ticket")
+    Comment = apps.get_model("tickets", "Comment")
+    TicketAttachment = apps.get_model("tickets", "TicketAttachment")
+    TicketStatsBucket = apps.get_model("tickets", "TicketStatsBucket")
+    db = schema_editor.connection.alias
+
+    groups = (
+        Ticket.objects.using(db)
+        .filter(external_ref__isnull=False)
+        .values("source", "external_ref")
+        .annotate(n=Count("id"), keep=Min("id"))
+        .filter(n__gt=1)
+        .order_by()
+    )
+    removed = 0
+    for group in groups:
+        duplicates = list(
+            Ticket.objects.using(db)
+            .filter(source=group["source"], external_ref=group["external_ref"])
+            .exclude(id=group["keep"])
+            .values_list("id", flat=True)
+        )
+        Comment.objects.using(db).filter(ticket_id__in=duplicates).update(ticket_id=group["keep"])
+        TicketAttachment.objects.using(db).filter(ticket_id__in=duplicates).update(ticket_id=group["keep"])
+        Ticket.objects.using(db).filter(id__in=duplicates).delete()
+        removed += len(duplicates)
+
+    if removed:
+        fields = ("status", "priority", "source", "category")
+        rows = Ticket.objects.using(db).values(*fields).annotate(c=Count("id")).order_by()
+        TicketStatsBucket.objects.using(db).all().delete()
+        TicketStatsBucket.objects.using(db).bulk_create(
+            TicketStatsBucket(count=row.pop("c"), **row) for row in rows
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0005_ticketstatsbucket'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_external_refs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='ticket',
+            constraint=models.UniqueConstraint(condition=models.Q(('external_ref__isnull', False)), fields=('source', 'external_ref'), name='uniq_ticket_source_external_ref'),
+        ),
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('ticket', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='idempotency_keys', to='tickets.ticket')),
+            ],
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.3 on 2026-10-17 10:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0010_outbox'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['updated_at', 'id'], name='tickets_tic_updated_a117e3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['customer_id', 'updated_at', 'id'], name='tickets_tic_custome_1d4eb7_idx'),
+        ),
+    ]
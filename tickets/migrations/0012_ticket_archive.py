@@ -0,0 +1,87 @@
+# Generated by Django 5.1.3 on 2026-10-17 11:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0011_ticket_updated_at_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketRecord',
+            fields=[
+                ('source', models.CharField(choices=[('customer', 'Customer'), ('external', 'External')], max_length=20)),
+                ('external_ref', models.CharField(blank=True, max_length=120, null=True)),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('priority', models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High')], default='medium', max_length=10)),
+                ('status', models.CharField(choices=[('open', 'Open'), ('in_progress', 'In progress'), ('resolved', 'Resolved'), ('closed', 'Closed')], default='open', max_length=20)),
+                ('category', models.CharField(default='general', max_length=50)),
+                ('customer_id', models.EmailField(blank=True, max_length=254, null=True)),
+                ('assigned_to', models.EmailField(blank=True, max_length=254, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('archived', models.BooleanField()),
+            ],
+            options={
+                'db_table': 'tickets_ticketrecord',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedTicket',
+            fields=[
+                ('source', models.CharField(choices=[('customer', 'Customer'), ('external', 'External')], max_length=20)),
+                ('external_ref', models.CharField(blank=True, max_length=120, null=True)),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('priority', models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High')], default='medium', max_length=10)),
+                ('status', models.CharField(choices=[('open', 'Open'), ('in_progress', 'In progress'), ('resolved', 'Resolved'), ('closed', 'Closed')], default='open', max_length=20)),
+                ('category', models.CharField(default='general', max_length=50)),
+                ('customer_id', models.EmailField(blank=True, max_length=254, null=True)),
+                ('assigned_to', models.EmailField(blank=True, max_length=254, null=True)),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['customer_id', 'created_at'], name='tickets_arc_custome_ee1a05_idx'), models.Index(fields=['source', 'external_ref'], name='tickets_arc_source_1ba7bb_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedComment',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('author', models.CharField(max_length=200)),
+                ('role', models.CharField(choices=[('customer', 'Customer'), ('admin', 'Admin')], max_length=20)),
+                ('message', models.TextField()),
+                ('created_at', models.DateTimeField()),
+                ('ticket', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='tickets.archivedticket')),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['ticket', 'created_at'], name='tickets_arc_ticket__7ddd5c_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedAttachment',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('file', models.FileField(upload_to='attachments/%Y/%m/%d/')),
+                ('original_name', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField()),
+                ('blob', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='archived_attachments', to='tickets.attachmentblob')),
+                ('ticket', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attachments', to='tickets.archivedticket')),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['ticket', 'created_at'], name='tickets_arc_ticket__90e68e_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def clear_missing_ticket_ids(apps, schema_editor):
+    # Going back to the foreign key: jobs of archived tickets would violate it.
+    IngestJob = apps.get_model('tickets', 'IngestJob')
+    Ticket = apps.get_model('tickets', 'Ticket')
+    IngestJob.objects.exclude(ticket_id=None).exclude(
+        ticket_id__in=Ticket.objects.values('id'),
+    ).update(ticket_id=None)
+
+
+class Migration(migrations.Migration):
+    """
+    IngestJob.ticket becomes a plain `ticket_id` column, so archiving a ticket no
+    longer nulls out the job's result. The column and its values stay; only the
+    foreign key constraint and index are dropped.
+    """
+
+    dependencies = [
+        ('tickets', '0012_ticket_archive'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ingestjob',
+            name='ticket',
+            field=models.ForeignKey(blank=True, db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='tickets.ticket'),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveField(
+                    model_name='ingestjob',
+                    name='ticket',
+                ),
+                migrations.AddField(
+                    model_name='ingestjob',
+                    name='ticket_id',
+                    field=models.BigIntegerField(blank=True, null=True),
+                ),
+            ],
+        ),
+        migrations.RunPython(migrations.RunPython.noop, clear_missing_ticket_ids),
+    ]
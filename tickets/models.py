@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 
 
@@ -11,7 +13,9 @@ class Category(models.Model):
         return self.name
 
 
-class Ticket(models.Model):
+class TicketFields(models.Model):
+    """Columns shared by the hot `Ticket` table, its archive and the `TicketRecord` view over both."""
+
     class Source(models.TextChoices):
         CUSTOMER = "customer", "Customer"
         EXTERNAL = "external", "External"
@@ -54,6 +58,17 @@ class Ticket(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        abstract = True
+
+    def __str__(self) -> str:
+        return f"#{self.pk} [{self.status}] {self.title}"
+
+
+class Ticket(TicketFields):
+    # True on ArchivedTicket: code handed either kind of ticket can tell them apart.
+    archived = False
+
     class Meta:
         indexes = [
             models.Index(fields=["status", "priority"]),
@@ -62,6 +77,17 @@ class Ticket(models.Model):
             models.Index(fields=["source"]),
             models.Index(fields=["customer_id"]),
             models.Index(fields=["created_at"]),
+            # Change feeds: keyset scans over (updated_at, id), globally and per customer.
+            models.Index(fields=["updated_at", "id"]),
+            models.Index(fields=["customer_id", "updated_at", "id"]),
+        ]
+        constraints = [
+            # One ticket per upstream reference; also the index behind ref lookups.
+            models.UniqueConstraint(
+                fields=["source", "external_ref"],
+                condition=models.Q(external_ref__isnull=False),
+                name="uniq_ticket_source_external_ref",
+            ),
         ]
 
     def clean(self):
@@ -71,9 +97,6 @@ class Ticket(models.Model):
         if self.source == self.Source.EXTERNAL and not self.external_ref:
             raise ValidationError({"external_ref": "external_ref is required when source=external"})
 
-    def __str__(self) -> str:
-        return f"#{self.pk} [{self.status}] {self.title}"
-
 
 class Comment(models.Model):
     class Role(models.TextChoices):
@@ -97,9 +120,37 @@ class Comment(models.Model):
         return f"Comment #{self.pk} on Ticket #{self.ticket_id}"
 
 
+class AttachmentBlob(models.Model):
+    """
+    One stored copy of a unique attachment body, addressed by its SHA-256.
+
+    `ref_count` is the number of `TicketAttachment` and `ArchivedAttachment` rows
+    pointing at the blob; blobs at zero are removed by `manage.py gc_attachment_blobs`.
+    """
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to="blobs/")
+    size = models.BigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"{self.sha256[:12]} ({self.size} bytes, {self.ref_count} refs)"
+
+
 class TicketAttachment(models.Model):
     ticket = models.ForeignKey(Ticket, on_delete=models.CASCADE, related_name="attachments")
+    # Points at the blob's file for deduplicated uploads; attachments created before
+    # content-addressed storage keep their own file and have no blob.
     file = models.FileField(upload_to="attachments/%Y/%m/%d/")
+    blob = models.ForeignKey(
+        AttachmentBlob,
+        on_delete=models.PROTECT,
+        related_name="attachments",
+        null=True,
+        blank=True,
+    )
+    original_name = models.CharField(max_length=255, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -112,3 +163,216 @@ class TicketAttachment(models.Model):
         return f"Attachment #{self.pk} on Ticket #{self.ticket_id}"
 
 
+class UploadSession(models.Model):
+    """
+    A resumable chunked upload of one attachment.
+
+    Chunks are appended in order to a part file under `TICKET_UPLOAD_DIR`;
+    `received` / `next_chunk` record how far the upload got, so a client can
+    resume after a dropped connection. Finalizing attaches the file to the ticket.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    ticket = models.ForeignKey(Ticket, on_delete=models.CASCADE, related_name="upload_sessions")
+    uploaded_by = models.CharField(max_length=255)
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    received = models.BigIntegerField(default=0)
+    next_chunk = models.PositiveIntegerField(default=0)
+    attachment = models.ForeignKey(
+        TicketAttachment,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"Upload {self.id} ({self.received}/{self.size} bytes) for Ticket #{self.ticket_id}"
+
+
+class IdempotencyKey(models.Model):
+    """Maps a client-supplied `Idempotency-Key` header to the ticket it produced."""
+
+    key = models.CharField(max_length=255, unique=True)
+    ticket = models.ForeignKey(Ticket, on_delete=models.CASCADE, related_name="idempotency_keys")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"{self.key} -> Ticket #{self.ticket_id}"
+
+
+class IngestJob(models.Model):
+    """
+    A validated external ingest payload waiting for (or done with) the Celery worker.
+
+    `POST /external/tickets` in async mode stores the job and answers 202; the
+    `drain_ingest_jobs` task claims queued jobs in micro-batches and bulk-inserts them.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        PROCESSING = "processing", "Processing"
+        SUCCEEDED = "succeeded", "Succeeded"
+        FAILED = "failed", "Failed"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    payload = models.JSONField()
+    idempotency_key = models.CharField(max_length=255, unique=True, null=True, blank=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.QUEUED)
+    claim = models.UUIDField(null=True, blank=True)
+    # A plain id, not a foreign key: the ticket may move to the archive (and back) under the same id.
+    ticket_id = models.BigIntegerField(null=True, blank=True)
+    created = models.BooleanField(null=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["claim"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"IngestJob {self.id} [{self.status}]"
+
+
+class TicketStatsBucket(models.Model):
+    """
+    Denormalized ticket count per (status, priority, source, category).
+
+    Maintained by the write services in the same transaction as the ticket
+    change, so `/admin/tickets/stats` reads a handful of rows instead of
+    scanning `tickets_ticket`.
+    """
+
+    status = models.CharField(max_length=20)
+    priority = models.CharField(max_length=10)
+    source = models.CharField(max_length=20)
+    category = models.CharField(max_length=50)
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["status", "priority", "source", "category"],
+                name="uniq_ticket_stats_bucket",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.status}/{self.priority}/{self.source}/{self.category}: {self.count}"
+
+
+class OutboxEvent(models.Model):
+    """
+    A ticket change, written in the same transaction as the change itself.
+
+    Ids are the delivery order; `tickets.domain.outbox.relay_outbox` hands
+    events to each configured sink in id order and records progress in
+    `OutboxCheckpoint`.
+    """
+
+    event_type = models.CharField(max_length=50)
+    ticket_id = models.BigIntegerField(db_index=True)
+    payload = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self) -> str:
+        return f"#{self.pk} {self.event_type} (Ticket #{self.ticket_id})"
+
+
+class OutboxCheckpoint(models.Model):
+    """Last outbox event id a sink has acknowledged."""
+
+    sink = models.CharField(max_length=100, unique=True)
+    last_event_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.sink} @ {self.last_event_id}"
+
+
+class ArchivedTicket(TicketFields):
+    """
+    A closed ticket moved out of `tickets_ticket` by `tickets.domain.archive.archive_closed_tickets`.
+
+    Keeps the ticket's id and timestamps. Comments and attachments move with it.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    archived = True
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["customer_id", "created_at"]),
+            models.Index(fields=["source", "external_ref"]),
+        ]
+
+
+class ArchivedComment(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    ticket = models.ForeignKey(ArchivedTicket, on_delete=models.CASCADE, related_name="comments")
+    author = models.CharField(max_length=200)
+    role = models.CharField(max_length=20, choices=Comment.Role.choices)
+    message = models.TextField()
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["ticket", "created_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"Archived comment #{self.pk} on Ticket #{self.ticket_id}"
+
+
+class ArchivedAttachment(models.Model):
+    """An archived ticket's attachment; it keeps its counted reference to the blob (see AttachmentBlob)."""
+
+    id = models.BigIntegerField(primary_key=True)
+    ticket = models.ForeignKey(ArchivedTicket, on_delete=models.CASCADE, related_name="attachments")
+    file = models.FileField(upload_to="attachments/%Y/%m/%d/")
+    blob = models.ForeignKey(
+        AttachmentBlob,
+        on_delete=models.PROTECT,
+        related_name="archived_attachments",
+        null=True,
+        blank=True,
+    )
+    original_name = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["ticket", "created_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"Archived attachment #{self.pk} on Ticket #{self.ticket_id}"
+
+
+class TicketRecord(TicketFields):
+    """
+    Read-only view over hot and archived tickets (`UNION ALL`), for lists that must include both.
+
+    Created after every migrate by `tickets.domain.archive.install_ticket_record_view`.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    archived = models.BooleanField()
+
+    class Meta:
+        managed = False
+        db_table = "tickets_ticketrecord"
@@ -1,7 +1,17 @@
-from django.db.models.signals import post_migrate
+from django.core.signals import request_finished
+from django.db import connections, transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_migrate
 from django.dispatch import receiver
 
-from .models import Category
+from .domain.archive import drop_ticket_record_view, install_ticket_record_view
+from .domain.blobs import release_blob
+from .domain.cache import CATEGORIES, invalidate_on_commit, tickets_changed
+from .domain.categories import category_index
+from .domain.metrics import install_query_recording
+from .domain.routing import end_read_scope
+from .domain.search import get_search_backend
+from .models import Category, Ticket, TicketAttachment
 
 
 @receiver(post_migrate)
@@ -18,3 +28,68 @@ def create_default_categories(sender, **kwargs):
     for name in ["billing", "technical", "general"]:
         Category.objects.get_or_create(name=name)
 
+
+@receiver(post_migrate)
+def ensure_search_index(sender, using="default", **kwargs):
+    """
+    Re-install search index structures after migrations.
+
+    SQLite drops triggers whenever a migration remakes `tickets_ticket`, so the
+    index is re-attached (and rebuilt if it lost its triggers) after every migrate.
+    """
+    if sender.name != "tickets":
+        return
+
+    get_search_backend().install(connections[using])
+
+
+@receiver(pre_migrate)
+def drop_ticket_record_view_before_migrate(sender, using="default", **kwargs):
+    """Migrations may rebuild `tickets_ticket`; the view over it is recreated afterwards."""
+    if sender.name != "tickets":
+        return
+
+    drop_ticket_record_view(connections[using])
+
+
+@receiver(post_migrate)
+def ensure_ticket_record_view(sender, using="default", **kwargs):
+    """(Re)create the hot + archive `TicketRecord` view (see tickets.domain.archive)."""
+    if sender.name != "tickets":
+        return
+
+    install_ticket_record_view(connections[using])
+
+
+@receiver(post_delete, sender=TicketAttachment)
+def release_attachment_blob(sender, instance, **kwargs):
+    """Drop the attachment's reference to its blob (also fires for ticket cascades)."""
+    if instance.blob_id is not None:
+        release_blob(instance.blob_id)
+
+
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+def invalidate_ticket_responses(sender, instance, **kwargs):
+    """Any ticket row write (services, Django admin, shell) invalidates cached reads of it."""
+    tickets_changed(instance.pk)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_responses(sender, using="default", **kwargs):
+    """Bumps the shared `categories` generation and drops this process's category index."""
+    invalidate_on_commit(CATEGORIES, using=using)
+    transaction.on_commit(category_index.invalidate, using=using)
+
+
+@receiver(request_finished)
+def close_read_scope(sender, **kwargs):
+    """Send reads back to the primary once the response (including a streamed body) is done."""
+    end_read_scope()
+
+
+@receiver(connection_created)
+def record_connection_queries(sender, connection, **kwargs):
+    """Every connection, in any thread, reports into the active request's query recorder."""
+    install_query_recording(connection)
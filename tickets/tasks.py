@@ -0,0 +1,33 @@
+from celery import shared_task
+
+from tickets.domain.archive import archive_closed_tickets as archive_tickets
+from tickets.domain.ingest import drain_ingest_jobs as drain_jobs
+from tickets.domain.outbox import prune_outbox, relay_outbox as relay_events
+from tickets.domain.uploads import purge_expired_upload_sessions as purge_sessions
+
+
+@shared_task
+def drain_ingest_jobs() -> int:
+    """Bulk-insert queued external ingest jobs; enqueued on commit by async ingest and by beat."""
+    return drain_jobs()
+
+
+@shared_task
+def purge_expired_upload_sessions() -> int:
+    """Scheduled via CELERY_BEAT_SCHEDULE; removes expired upload sessions and their part files."""
+    return purge_sessions()
+
+
+@shared_task
+def relay_outbox() -> dict[str, int]:
+    """Deliver pending outbox events to every configured sink, then prune acknowledged old events."""
+    delivered = {result.sink: result.delivered for result in relay_events()}
+    prune_outbox()
+    return delivered
+
+
+@shared_task
+def archive_closed_tickets() -> dict[str, int]:
+    """Hourly via CELERY_BEAT_SCHEDULE; moves old closed tickets to the archive tables in throttled batches."""
+    result = archive_tickets()
+    return {"tickets": result.tickets, "comments": result.comments, "attachments": result.attachments}
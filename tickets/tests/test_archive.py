@@ -0,0 +1,117 @@
+import tempfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from tickets.domain.archive import archive_closed_tickets
+from tickets.domain.blobs import collect_unreferenced_blobs, recount_blob_refs
+from tickets.domain.ingest import drain_ingest_jobs, enqueue_external_ticket
+from tickets.domain.services import add_attachments, add_comment, create_customer_ticket, create_external_ticket
+from tickets.domain.stats import recount_buckets
+from tickets.models import (
+    ArchivedComment,
+    ArchivedTicket,
+    AttachmentBlob,
+    Comment,
+    IngestJob,
+    Ticket,
+    TicketAttachment,
+)
+
+
+class ArchiveTests(APITestCase):
+    alice = {"HTTP_X_ROLE": "customer", "HTTP_X_USER": "alice@example.com"}
+    admin = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "agent1@example.com"}
+
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        override = override_settings(MEDIA_ROOT=media.name, TICKET_RESPONSE_CACHE_TIMEOUT=0)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        old = timezone.now() - timedelta(days=120)
+        self.old = create_customer_ticket(customer_email="alice@example.com", data={"title": "Old refund"})
+        add_comment(ticket=self.old, author="alice@example.com", role="customer", message="Thanks!")
+        add_attachments(ticket=self.old, files=[SimpleUploadedFile("log.txt", b"log bytes")])
+        self.stale_open = create_customer_ticket(customer_email="alice@example.com", data={"title": "Still open"})
+        self.recent = create_customer_ticket(customer_email="alice@example.com", data={"title": "Just closed"})
+        self.external, _ = create_external_ticket(data={"external_ref": "CRM-1", "title": "Partner"})
+        Ticket.objects.filter(id__in=[self.old.id, self.external.id]).update(status="closed", updated_at=old)
+        Ticket.objects.filter(id=self.stale_open.id).update(updated_at=old)
+        Ticket.objects.filter(id=self.recent.id).update(status="closed")
+
+    def archive(self, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return archive_closed_tickets(days=90, pause=0, **kwargs)
+
+    def test_moves_old_closed_tickets_with_their_rows_in_batches(self):
+        buckets = recount_buckets()
+        result = self.archive(batch_size=1)
+
+        self.assertEqual((result.tickets, result.comments, result.attachments, result.batches), (2, 1, 1, 2))
+        self.assertEqual(set(Ticket.objects.values_list("id", flat=True)), {self.stale_open.id, self.recent.id})
+        self.assertEqual(set(ArchivedTicket.objects.values_list("id", flat=True)), {self.old.id, self.external.id})
+        self.assertFalse(Comment.objects.filter(ticket_id=self.old.id).exists())
+        self.assertFalse(TicketAttachment.objects.exists())
+
+        # The archived attachment keeps the blob alive; stats still count archived tickets.
+        self.assertEqual(AttachmentBlob.objects.get().ref_count, 1)
+        self.assertEqual(recount_blob_refs(), 0)
+        self.assertEqual(collect_unreferenced_blobs().deleted, 0)
+        self.assertEqual(recount_buckets(), buckets)
+
+        self.assertEqual(self.archive().tickets, 0)
+
+    def test_reads_fall_back_to_the_archive(self):
+        self.archive()
+
+        r = self.client.get(f"/customer/tickets/{self.old.id}", **self.alice)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual((r.json()["status"], [c["message"] for c in r.json()["comments"]]), ("closed", ["Thanks!"]))
+        self.assertEqual(len(r.json()["attachments"]), 1)
+        self.assertEqual(self.client.get(f"/admin/tickets/{self.old.id}", **self.admin).status_code, 200)
+
+        r = self.client.get(f"/customer/tickets/{self.old.id}/comments", **self.alice)
+        self.assertEqual([c["message"] for c in r.json()["results"]], ["Thanks!"])
+        other = {"HTTP_X_ROLE": "customer", "HTTP_X_USER": "bob@example.com"}
+        self.assertEqual(self.client.get(f"/customer/tickets/{self.old.id}", **other).status_code, 404)
+
+        r = self.client.get("/customer/tickets", **self.alice)
+        self.assertEqual(r.json()["count"], 3)
+        self.assertIn(self.old.id, [t["id"] for t in r.json()["results"]])
+
+        ticket, created = create_external_ticket(data={"external_ref": "CRM-1", "title": "Partner again"})
+        self.assertEqual((ticket.id, created), (self.external.id, False))
+
+    def test_ingest_jobs_keep_the_archived_ticket_id(self):
+        job, _ = enqueue_external_ticket(data={"external_ref": "CRM-2", "title": "Queued"})
+        drain_ingest_jobs()
+        ticket_id = IngestJob.objects.get(id=job.id).ticket_id
+        Ticket.objects.filter(id=ticket_id).update(status="closed", updated_at=timezone.now() - timedelta(days=120))
+        self.archive()
+
+        self.assertTrue(ArchivedTicket.objects.filter(id=ticket_id).exists())
+        r = self.client.get(f"/external/jobs/{job.id}", HTTP_X_API_KEY=settings.EXTERNAL_TICKET_API_KEY)
+        self.assertEqual((r.data["status"], r.data["ticket_id"]), ("succeeded", ticket_id))
+
+    def test_writing_to_an_archived_ticket_restores_it(self):
+        comment_created_at = Comment.objects.get(ticket_id=self.old.id).created_at
+        self.archive()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            r = self.client.put(f"/admin/tickets/{self.old.id}", {"status": "open"}, format="json", **self.admin)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual([c["message"] for c in r.json()["comments"]], ["Thanks!"])
+
+        ticket = Ticket.objects.get(id=self.old.id)
+        self.assertEqual((ticket.status, ticket.created_at), ("open", self.old.created_at))
+        self.assertEqual(Comment.objects.get(ticket_id=self.old.id).created_at, comment_created_at)
+        self.assertEqual(TicketAttachment.objects.get().ticket_id, self.old.id)
+        self.assertFalse(ArchivedTicket.objects.filter(id=self.old.id).exists())
+        self.assertFalse(ArchivedComment.objects.exists())
+        self.assertEqual(recount_blob_refs(), 0)
@@ -0,0 +1,74 @@
+from unittest import mock
+
+from django.conf import settings
+from rest_framework.test import APITestCase
+
+from ticketing.celery import app
+from tickets.domain.ingest import drain_ingest_jobs
+from tickets.models import IngestJob, Ticket
+
+
+class AsyncIngestTests(APITestCase):
+    def setUp(self):
+        # The app reads Django settings with the CELERY_ namespace, so override the namespaced key.
+        eager = app.conf.task_always_eager
+        app.conf.update(CELERY_TASK_ALWAYS_EAGER=True)
+        self.addCleanup(app.conf.update, CELERY_TASK_ALWAYS_EAGER=eager)
+
+    def post(self, payload, **extra):
+        return self.client.post(
+            "/external/tickets",
+            payload,
+            format="json",
+            HTTP_X_API_KEY=settings.EXTERNAL_TICKET_API_KEY,
+            HTTP_PREFER="respond-async",
+            **extra,
+        )
+
+    def job(self, job_id):
+        return self.client.get(f"/external/jobs/{job_id}", HTTP_X_API_KEY=settings.EXTERNAL_TICKET_API_KEY)
+
+    def test_accepts_then_worker_ingests(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            r = self.post({"external_ref": "EXT-1", "title": "Alert"})
+        self.assertEqual(r.status_code, 202)
+        self.assertTrue(r["Location"].endswith(f"/external/jobs/{r.data['job_id']}"))
+
+        status = self.job(r.data["job_id"]).data
+        ticket = Ticket.objects.get(external_ref="EXT-1")
+        self.assertEqual((status["status"], status["ticket_id"], status["created"]), ("succeeded", ticket.id, True))
+
+        self.assertEqual(self.post({"external_ref": "bad"}).status_code, 400)
+        self.assertEqual(self.job("00000000-0000-0000-0000-000000000000").status_code, 404)
+
+    def test_broker_outage_keeps_the_job_for_the_beat_drain(self):
+        def broker_down(*args, **kwargs):
+            raise ConnectionError("broker down")
+
+        with mock.patch("tickets.tasks.drain_ingest_jobs.delay", broker_down):
+            with self.assertLogs("django.test", "ERROR"):
+                with self.captureOnCommitCallbacks(execute=True):
+                    r = self.post({"external_ref": "EXT-1", "title": "Alert"})
+        self.assertEqual(r.status_code, 202)
+        self.assertEqual(self.job(r.data["job_id"]).data["status"], "queued")
+
+        self.assertEqual(drain_ingest_jobs(), 1)
+        self.assertEqual(self.job(r.data["job_id"]).data["status"], "succeeded")
+
+    def test_worker_drains_queue_in_batches_with_duplicates_and_keys(self):
+        # Without on-commit callbacks the jobs stay queued, like a burst ahead of the worker.
+        ids = [self.post({"external_ref": f"EXT-{i % 3}", "title": "Burst"}).data["job_id"] for i in range(5)]
+        keyed = self.post({"external_ref": "EXT-9", "title": "Keyed"}, HTTP_IDEMPOTENCY_KEY="req-1")
+        again = self.post({"external_ref": "EXT-9", "title": "Keyed"}, HTTP_IDEMPOTENCY_KEY="req-1")
+        self.assertEqual(again.data["job_id"], keyed.data["job_id"])
+        self.assertEqual(IngestJob.objects.filter(status="queued").count(), 6)
+
+        self.assertEqual(drain_ingest_jobs(batch_size=4), 6)
+        self.assertEqual(Ticket.objects.count(), 4)
+        self.assertEqual(IngestJob.objects.filter(status="succeeded", created=True).count(), 4)
+        self.assertEqual(IngestJob.objects.get(id=ids[3]).ticket_id, IngestJob.objects.get(id=ids[0]).ticket_id)
+
+        # The key now replays the ticket like the synchronous path does.
+        replay = self.post({"external_ref": "EXT-10", "title": "Other"}, HTTP_IDEMPOTENCY_KEY="req-1")
+        self.assertEqual(replay.status_code, 200)
+        self.assertEqual(replay.data["external_ref"], "EXT-9")
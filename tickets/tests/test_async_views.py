@@ -0,0 +1,74 @@
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import TransactionTestCase
+
+from tickets.api.pagination import TicketCursorPagination
+from tickets.domain.services import create_customer_ticket
+from tickets.domain.stats import ticket_stats_summary
+
+
+class AsyncReadEndpointTests(TransactionTestCase):
+    """The async views must mirror the DRF views, run through Django's async test client."""
+
+    admin = {"X-ROLE": "admin", "X-USER": "admin@example.com"}
+    alice = {"X-ROLE": "customer", "X-USER": "alice@example.com"}
+
+    def setUp(self):
+        self.ticket = create_customer_ticket(customer_email="alice@example.com", data={"title": "Refund"})
+        create_customer_ticket(customer_email="bob@example.com", data={"title": "Login"})
+
+    async def test_customer_list_and_detail_match_sync_views(self):
+        r = await self.async_client.get("/async/customer/tickets", headers=self.alice)
+        self.assertEqual(r.status_code, 200)
+        sync = await sync_to_async(self.client.get)("/customer/tickets", headers=self.alice)
+        self.assertEqual(r.json(), sync.json())
+
+        r = await self.async_client.get(f"/async/customer/tickets/{self.ticket.id}", headers=self.alice)
+        self.assertEqual(r.json()["title"], "Refund")
+        r = await self.async_client.get(
+            f"/async/customer/tickets/{self.ticket.id}", headers={**self.alice, "If-None-Match": r["ETag"]}
+        )
+        self.assertEqual(r.status_code, 304)
+
+        r = await self.async_client.get(
+            f"/async/customer/tickets/{self.ticket.id}", headers={"X-ROLE": "customer", "X-USER": "bob@example.com"}
+        )
+        self.assertEqual(r.status_code, 404)
+
+    async def test_lists_answer_conditional_gets_and_cursor_pages_like_sync_views(self):
+        r = await self.async_client.get("/async/customer/tickets", headers=self.alice)
+        sync = await sync_to_async(self.client.get)("/customer/tickets", headers=self.alice)
+        self.assertEqual(r["ETag"], sync["ETag"])
+        r = await self.async_client.get("/async/customer/tickets", headers={**self.alice, "If-None-Match": r["ETag"]})
+        self.assertEqual(r.status_code, 304)
+
+        await sync_to_async(create_customer_ticket)(customer_email="alice@example.com", data={"title": "Invoice"})
+        r = await self.async_client.get("/async/admin/tickets?pagination=cursor&fields=id", headers=self.admin)
+        sync = await sync_to_async(self.client.get)("/admin/tickets?pagination=cursor&fields=id", headers=self.admin)
+        self.assertEqual(r.json()["results"], sync.json()["results"])
+        self.assertNotIn("ETag", r)
+
+        pages, url = [], "/async/admin/tickets?pagination=cursor&fields=id"
+        with mock.patch.object(TicketCursorPagination, "page_size", 2):
+            while url:
+                page = (await self.async_client.get(url, headers=self.admin)).json()
+                pages.append([row["id"] for row in page["results"]])
+                url = page["next"]
+        self.assertEqual([len(p) for p in pages], [2, 1])
+        self.assertEqual(sum(pages, []), [row["id"] for row in sync.json()["results"]])
+
+    async def test_admin_endpoints_and_role_checks(self):
+        r = await self.async_client.get("/async/admin/tickets?q=refu&fields=id,title", headers=self.admin)
+        self.assertEqual(r.json()["results"], [{"id": self.ticket.id, "title": "Refund"}])
+
+        r = await self.async_client.get(f"/async/admin/tickets/{self.ticket.id}", headers=self.admin)
+        self.assertEqual(r.json()["id"], self.ticket.id)
+
+        r = await self.async_client.get("/async/admin/tickets/stats", headers=self.admin)
+        self.assertEqual(r.json(), await sync_to_async(ticket_stats_summary)())
+
+        r = await self.async_client.get("/async/admin/tickets", headers=self.alice)
+        self.assertEqual(r.status_code, 403)
+        r = await self.async_client.get("/async/admin/tickets")
+        self.assertEqual(r.status_code, 400)
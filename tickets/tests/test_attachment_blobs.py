@@ -0,0 +1,96 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import transaction
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from tickets.domain.blobs import collect_unreferenced_blobs, store_upload, sweep_orphan_blob_files
+from tickets.domain.services import add_attachments, attach_stored_uploads, create_customer_ticket
+from tickets.models import AttachmentBlob, Ticket, TicketAttachment
+
+
+class AttachmentBlobTests(APITestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        override = override_settings(MEDIA_ROOT=media.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def upload(self, title, *files):
+        return self.client.post(
+            "/customer/tickets",
+            {"title": title, "attachments": list(files)},
+            format="multipart",
+            HTTP_X_ROLE="customer",
+            HTTP_X_USER="alice@example.com",
+        )
+
+    def test_identical_uploads_share_one_blob(self):
+        self.upload("First", SimpleUploadedFile("log.txt", b"same bytes"))
+        r = self.upload(
+            "Retry", SimpleUploadedFile("log-copy.txt", b"same bytes"), SimpleUploadedFile("b.txt", b"other")
+        )
+        self.assertEqual(r.status_code, 201)
+
+        self.assertEqual(TicketAttachment.objects.count(), 3)
+        self.assertEqual(AttachmentBlob.objects.count(), 2)
+        blob = AttachmentBlob.objects.get(size=len(b"same bytes"))
+        self.assertEqual(blob.ref_count, 2)
+        self.assertEqual(len(os.listdir(os.path.dirname(default_storage.path(blob.file.name)))), 1)
+        names = set(TicketAttachment.objects.filter(blob=blob).values_list("original_name", flat=True))
+        self.assertEqual(names, {"log.txt", "log-copy.txt"})
+
+    def test_deletes_release_references_and_gc_removes_orphans(self):
+        self.upload("First", SimpleUploadedFile("log.txt", b"same bytes"))
+        self.upload("Retry", SimpleUploadedFile("log.txt", b"same bytes"))
+        blob = AttachmentBlob.objects.get()
+        path = default_storage.path(blob.file.name)
+
+        Ticket.objects.get(title="First").delete()
+        blob.refresh_from_db()
+        self.assertEqual(blob.ref_count, 1)
+        call_command("gc_attachment_blobs", stdout=StringIO())
+        self.assertTrue(AttachmentBlob.objects.exists())
+
+        Ticket.objects.get(title="Retry").delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("gc_attachment_blobs", stdout=StringIO())
+        self.assertFalse(AttachmentBlob.objects.exists())
+        self.assertFalse(os.path.exists(path))
+
+    def test_upload_rewrites_a_blob_file_collected_after_it_was_stored(self):
+        self.upload("First", SimpleUploadedFile("log.txt", b"same bytes"))
+        Ticket.objects.get(title="First").delete()
+        ticket = create_customer_ticket(customer_email="alice@example.com", data={"title": "Retry"})
+
+        # The upload finds the unreferenced blob's file, then GC removes blob and file before the row is claimed.
+        upload = store_upload(SimpleUploadedFile("log.txt", b"same bytes"))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(collect_unreferenced_blobs().deleted, 1)
+        self.assertFalse(default_storage.exists(upload.path))
+
+        (attachment,) = attach_stored_uploads(ticket=ticket, uploads=[upload])
+        self.assertEqual((attachment.blob.file.name, attachment.blob.ref_count), (upload.path, 1))
+        with default_storage.open(upload.path) as fh:
+            self.assertEqual(fh.read(), b"same bytes")
+
+    def test_sweep_removes_files_of_rolled_back_uploads(self):
+        ticket = create_customer_ticket(customer_email="alice@example.com", data={"title": "Crash"})
+        add_attachments(ticket=ticket, files=[SimpleUploadedFile("kept.txt", b"kept")])
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            add_attachments(ticket=ticket, files=[SimpleUploadedFile("lost.txt", b"rolled back")])
+            raise RuntimeError
+        kept = default_storage.path(AttachmentBlob.objects.get().file.name)
+        blob_files = [os.path.join(root, f) for root, _, files in os.walk(default_storage.path("blobs")) for f in files]
+        self.assertEqual(len(blob_files), 2)
+
+        self.assertEqual(sweep_orphan_blob_files().deleted, 0)  # still within the grace period
+        result = sweep_orphan_blob_files(grace=0)
+        self.assertEqual((result.deleted, result.freed_bytes), (1, len(b"rolled back")))
+        self.assertEqual([f for f in blob_files if os.path.exists(f)], [kept])
@@ -0,0 +1,85 @@
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.utils.http import http_date
+from rest_framework.test import APITestCase
+
+from tickets.domain.services import add_attachments, create_customer_ticket
+
+
+class AttachmentDownloadTests(APITestCase):
+    alice = {"HTTP_X_ROLE": "customer", "HTTP_X_USER": "alice@example.com"}
+    body = bytes(range(256)) * 4
+
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        override = override_settings(MEDIA_ROOT=media.name, TICKET_RESPONSE_CACHE_TIMEOUT=0)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.ticket = create_customer_ticket(customer_email="alice@example.com", data={"title": "Crash"})
+        (self.attachment,) = add_attachments(ticket=self.ticket, files=[SimpleUploadedFile("dump.bin", self.body)])
+        self.url = f"/customer/tickets/{self.ticket.id}/attachments/{self.attachment.id}"
+
+    def get(self, url=None, **headers):
+        response = self.client.get(url or self.url, **{**self.alice, **headers})
+        content = b"".join(response.streaming_content) if response.streaming else response.content
+        response.close()
+        return response, content
+
+    def test_full_download_and_ownership(self):
+        r, content = self.get(HTTP_ACCEPT="application/octet-stream")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(content, self.body)
+        self.assertEqual(r["Accept-Ranges"], "bytes")
+        self.assertIn('filename="dump.bin"', r["Content-Disposition"])
+
+        r, _ = self.get(HTTP_IF_NONE_MATCH=r["ETag"])
+        self.assertEqual(r.status_code, 304)
+
+        r, _ = self.get(HTTP_X_USER="bob@example.com")
+        self.assertEqual(r.status_code, 404)
+        r, content = self.get(
+            f"/admin/tickets/{self.ticket.id}/attachments/{self.attachment.id}",
+            HTTP_X_ROLE="admin",
+            HTTP_X_USER="admin@example.com",
+        )
+        self.assertEqual(content, self.body)
+
+    def test_detail_links_the_download_route_for_the_role(self):
+        r = self.client.get(f"/customer/tickets/{self.ticket.id}", **self.alice)
+        self.assertEqual(r.json()["attachments"][0]["url"], f"http://testserver{self.url}")
+
+        admin = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "admin@example.com"}
+        r = self.client.get(f"/admin/tickets/{self.ticket.id}", **admin)
+        admin_url = f"/admin/tickets/{self.ticket.id}/attachments/{self.attachment.id}"
+        self.assertEqual(r.json()["attachments"][0]["url"], f"http://testserver{admin_url}")
+
+    def test_range_requests(self):
+        r, content = self.get(HTTP_RANGE="bytes=10-19")
+        self.assertEqual(r.status_code, 206)
+        self.assertEqual(content, self.body[10:20])
+        self.assertEqual(r["Content-Range"], f"bytes 10-19/{len(self.body)}")
+
+        r, content = self.get(HTTP_RANGE="bytes=-5")
+        self.assertEqual(content, self.body[-5:])
+
+        r, _ = self.get(HTTP_RANGE="bytes=5000-")
+        self.assertEqual(r.status_code, 416)
+
+        etag = self.get()[0]["ETag"]
+        r, _ = self.get(HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE=etag)
+        self.assertEqual(r.status_code, 206)
+        r, content = self.get(HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"stale"')
+        self.assertEqual((r.status_code, content), (200, self.body))
+        r, _ = self.get(HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE=http_date(0))
+        self.assertEqual(r.status_code, 200)
+
+    @override_settings(TICKET_ATTACHMENT_SENDFILE="x-accel-redirect", TICKET_ATTACHMENT_ACCEL_PREFIX="/protected/")
+    def test_proxy_offload(self):
+        r, content = self.get()
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(content, b"")
+        self.assertEqual(r["X-Accel-Redirect"], f"/protected/{self.attachment.file.name}")
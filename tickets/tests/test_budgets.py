@@ -0,0 +1,145 @@
+import os
+import statistics
+import tempfile
+import time
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from rest_framework.test import APITestCase
+
+from tickets.api.budgets import BUDGETS, UNBUDGETED, get_budget
+from tickets.domain.seed import SeedSpec, seed_tickets
+from tickets.domain.services import add_comment
+from tickets.models import Ticket
+from tickets.urls import urlpatterns
+
+SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+TIMED_RUNS = 5
+# Wall-clock limits depend on the machine, so they are only enforced on request (e.g. a dedicated perf job).
+CHECK_LATENCY = os.environ.get("TICKET_BUDGET_LATENCY") == "1"
+
+
+class EndpointBudgetTests(APITestCase):
+    """Every endpoint against seeded data must stay within its query budget (and latency, when enabled)."""
+
+    customer = {"HTTP_X_ROLE": "customer", "HTTP_X_USER": "customer1@example.com"}
+    admin = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "agent1@example.com"}
+
+    @classmethod
+    def setUpClass(cls):
+        dirs = [tempfile.TemporaryDirectory() for _ in range(2)]
+        # Budgets are for uncached responses.
+        override = override_settings(
+            MEDIA_ROOT=dirs[0].name,
+            TICKET_UPLOAD_DIR=dirs[1].name,
+            TICKET_UPLOAD_CHUNK_SIZE=4,
+            TICKET_RESPONSE_CACHE_TIMEOUT=0,
+        )
+        override.enable()
+        cls.addClassCleanup(override.disable)
+        for d in dirs:
+            cls.addClassCleanup(d.cleanup)
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_tickets(SeedSpec(tickets=300, customers=20, comments_per_ticket=2, attachment_ratio=0.3))
+        cls.ticket = Ticket.objects.filter(customer_id="customer1@example.com", attachments__isnull=False).first()
+        for i in range(10):
+            add_comment(ticket=cls.ticket, author=cls.ticket.customer_id, role="customer", message=f"More {i}")
+        cls.attachment = cls.ticket.attachments.first()
+
+    def measure(self, method, path, headers, body=None, content_type="application/json"):
+        """
+        Run the request and check its query budget; GETs get a warm-up call first (one-time
+        per-process work is not budgeted). With TICKET_BUDGET_LATENCY=1 the median time is checked too.
+        """
+        match = resolve(path.partition("?")[0])
+        budget = get_budget(match.url_name, method)
+        self.assertIsNotNone(budget, f"No budget for {method} {match.url_name}")
+
+        def call():
+            started = time.perf_counter()
+            response = self.client.generic(method, path, body or "", content_type=content_type, **headers)
+            if response.streaming:
+                b"".join(response.streaming_content)
+            return response, (time.perf_counter() - started) * 1000
+
+        if method == "GET":
+            call()
+        with CaptureQueriesContext(connection) as captured:
+            response, elapsed = call()
+        self.assertLess(response.status_code, 400, f"{method} {path}: {response.status_code}")
+        queries = [q["sql"] for q in captured if not q["sql"].startswith(SAVEPOINT_PREFIXES)]
+
+        if len(queries) > budget.queries:
+            listing = "\n".join(f"  {i}. {sql}" for i, sql in enumerate(queries, 1))
+            self.fail(
+                f"{method} {path} ({match.url_name}) ran {len(queries)} queries, budget {budget.queries}:\n{listing}"
+            )
+        if CHECK_LATENCY:
+            samples = [elapsed] + ([call()[1] for _ in range(TIMED_RUNS - 1)] if method == "GET" else [])
+            latency = statistics.median(samples)
+            self.assertLessEqual(
+                latency, budget.latency_ms, f"{method} {path} ({match.url_name}) median {latency:.1f}ms over budget"
+            )
+        self.exercised.add((match.url_name, method))
+        return response
+
+    def test_every_route_has_a_budget_or_a_reason(self):
+        names = {p.name for p in urlpatterns}
+        self.assertEqual(names - BUDGETS.keys() - UNBUDGETED.keys(), set())
+        self.assertEqual(BUDGETS.keys() - names, set())
+
+    def test_endpoints_stay_within_budget(self):
+        self.exercised = set()
+        t, a = self.ticket.id, self.attachment.id
+        key = {"HTTP_X_API_KEY": "dev-external-api-key"}
+
+        for path in ["/customer/tickets", "/customer/tickets?status=open", "/customer/tickets/changes?timeout=0"]:
+            self.measure("GET", path, self.customer)
+        self.measure("POST", "/customer/tickets", self.customer, '{"title": "New", "category": "billing"}')
+        detail = f"/customer/tickets/{t}"
+        for path in [detail, f"{detail}/comments", f"{detail}/attachments/{a}"]:
+            self.measure("GET", path, self.customer)
+        self.measure("POST", f"{detail}/comments", self.customer, '{"message": "Any news?"}')
+
+        for path in [
+            "/admin/tickets",
+            "/admin/tickets?status=open&priority=high&q=refund",
+            "/admin/tickets/stats",
+            "/admin/tickets/export?status=open&include_comments=1",
+            "/admin/tickets/changes?timeout=0",
+            f"/admin/tickets/{t}",
+            f"/admin/tickets/{t}/comments",
+            f"/admin/tickets/{t}/attachments/{a}",
+            "/admin/cache/stats",
+            "/admin/metrics",
+        ]:
+            self.measure("GET", path, self.admin)
+        self.measure("PUT", f"/admin/tickets/{t}", self.admin, '{"status": "resolved"}')
+        self.measure("POST", f"/admin/tickets/{t}/comments", self.admin, '{"message": "Fixed."}')
+        self.measure("POST", f"{detail}/close", self.customer)
+
+        with override_settings(EXTERNAL_TICKET_API_KEY="dev-external-api-key"):
+            self.measure("POST", "/external/tickets", key, '{"external_ref": "B-1", "title": "Sync"}')
+            self.measure("POST", "/external/tickets/batch", key, '[{"external_ref": "B-2", "title": "a"}]')
+            job = self.measure("POST", "/external/tickets?mode=async", key, '{"external_ref": "B-3", "title": "b"}')
+            self.measure("GET", f"/external/jobs/{job.data['job_id']}", key)
+
+        upload = self.measure("POST", "/uploads", self.customer, f'{{"ticket_id": {t}, "filename": "a", "size": 4}}')
+        sid = upload.data["id"]
+        self.measure("GET", f"/uploads/{sid}", self.customer)
+        self.measure("PUT", f"/uploads/{sid}/chunks/0", self.customer, b"abcd", "application/octet-stream")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.measure("POST", f"/uploads/{sid}/finalize", self.customer)
+
+        for path in ["/async/customer/tickets", f"/async/customer/tickets/{t}", "/categories"]:
+            self.measure("GET", path, self.customer)
+        for path in ["/async/admin/tickets", "/async/admin/tickets/stats", f"/async/admin/tickets/{t}"]:
+            self.measure("GET", path, self.admin)
+
+        declared = {(name, method) for name, methods in BUDGETS.items() for method in methods}
+        self.assertEqual(declared - self.exercised, set(), "budgets declared but not exercised")
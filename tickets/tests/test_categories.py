@@ -0,0 +1,65 @@
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from tickets.api.serializers import TicketCreateSerializer
+from tickets.domain.categories import category_index
+from tickets.domain.stats import ticket_stats_summary
+from tickets.models import Category, Ticket
+
+
+class CategoryValidationTests(APITestCase):
+    admin = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "admin@example.com"}
+    alice = {"HTTP_X_ROLE": "customer", "HTTP_X_USER": "alice@example.com"}
+
+    def setUp(self):
+        category_index.invalidate()
+        self.addCleanup(category_index.invalidate)
+
+    def test_categories_are_validated_and_normalized_without_queries(self):
+        r = self.client.post("/customer/tickets", {"title": "A", "category": "  Billing "}, format="json", **self.alice)
+        self.assertEqual(r.status_code, 201)
+        self.assertEqual(Ticket.objects.get().category, "billing")
+
+        r = self.client.post("/customer/tickets", {"title": "B", "category": "biling"}, format="json", **self.alice)
+        self.assertEqual(r.status_code, 400)
+        self.assertIn("Unknown category", r.json()["category"][0])
+
+        ticket_id = Ticket.objects.get().id
+        r = self.client.put(f"/admin/tickets/{ticket_id}", {"category": "nope"}, format="json", **self.admin)
+        self.assertEqual(r.status_code, 400)
+        r = self.client.post(
+            "/external/tickets",
+            {"external_ref": "X-1", "title": "C", "category": "nope"},
+            format="json",
+            HTTP_X_API_KEY=settings.EXTERNAL_TICKET_API_KEY,
+        )
+        self.assertEqual(r.status_code, 400)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(TicketCreateSerializer(data={"title": "D", "category": "Technical"}).is_valid())
+
+    def test_new_category_is_accepted_once_committed(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Category.objects.create(name="Shipping")
+        serializer = TicketCreateSerializer(data={"title": "A", "category": "shipping"})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data["category"], "Shipping")
+
+    def test_backfill_command_normalizes_free_text_in_batches(self):
+        for category in ["Billing ", "TECHNICAL", "technicl", "zzz", "general"]:
+            Ticket.objects.create(source=Ticket.Source.CUSTOMER, title="t", category=category)
+
+        out = StringIO()
+        call_command("normalize_ticket_categories", "--dry-run", stdout=out)
+        self.assertIn("'zzz' -> unchanged (1 tickets)", out.getvalue())
+        self.assertEqual(Ticket.objects.filter(category="technicl").count(), 1)
+
+        call_command("normalize_ticket_categories", "--fallback=General", "--batch-size=1", stdout=out)
+        self.assertEqual(
+            sorted(Ticket.objects.values_list("category", flat=True)),
+            ["billing", "general", "general", "technical", "technical"],
+        )
+        self.assertEqual(ticket_stats_summary()["by_category"], {"billing": 1, "general": 2, "technical": 2})
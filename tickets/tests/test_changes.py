@@ -0,0 +1,116 @@
+import asyncio
+import json
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.test import TransactionTestCase, override_settings
+
+from ticketing.handlers import TicketingASGIHandler
+from tickets.domain.services import add_comment, admin_update_ticket, create_customer_ticket
+from tickets.models import OutboxEvent
+
+
+@override_settings(TICKET_CHANGES_POLL_INTERVAL=0.02)
+class ChangeFeedTests(TransactionTestCase):
+    admin = {"X-ROLE": "admin", "X-USER": "admin@example.com"}
+    alice = {"X-ROLE": "customer", "X-USER": "alice@example.com"}
+
+    def setUp(self):
+        self.first = create_customer_ticket(customer_email="alice@example.com", data={"title": "Refund"})
+        self.second = create_customer_ticket(customer_email="alice@example.com", data={"title": "Invoice"})
+        create_customer_ticket(customer_email="bob@example.com", data={"title": "Login"})
+
+    def test_cursor_returns_only_later_changes_with_their_comments(self):
+        r = self.client.get("/customer/tickets/changes?limit=1", headers=self.alice)
+        self.assertEqual([t["id"] for t in r.json()["tickets"]], [self.first.id])
+        self.assertTrue(r.json()["has_more"])
+        r = self.client.get(f"/customer/tickets/changes?since={r.json()['cursor']}", headers=self.alice)
+        self.assertEqual([t["id"] for t in r.json()["tickets"]], [self.second.id])
+        self.assertFalse(r.json()["has_more"])
+        cursor = r.json()["cursor"]
+        # The cursor is an outbox event id, the same as the SSE event ids.
+        self.assertEqual(cursor, str(OutboxEvent.objects.get(ticket_id=self.second.id).id))
+
+        r = self.client.get(f"/customer/tickets/changes?since={cursor}", headers=self.alice)
+        self.assertEqual(r.json(), {"cursor": cursor, "has_more": False, "tickets": [], "comments": []})
+
+        # Committed writes show up on the next poll, each ticket once, in the order of its latest change.
+        comment = add_comment(ticket=self.first, author="admin@example.com", role="admin", message="On it")
+        admin_update_ticket(ticket=self.second, data={"status": "in_progress"})
+        admin_update_ticket(ticket=self.first, data={"status": "in_progress"})
+        r = self.client.get(f"/customer/tickets/changes?since={cursor}&fields=id,status", headers=self.alice)
+        self.assertEqual(
+            r.json()["tickets"],
+            [{"id": self.second.id, "status": "in_progress"}, {"id": self.first.id, "status": "in_progress"}],
+        )
+        self.assertEqual([c["id"] for c in r.json()["comments"]], [comment.id])
+
+    def test_settle_window_holds_back_fresh_writes(self):
+        with override_settings(TICKET_CHANGES_SETTLE_SECONDS=60):
+            r = self.client.get("/admin/tickets/changes", headers=self.admin)
+        self.assertEqual((r.json()["tickets"], r.json()["cursor"]), ([], None))
+
+    def test_customer_feed_is_scoped_and_requires_role(self):
+        r = self.client.get("/admin/tickets/changes", headers=self.admin)
+        self.assertEqual(len(r.json()["tickets"]), 3)
+        r = self.client.get("/customer/tickets/changes", headers={"X-ROLE": "customer", "X-USER": "bob@example.com"})
+        self.assertEqual([t["title"] for t in r.json()["tickets"]], ["Login"])
+        self.assertEqual(self.client.get("/admin/tickets/changes", headers=self.alice).status_code, 403)
+        self.assertEqual(self.client.get("/admin/tickets/changes?timeout=-1", headers=self.admin).status_code, 400)
+        self.assertEqual(self.client.get("/admin/tickets/changes?since=bogus", headers=self.admin).status_code, 404)
+
+    async def test_long_poll_times_out_then_wakes_on_a_write(self):
+        r = await self.async_client.get("/admin/tickets/changes", headers=self.admin)
+        cursor = r.json()["cursor"]
+
+        started = time.monotonic()
+        r = await self.async_client.get(f"/admin/tickets/changes?since={cursor}&timeout=0.2", headers=self.admin)
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+        self.assertEqual(r.json()["tickets"], [])
+
+        async def write_later():
+            # Another connection (thread) writes while the request is parked.
+            await asyncio.sleep(0.1)
+            update = sync_to_async(admin_update_ticket, thread_sensitive=False)
+            await update(ticket=self.second, data={"status": "in_progress"})
+
+        writer = asyncio.create_task(write_later())
+        r = await self.async_client.get(f"/admin/tickets/changes?since={cursor}&timeout=5", headers=self.admin)
+        await writer
+        self.assertEqual([(t["id"], t["status"]) for t in r.json()["tickets"]], [(self.second.id, "in_progress")])
+
+    def test_waiting_long_polls_hold_no_thread(self):
+        # Driven like an ASGI server does (no async_to_sync around it), so thread-sensitive calls behave as in
+        # production: without TicketingASGIHandler each waiting request would park a thread of its own.
+        application = TicketingASGIHandler()
+
+        async def poll(query):
+            messages, request = [], asyncio.Queue()
+
+            async def send(message):
+                messages.append(message)
+
+            request.put_nowait({"type": "http.request", "body": b""})
+            scope = {
+                "type": "http",
+                "method": "GET",
+                "path": "/admin/tickets/changes",
+                "query_string": query.encode(),
+                "headers": [(b"x-role", b"admin"), (b"x-user", b"admin@example.com")],
+                "server": ("testserver", 80),
+            }
+            await application(scope, request.get, send)
+            return json.loads(b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body"))
+
+        async def run():
+            cursor = (await poll(""))["cursor"]
+            baseline = threading.active_count()
+            polls = [asyncio.create_task(poll(f"since={cursor}&timeout=0.5")) for _ in range(10)]
+            await asyncio.sleep(0.25)
+            waiting = threading.active_count()
+            return baseline, waiting, await asyncio.gather(*polls)
+
+        baseline, waiting, responses = asyncio.run(run())
+        self.assertEqual(waiting, baseline)
+        self.assertEqual([r["tickets"] for r in responses], [[]] * 10)
@@ -0,0 +1,53 @@
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from tickets.models import Comment, Ticket, TicketAttachment
+
+
+@override_settings(TICKET_RESPONSE_CACHE_TIMEOUT=0)
+class TicketCommentsTests(APITestCase):
+    admin = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "admin@example.com"}
+    alice = {"HTTP_X_ROLE": "customer", "HTTP_X_USER": "alice@example.com"}
+
+    def setUp(self):
+        self.ticket = Ticket.objects.create(source=Ticket.Source.CUSTOMER, customer_id="alice@example.com", title="A")
+        Comment.objects.bulk_create(
+            Comment(ticket=self.ticket, author="alice@example.com", role="customer", message=f"m{i}")
+            for i in range(7)
+        )
+        TicketAttachment.objects.create(ticket=self.ticket, file="attachments/a.txt")
+        TicketAttachment.objects.create(ticket=self.ticket, file="attachments/b.txt")
+
+    def test_detail_embeds_capped_comments_without_n_plus_one(self):
+        with self.settings(TICKET_DETAIL_COMMENT_LIMIT=3):
+            # version check + ticket + comments + attachments, regardless of counts
+            with self.assertNumQueries(4):
+                r = self.client.get(f"/admin/tickets/{self.ticket.id}", **self.admin)
+        self.assertEqual([c["message"] for c in r.data["comments"]], ["m0", "m1", "m2"])
+        self.assertTrue(r.data["comments_has_more"])
+        self.assertEqual(len(r.data["attachments"]), 2)
+
+        r = self.client.get(
+            f"/customer/tickets/{self.ticket.id}/comments?cursor={r.data['comments_next_cursor']}&limit=10",
+            **self.alice,
+        )
+        self.assertEqual([c["message"] for c in r.data["results"]], ["m3", "m4", "m5", "m6"])
+        self.assertIsNone(r.data["next"])
+
+    def test_comment_list_keyset_pages(self):
+        seen = []
+        url = f"/admin/tickets/{self.ticket.id}/comments?limit=3"
+        while url:
+            r = self.client.get(url, **self.admin)
+            self.assertEqual(r.status_code, 200)
+            seen.extend(c["message"] for c in r.data["results"])
+            url = r.data["next"]
+        self.assertEqual(seen, [f"m{i}" for i in range(7)])
+
+    def test_customer_cannot_list_foreign_comments(self):
+        r = self.client.get(
+            f"/customer/tickets/{self.ticket.id}/comments", HTTP_X_ROLE="customer", HTTP_X_USER="bob@example.com"
+        )
+        self.assertEqual(r.status_code, 404)
+        r = self.client.get(f"/customer/tickets/{self.ticket.id}/comments?cursor=bogus", **self.alice)
+        self.assertEqual(r.status_code, 404)
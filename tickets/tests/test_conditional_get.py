@@ -0,0 +1,55 @@
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from tickets.models import Ticket
+
+
+@override_settings(TICKET_RESPONSE_CACHE_TIMEOUT=0)
+class ConditionalGetTests(APITestCase):
+    admin = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "admin@example.com"}
+    alice = {"HTTP_X_ROLE": "customer", "HTTP_X_USER": "alice@example.com"}
+
+    def setUp(self):
+        self.ticket = Ticket.objects.create(source=Ticket.Source.CUSTOMER, customer_id="alice@example.com", title="A")
+
+    def test_detail_304_uses_single_query_and_comments_change_etag(self):
+        url = f"/customer/tickets/{self.ticket.id}"
+        r = self.client.get(url, **self.alice)
+        self.assertEqual(r.status_code, 200)
+        etag = r["ETag"]
+        self.assertTrue(r.has_header("Last-Modified"))
+
+        with self.assertNumQueries(1):
+            r = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.alice)
+        self.assertEqual(r.status_code, 304)
+
+        self.client.post(f"/admin/tickets/{self.ticket.id}/comments", {"message": "On it"}, format="json", **self.admin)
+        r = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.alice)
+        self.assertEqual(r.status_code, 200)
+        self.assertNotEqual(r["ETag"], etag)
+        self.assertEqual(len(r.data["comments"]), 1)
+
+    def test_admin_detail_and_foreign_ticket(self):
+        r = self.client.get(f"/admin/tickets/{self.ticket.id}", **self.admin)
+        r = self.client.get(f"/admin/tickets/{self.ticket.id}", HTTP_IF_NONE_MATCH=r["ETag"], **self.admin)
+        self.assertEqual(r.status_code, 304)
+
+        r = self.client.get(
+            f"/customer/tickets/{self.ticket.id}", HTTP_X_ROLE="customer", HTTP_X_USER="bob@example.com"
+        )
+        self.assertEqual(r.status_code, 404)
+
+    def test_list_weak_etag_tracks_filtered_set(self):
+        other = Ticket.objects.create(source=Ticket.Source.CUSTOMER, customer_id="bob@example.com", title="B")
+        r = self.client.get("/admin/tickets?status=open", **self.admin)
+        etag = r["ETag"]
+        self.assertTrue(etag.startswith("W/"))
+
+        r = self.client.get("/admin/tickets?status=open", HTTP_IF_NONE_MATCH=etag, **self.admin)
+        self.assertEqual(r.status_code, 304)
+
+        # Leaving the filtered set must invalidate the ETag even if max(updated_at) is unchanged.
+        Ticket.objects.filter(id=other.id).update(status=Ticket.Status.CLOSED)
+        r = self.client.get("/admin/tickets?status=open", HTTP_IF_NONE_MATCH=etag, **self.admin)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.data["count"], 1)
@@ -0,0 +1,44 @@
+import csv
+import io
+import json
+
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from tickets.models import Comment, Ticket
+
+
+class TicketExportTests(APITestCase):
+    admin = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "admin@example.com"}
+
+    def setUp(self):
+        self.t1 = Ticket.objects.create(source=Ticket.Source.CUSTOMER, title="Refund", status="open")
+        self.t2 = Ticket.objects.create(source=Ticket.Source.CUSTOMER, title="Login", status="closed")
+        Comment.objects.create(ticket=self.t1, author="a@example.com", role="customer", message="hi")
+        Comment.objects.create(ticket=self.t1, author="b@example.com", role="admin", message="hello")
+
+    def test_ndjson_stream_applies_filters_and_batches_comments(self):
+        with self.assertNumQueries(2):
+            r = self.client.get("/admin/tickets/export?status=open&include_comments=1", **self.admin)
+            body = b"".join(r.streaming_content).decode()
+        self.assertEqual(r["Content-Type"], "application/x-ndjson")
+
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row["id"] for row in rows], [self.t1.id])
+        self.assertEqual([c["message"] for c in rows[0]["comments"]], ["hi", "hello"])
+
+    def test_csv_stream(self):
+        r = self.client.get("/admin/tickets/export?output=csv", **self.admin)
+        rows = list(csv.DictReader(io.StringIO(b"".join(r.streaming_content).decode())))
+        self.assertEqual({row["title"] for row in rows}, {"Refund", "Login"})
+
+    def test_requires_admin_and_known_format(self):
+        r = self.client.get("/admin/tickets/export", HTTP_X_ROLE="customer", HTTP_X_USER="c@example.com")
+        self.assertEqual(r.status_code, 403)
+        r = self.client.get("/admin/tickets/export?output=xml", **self.admin)
+        self.assertEqual(r.status_code, 400)
+
+    def test_management_command(self):
+        out = io.StringIO()
+        call_command("export_tickets", "--status", "closed", "--chunk-size", "1", stdout=out)
+        self.assertEqual([json.loads(line)["title"] for line in out.getvalue().splitlines()], ["Login"])
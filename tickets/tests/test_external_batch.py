@@ -0,0 +1,57 @@
+from django.conf import settings
+from rest_framework.test import APITestCase
+
+from tickets.domain.stats import recount_buckets, stored_buckets
+from tickets.models import Ticket
+
+
+class ExternalBatchIngestTests(APITestCase):
+    url = "/external/tickets/batch"
+
+    def post(self, payload, **extra):
+        return self.client.post(
+            self.url, payload, format="json", HTTP_X_API_KEY=settings.EXTERNAL_TICKET_API_KEY, **extra
+        )
+
+    def test_requires_api_key(self):
+        r = self.client.post(self.url, [], format="json")
+        self.assertEqual(r.status_code, 403)
+
+    def test_per_item_results(self):
+        existing = Ticket.objects.create(source=Ticket.Source.EXTERNAL, external_ref="EXT-OLD", title="Old")
+
+        r = self.post(
+            [
+                {"external_ref": "EXT-1", "title": "First", "priority": "high"},
+                {"external_ref": "EXT-OLD", "title": "Retry of an old one"},
+                {"title": "Missing ref"},
+                {"external_ref": "EXT-1", "title": "Same ref twice in one batch"},
+                {"external_ref": "EXT-2", "title": "Second", "priority": "urgent"},
+                {"external_ref": "EXT-3", "title": "Third"},
+            ]
+        )
+
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual((r.data["created"], r.data["duplicate"], r.data["error"]), (2, 2, 2))
+        statuses = [row["status"] for row in r.data["results"]]
+        self.assertEqual(statuses, ["created", "duplicate", "error", "duplicate", "error", "created"])
+        self.assertEqual(r.data["results"][1]["ticket_id"], existing.id)
+        self.assertEqual(r.data["results"][3]["ticket_id"], r.data["results"][0]["ticket_id"])
+        self.assertIn("external_ref", r.data["results"][2]["errors"])
+
+        first = Ticket.objects.get(id=r.data["results"][0]["ticket_id"])
+        self.assertEqual((first.source, first.priority, first.status), ("external", "high", "open"))
+        self.assertEqual(Ticket.objects.count(), 3)
+
+    def test_bulk_insert_keeps_stats_in_sync(self):
+        payload = [{"external_ref": f"EXT-{i}", "title": f"Ticket {i}"} for i in range(25)]
+        with self.settings(EXTERNAL_BATCH_CHUNK_SIZE=10):
+            r = self.post(payload)
+        self.assertEqual(r.data["created"], 25)
+        self.assertEqual(stored_buckets(), recount_buckets())
+
+    def test_rejects_non_array_and_oversized_batches(self):
+        self.assertEqual(self.post({"external_ref": "EXT-1", "title": "x"}).status_code, 400)
+        with self.settings(EXTERNAL_BATCH_MAX_ITEMS=1):
+            r = self.post([{"external_ref": "A", "title": "a"}, {"external_ref": "B", "title": "b"}])
+        self.assertEqual(r.status_code, 400)
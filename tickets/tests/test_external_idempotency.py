@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from tickets.models import Ticket
+
+
+class ExternalIdempotencyTests(APITestCase):
+    def post(self, payload, **extra):
+        return self.client.post(
+            "/external/tickets", payload, format="json", HTTP_X_API_KEY=settings.EXTERNAL_TICKET_API_KEY, **extra
+        )
+
+    def test_retry_with_same_ref_returns_existing_ticket(self):
+        r1 = self.post({"external_ref": "EXT-1", "title": "Alert"})
+        self.assertEqual(r1.status_code, 201)
+
+        with CaptureQueriesContext(connection) as ctx:
+            r2 = self.post({"external_ref": "EXT-1", "title": "Alert (retry)"})
+        sql = [q["sql"] for q in ctx.captured_queries]
+        self.assertEqual(sum('FROM "tickets_ticket"' in q for q in sql), 1)
+        self.assertFalse([q for q in sql if q.startswith(("INSERT", "UPDATE"))])
+        self.assertEqual(r2.status_code, 200)
+        self.assertEqual(r2.data["ticket_id"], r1.data["ticket_id"])
+        self.assertEqual(Ticket.objects.get().title, "Alert")
+
+    def test_idempotency_key_replays_original_ticket(self):
+        r1 = self.post({"external_ref": "EXT-1", "title": "Alert"}, HTTP_IDEMPOTENCY_KEY="req-123")
+        r2 = self.post({"external_ref": "EXT-2", "title": "Alert"}, HTTP_IDEMPOTENCY_KEY="req-123")
+        self.assertEqual(r2.status_code, 200)
+        self.assertEqual(r2.data["ticket_id"], r1.data["ticket_id"])
+        self.assertEqual(Ticket.objects.count(), 1)
+
+    def test_database_rejects_duplicate_refs(self):
+        Ticket.objects.create(source=Ticket.Source.EXTERNAL, external_ref="EXT-1", title="a")
+        with self.assertRaises(IntegrityError):
+            Ticket.objects.create(source=Ticket.Source.EXTERNAL, external_ref="EXT-1", title="b")
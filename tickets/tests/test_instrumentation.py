@@ -0,0 +1,75 @@
+import re
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from tickets.domain.metrics import fingerprint_sql, request_metrics
+from tickets.domain.services import create_customer_ticket
+
+
+@override_settings(TICKET_RESPONSE_CACHE_TIMEOUT=0)
+class InstrumentationTests(APITestCase):
+    admin = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "admin@example.com"}
+    customer = {"HTTP_X_ROLE": "customer", "HTTP_X_USER": "alice@example.com"}
+
+    def setUp(self):
+        request_metrics.reset()
+        self.addCleanup(request_metrics.reset)
+        create_customer_ticket(customer_email="alice@example.com", data={"title": "Refund"})
+
+    def test_server_timing_header_reports_queries_view_and_render(self):
+        with CaptureQueriesContext(connection) as queries:
+            r = self.client.get("/admin/tickets", **self.admin)
+        timing = r["Server-Timing"]
+        self.assertIn(f'desc="{len(queries)} queries"', timing)
+        self.assertEqual(re.findall(r"(\w+);dur=[\d.]+", timing), ["db", "view", "render", "total"])
+
+    @override_settings(TICKET_SLOW_REQUEST_MS=0.001)
+    def test_slow_requests_are_logged_with_sql_fingerprints(self):
+        with self.assertLogs("ticketing.middleware", "WARNING") as logs:
+            self.client.get("/customer/tickets", **self.customer)
+        self.assertIn("Slow request GET /customer/tickets (customer/tickets)", logs.output[0])
+        self.assertIn('WHERE "tickets_ticketrecord"."customer_id" = ? ORDER BY', logs.output[0])
+
+    @override_settings(TICKET_CHANGES_POLL_INTERVAL=0.02)
+    def test_long_polls_are_not_logged_as_slow(self):
+        r = self.client.get("/admin/tickets/changes", **self.admin)
+        with self.settings(TICKET_SLOW_REQUEST_MS=0.001), self.assertNoLogs("ticketing.middleware", "WARNING"):
+            self.client.get(f"/admin/tickets/changes?since={r.json()['cursor']}&timeout=0.1", **self.admin)
+        body = self.client.get("/admin/metrics", **self.admin).content.decode()
+        labels = 'endpoint="admin/tickets/changes",method="GET"'
+        self.assertIn(f"ticketing_http_request_duration_seconds_count{{{labels}}} 2", body)
+
+    def test_streamed_body_queries_are_counted(self):
+        with CaptureQueriesContext(connection) as queries:
+            r = self.client.get("/admin/tickets/export?include_comments=1", **self.admin)
+            b"".join(r.streaming_content)
+            r.close()
+        self.assertEqual(len(queries), 2)  # the ticket rows and their comments, both read by the body
+        body = self.client.get("/admin/metrics", **self.admin).content.decode()
+        labels = 'endpoint="admin/tickets/export",method="GET"'
+        self.assertIn(f"ticketing_http_request_db_queries_sum{{{labels}}} 2.0", body)
+        self.assertIn(f"ticketing_http_request_db_queries_count{{{labels}}} 1", body)
+
+    def test_fingerprint_collapses_literals_and_lists(self):
+        self.assertEqual(
+            fingerprint_sql("SELECT *  FROM t0 WHERE id IN (%s, %s, %s) AND name = 'x''y' LIMIT 21"),
+            "SELECT * FROM t0 WHERE id IN (...) AND name = ? LIMIT ?",
+        )
+        self.assertEqual(fingerprint_sql("INSERT INTO t VALUES (%s, %s), (%s, %s)"), "INSERT INTO t VALUES (...)")
+
+    def test_metrics_endpoint_is_admin_only_prometheus_text(self):
+        self.client.get("/admin/tickets", **self.admin)
+        self.client.get("/admin/tickets", **self.admin)
+
+        self.assertEqual(self.client.get("/admin/metrics", **self.customer).status_code, 403)
+        r = self.client.get("/admin/metrics", **self.admin)
+        self.assertTrue(r["Content-Type"].startswith("text/plain; version=0.0.4"))
+        body = r.content.decode()
+        self.assertIn("# TYPE ticketing_http_request_duration_seconds histogram", body)
+        labels = 'endpoint="admin/tickets",method="GET"'
+        self.assertIn(f'ticketing_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2', body)
+        self.assertIn(f"ticketing_http_request_db_queries_count{{{labels}}} 2", body)
+        self.assertIn('ticketing_http_responses_total{endpoint="admin/metrics",method="GET",status="4xx"} 1', body)
@@ -0,0 +1,73 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.test import TransactionTestCase, override_settings
+
+from tickets.domain.services import add_comment, create_customer_ticket
+from tickets.models import OutboxEvent
+
+
+def parse_sse(chunk: bytes) -> dict:
+    fields = dict(line.split(": ", 1) for line in chunk.decode().strip().splitlines())
+    return {"id": int(fields["id"]), "event": fields["event"], "data": json.loads(fields["data"])}
+
+
+class LiveEventStreamTests(TransactionTestCase):
+    admin = {"X-ROLE": "admin", "X-USER": "admin@example.com"}
+    alice = {"X-ROLE": "customer", "X-USER": "alice@example.com"}
+
+    def setUp(self):
+        self.ticket = create_customer_ticket(customer_email="alice@example.com", data={"title": "Refund"})
+        self.other = create_customer_ticket(customer_email="bob@example.com", data={"title": "Login"})
+
+    async def next_chunk(self, stream) -> bytes:
+        return await asyncio.wait_for(anext(stream), timeout=2)
+
+    async def comment(self, ticket, message: str):
+        # Written from another thread, like a request handled by a sync view.
+        return await sync_to_async(add_comment, thread_sensitive=False)(
+            ticket=ticket, author="agent@example.com", role="admin", message=message
+        )
+
+    async def test_pushes_only_matching_events_then_resumes_from_last_event_id(self):
+        r = await self.async_client.get("/customer/tickets/events", headers=self.alice)
+        self.assertEqual(r["Content-Type"], "text/event-stream")
+        stream = aiter(r.streaming_content)
+        self.assertEqual(await self.next_chunk(stream), b"retry: 3000\n\n")
+
+        await self.comment(self.other, "Not for alice")
+        await self.comment(self.ticket, "Refund issued")
+        event = parse_sse(await self.next_chunk(stream))
+        self.assertEqual(event["event"], "comment.created")
+        self.assertEqual(event["data"]["data"]["comment"]["message"], "Refund issued")
+        self.assertEqual(event["data"]["ticket_id"], self.ticket.id)
+        await stream.aclose()
+
+        # Missed while disconnected: replayed from the outbox, then live again.
+        await self.comment(self.ticket, "Anything else?")
+        r = await self.async_client.get(
+            f"/customer/tickets/{self.ticket.id}/events", headers={**self.alice, "Last-Event-ID": str(event["id"])}
+        )
+        stream = aiter(r.streaming_content)
+        await self.next_chunk(stream)
+        replayed = parse_sse(await self.next_chunk(stream))
+        self.assertEqual(replayed["data"]["data"]["comment"]["message"], "Anything else?")
+        latest = await OutboxEvent.objects.order_by("-id").afirst()
+        self.assertEqual(replayed["id"], latest.id)
+        await stream.aclose()
+
+    @override_settings(TICKET_LIVE_HEARTBEAT=0.05)
+    async def test_heartbeat_and_access_checks(self):
+        r = await self.async_client.get(f"/admin/tickets/{self.ticket.id}/events", headers=self.admin)
+        stream = aiter(r.streaming_content)
+        await self.next_chunk(stream)
+        self.assertEqual(await self.next_chunk(stream), b": heartbeat\n\n")
+        await stream.aclose()
+
+        r = await self.async_client.get(f"/customer/tickets/{self.other.id}/events", headers=self.alice)
+        self.assertEqual(r.status_code, 404)
+
+    def test_wsgi_requests_are_refused(self):
+        r = self.client.get("/customer/tickets/events", headers=self.alice)
+        self.assertEqual(r.status_code, 501)
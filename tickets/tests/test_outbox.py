@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+
+from django.test import TestCase, override_settings
+
+from tickets.domain.outbox import relay_outbox
+from tickets.domain.services import (
+    add_comment,
+    admin_update_ticket,
+    bulk_create_external_tickets,
+    create_customer_ticket,
+)
+from tickets.models import OutboxCheckpoint, OutboxEvent
+
+RECEIVED = []
+FAIL = {"on": False}
+
+
+def collect(messages):
+    if FAIL["on"]:
+        raise ConnectionError("sink down")
+    RECEIVED.append([m["id"] for m in messages])
+
+
+CALLBACK = {
+    "name": "memory",
+    "backend": "tickets.domain.outbox.CallbackSink",
+    "options": {"callback": f"{__name__}.collect"},
+}
+
+
+@override_settings(TICKET_OUTBOX_SINKS=[CALLBACK])
+class OutboxTests(TestCase):
+    def setUp(self):
+        RECEIVED.clear()
+        FAIL["on"] = False
+
+    def test_services_emit_events_in_their_transaction(self):
+        ticket = create_customer_ticket(customer_email="alice@example.com", data={"title": "Refund"})
+        add_comment(ticket=ticket, author="alice@example.com", role="customer", message="Any update?")
+        admin_update_ticket(ticket=ticket, data={"status": "in_progress", "priority": ticket.priority})
+        bulk_create_external_tickets(
+            items=[{"external_ref": "EXT-1", "title": "a"}, {"external_ref": "EXT-1", "title": "b"}]
+        )
+
+        types = list(OutboxEvent.objects.order_by("id").values_list("event_type", flat=True))
+        self.assertEqual(types, ["ticket.created", "comment.created", "ticket.updated", "ticket.created"])
+        updated = OutboxEvent.objects.get(event_type="ticket.updated")
+        self.assertEqual(updated.payload["changes"], {"status": ["open", "in_progress"]})
+
+        with self.assertRaises(Exception):
+            admin_update_ticket(ticket=ticket, data={"status": "bogus"})
+        self.assertEqual(OutboxEvent.objects.count(), 4)
+
+    def test_relay_delivers_in_order_and_checkpoints(self):
+        for i in range(5):
+            create_customer_ticket(customer_email="alice@example.com", data={"title": f"T{i}"})
+        ids = list(OutboxEvent.objects.order_by("id").values_list("id", flat=True))
+
+        FAIL["on"] = True
+        with self.assertLogs("tickets.domain.outbox", "WARNING"):
+            (result,) = relay_outbox(batch_size=2)
+        self.assertEqual((result.delivered, result.error), (0, "sink down"))
+
+        FAIL["on"] = False
+        (result,) = relay_outbox(batch_size=2)
+        self.assertEqual(RECEIVED, [ids[0:2], ids[2:4], ids[4:5]])
+        self.assertEqual(OutboxCheckpoint.objects.get(sink="memory").last_event_id, ids[-1])
+
+        self.assertEqual(relay_outbox()[0].delivered, 0)
+
+    def test_log_file_sink(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "events.ndjson")
+            sink = {"name": "log", "backend": "tickets.domain.outbox.LogFileSink", "options": {"path": path}}
+            with override_settings(TICKET_OUTBOX_SINKS=[sink]):
+                create_customer_ticket(customer_email="alice@example.com", data={"title": "Refund"})
+                relay_outbox()
+            with open(path) as fh:
+                (line,) = fh.read().splitlines()
+        self.assertEqual(json.loads(line)["type"], "ticket.created")
@@ -0,0 +1,55 @@
+from unittest import mock
+
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from tickets.api.pagination import TicketCursorPagination
+from tickets.models import Ticket
+
+
+@mock.patch.object(TicketCursorPagination, "page_size", 2)
+@override_settings(TICKET_RESPONSE_CACHE_TIMEOUT=0)
+class CursorPaginationTests(APITestCase):
+    def setUp(self):
+        for i in range(5):
+            Ticket.objects.create(
+                source=Ticket.Source.CUSTOMER,
+                customer_id="alice@example.com",
+                title=f"Ticket {i}",
+            )
+
+    def _walk(self, url, **headers):
+        seen = []
+        while url:
+            r = self.client.get(url, **headers)
+            self.assertEqual(r.status_code, 200)
+            self.assertNotIn("count", r.data)
+            seen.extend(row["id"] for row in r.data["results"])
+            url = r.data["next"]
+        return seen
+
+    def test_cursor_mode_walks_all_pages_in_keyset_order(self):
+        seen = self._walk(
+            "/admin/tickets?pagination=cursor&status=open",
+            HTTP_X_ROLE="admin",
+            HTTP_X_USER="admin@example.com",
+        )
+        expected = list(Ticket.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_cursor_is_stable_under_concurrent_inserts(self):
+        headers = {"HTTP_X_ROLE": "customer", "HTTP_X_USER": "alice@example.com"}
+        r = self.client.get("/customer/tickets?pagination=cursor", **headers)
+        first_page = [row["id"] for row in r.data["results"]]
+
+        # A ticket created between page fetches must not shift later pages.
+        Ticket.objects.create(source=Ticket.Source.CUSTOMER, customer_id="alice@example.com", title="New")
+
+        rest = self._walk(r.data["next"], **headers)
+        self.assertEqual(len(first_page) + len(rest), 5)
+        self.assertFalse(set(first_page) & set(rest))
+
+    def test_page_number_mode_is_default(self):
+        r = self.client.get("/customer/tickets", HTTP_X_ROLE="customer", HTTP_X_USER="alice@example.com")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.data["count"], 5)
@@ -0,0 +1,98 @@
+import os
+import sqlite3
+import tempfile
+import time
+
+from django.db import connections, transaction
+from django.test import TransactionTestCase, override_settings
+from rest_framework.test import APIClient
+
+from tickets.domain.cache import get_cache
+from tickets.domain.routing import begin_read_scope, end_read_scope
+from tickets.domain.services import create_customer_ticket
+from tickets.models import Ticket
+
+
+@override_settings(TICKET_READ_REPLICA="replica", TICKET_REPLICA_STICKY_SECONDS=0.3, TICKET_RESPONSE_CACHE_TIMEOUT=0)
+class ReadReplicaTests(TransactionTestCase):
+    """Two SQLite files: the test database is the primary, `replicate()` copies it over the replica."""
+
+    agent = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "agent1@example.com"}
+    other_agent = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "agent2@example.com"}
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.replica_path = os.path.join(tmp.name, "replica.sqlite3")
+        replica = connections["default"].copy("replica")
+        replica.settings_dict = {**replica.settings_dict, "NAME": self.replica_path}
+        connections["replica"] = replica
+        self.addCleanup(self._drop_replica)
+
+        get_cache().clear()
+        self.client = APIClient()
+        self.first = create_customer_ticket(customer_email="alice@example.com", data={"title": "Refund"})
+        self.replicate()
+        create_customer_ticket(customer_email="alice@example.com", data={"title": "Login"})  # not replicated yet
+
+    def _drop_replica(self):
+        connections["replica"].close()
+        del connections["replica"]
+
+    def replicate(self):
+        primary = connections["default"]
+        primary.ensure_connection()
+        target = sqlite3.connect(self.replica_path)
+        try:
+            primary.connection.backup(target)
+        finally:
+            target.close()
+
+    def list_count(self, headers) -> int:
+        return self.client.get("/admin/tickets", **headers).json()["count"]
+
+    def test_gets_read_the_replica_until_the_actor_writes(self):
+        self.assertEqual(self.list_count(self.agent), 1)
+
+        url = f"/admin/tickets/{self.first.id}"
+        r = self.client.put(url, {"status": "in_progress"}, format="json", **self.agent)
+        self.assertEqual(r.status_code, 200)
+
+        # The writer reads its own write from the primary; everyone else still sees the replica.
+        self.assertEqual(self.list_count(self.agent), 2)
+        self.assertEqual(self.client.get(url, **self.agent).json()["status"], "in_progress")
+        self.assertEqual(self.list_count(self.other_agent), 1)
+        self.assertEqual(self.client.get(url, **self.other_agent).json()["status"], "open")
+
+        time.sleep(0.35)
+        self.assertEqual(self.list_count(self.agent), 1)
+        self.replicate()
+        self.assertEqual(self.list_count(self.other_agent), 2)
+
+    async def test_async_stack_pins_the_writer_too(self):
+        agent, other_agent = ({"X-ROLE": "admin", "X-USER": f"agent{n}@example.com"} for n in (1, 2))
+        url = f"/admin/tickets/{self.first.id}"
+        r = await self.async_client.put(url, {"status": "in_progress"}, content_type="application/json", headers=agent)
+        self.assertEqual(r.status_code, 200)
+
+        async def count(headers):
+            return (await self.async_client.get("/async/admin/tickets", headers=headers)).json()["count"]
+
+        self.assertEqual(await count(agent), 2)
+        self.assertEqual(await count(other_agent), 1)
+
+    def test_scope_covers_reads_outside_transactions_and_never_writes(self):
+        self.assertEqual(Ticket.objects.count(), 2)  # no request: primary
+
+        begin_read_scope("replica")
+        self.addCleanup(end_read_scope)
+        self.assertEqual(Ticket.objects.count(), 1)
+        with transaction.atomic():
+            self.assertEqual(Ticket.objects.count(), 2)
+
+        ticket = Ticket.objects.get(id=self.first.id)
+        self.assertEqual(ticket._state.db, "replica")
+        ticket.title = "Refund please"
+        ticket.save()
+        end_read_scope()
+        self.assertEqual(Ticket.objects.get(id=self.first.id).title, "Refund please")
@@ -0,0 +1,61 @@
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from tickets.domain.services import add_comment, create_customer_ticket
+from tickets.models import Category
+
+
+@override_settings(TICKET_RESPONSE_CACHE_TIMEOUT=60)
+class ResponseCacheTests(APITestCase):
+    admin = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "admin@example.com"}
+
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ticket = create_customer_ticket(customer_email="alice@example.com", data={"title": "Refund"})
+            self.other = create_customer_ticket(customer_email="bob@example.com", data={"title": "Login"})
+
+    def test_categories_cached_until_a_category_is_saved(self):
+        first = self.client.get("/categories").json()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/categories").json(), first)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Category.objects.create(name="shipping")
+        self.assertIn("shipping", [c["name"] for c in self.client.get("/categories").json()["results"]])
+
+        stats = self.client.get("/admin/cache/stats", **self.admin).json()
+        self.assertEqual(stats["endpoints"]["categories"], {"hits": 1, "misses": 2, "hit_ratio": 0.3333})
+
+    def test_detail_is_invalidated_by_its_own_ticket_only(self):
+        url = f"/admin/tickets/{self.ticket.id}"
+        etag = self.client.get(url, **self.admin)["ETag"]
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.admin).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            add_comment(ticket=self.other, author="admin@example.com", role="admin", message="Elsewhere")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url, **self.admin).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(url, {"status": "in_progress"}, format="json", **self.admin)
+        r = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.admin)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json()["status"], "in_progress")
+
+    def test_list_and_stats_keys_normalize_query_and_vary_by_actor(self):
+        r = self.client.get("/admin/tickets?status=open&fields=id", **self.admin)
+        self.assertEqual(r.json()["count"], 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/admin/tickets?fields=id&status=open", **self.admin).json(), r.json())
+        self.client.get("/admin/tickets/stats", **self.admin)
+
+        r = self.client.get("/admin/tickets?status=open&fields=id", HTTP_X_ROLE="customer", HTTP_X_USER="a@x.io")
+        self.assertEqual(r.status_code, 403)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_customer_ticket(customer_email="carol@example.com", data={"title": "Invoice"})
+        self.assertEqual(self.client.get("/admin/tickets?status=open&fields=id", **self.admin).json()["count"], 3)
+        self.assertEqual(self.client.get("/admin/tickets/stats", **self.admin).json()["by_status"], {"open": 3})
@@ -0,0 +1,55 @@
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from tickets.domain.search import IcontainsSearchBackend, SQLiteFTS5SearchBackend, get_search_backend
+from tickets.domain.selectors import admin_ticket_qs
+from tickets.models import Ticket
+
+
+@override_settings(TICKET_RESPONSE_CACHE_TIMEOUT=0)
+class TicketSearchTests(APITestCase):
+    def setUp(self):
+        self.refund = Ticket.objects.create(
+            source=Ticket.Source.CUSTOMER,
+            customer_id="alice@example.com",
+            title="Refund not received",
+            description="Card was charged twice",
+        )
+        self.login = Ticket.objects.create(
+            source=Ticket.Source.EXTERNAL,
+            external_ref="EXT-42",
+            title="Login broken",
+            description="Mentions a refund in passing",
+        )
+
+    def test_sqlite_uses_fts5_backend(self):
+        self.assertIsInstance(get_search_backend(), SQLiteFTS5SearchBackend)
+        self.assertTrue(get_search_backend().is_available())
+
+    def test_prefix_matching_and_index_follows_updates(self):
+        ids = set(admin_ticket_qs(q="refu").values_list("id", flat=True))
+        self.assertEqual(ids, {self.refund.id, self.login.id})
+
+        self.login.assigned_to = "agent@example.com"
+        self.login.save()
+        ids = set(admin_ticket_qs(q="agent@example").values_list("id", flat=True))
+        self.assertEqual(ids, {self.login.id})
+
+        self.assertEqual(list(admin_ticket_qs(q="ext-42").values_list("id", flat=True)), [self.login.id])
+
+    def test_ranked_results_prefer_title_matches(self):
+        ranked = list(admin_ticket_qs(q="refund", rank=True).values_list("id", flat=True))
+        self.assertEqual(ranked, [self.refund.id, self.login.id])
+
+        r = self.client.get(
+            "/admin/tickets?q=refund&sort=relevance",
+            HTTP_X_ROLE="admin",
+            HTTP_X_USER="admin@example.com",
+        )
+        self.assertEqual([row["id"] for row in r.data["results"]], ranked)
+
+    def test_matches_icontains_for_whole_words(self):
+        for q in ("charged", "alice@example.com", "Login"):
+            fts = set(admin_ticket_qs(q=q).values_list("id", flat=True))
+            scan = set(IcontainsSearchBackend().filter(Ticket.objects.all(), q).values_list("id", flat=True))
+            self.assertEqual(fts, scan, q)
@@ -0,0 +1,52 @@
+import tempfile
+from collections import Counter
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+
+from tickets.domain.stats import recount_buckets, stored_buckets
+from tickets.models import AttachmentBlob, Comment, Ticket, TicketAttachment
+
+
+class SeedTicketsTests(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        override = override_settings(MEDIA_ROOT=media.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_seed_generates_skewed_chunked_data(self):
+        out = StringIO()
+        call_command(
+            "seed_tickets",
+            "--tickets=600",
+            "--customers=50",
+            "--customer-skew=1.5",
+            "--status-weights=open=3,closed=1",
+            "--attachments=0.5",
+            "--chunk-size=250",
+            stdout=out,
+        )
+        self.assertIn("Seeded 600 tickets", out.getvalue())
+        self.assertEqual(Ticket.objects.count(), 600)
+
+        customers = Counter(Ticket.objects.values_list("customer_id", flat=True))
+        self.assertEqual(customers.most_common(1)[0][0], "customer1@example.com")
+        self.assertGreater(customers["customer1@example.com"], 5 * customers.get("customer50@example.com", 1))
+        self.assertEqual(set(Ticket.objects.values_list("status", flat=True)), {"open", "closed"})
+        self.assertGreater(Ticket.objects.values("created_at__date").distinct().count(), 30)
+
+        self.assertGreater(Comment.objects.count(), 0)
+        first_comment = Comment.objects.order_by("ticket_id", "created_at").select_related("ticket").first()
+        self.assertGreater(first_comment.created_at, first_comment.ticket.created_at)
+
+        blob = AttachmentBlob.objects.get()
+        self.assertEqual(blob.ref_count, TicketAttachment.objects.count())
+        self.assertEqual(stored_buckets(), recount_buckets())
+
+    def test_rejects_unknown_status(self):
+        with self.assertRaises(CommandError):
+            call_command("seed_tickets", "--tickets=1", "--status-weights=pending=1")
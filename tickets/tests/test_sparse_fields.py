@@ -0,0 +1,48 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from tickets.api.serializers import TICKET_LIST_FIELDS, TicketListSerializer, serialize_ticket_rows
+from tickets.models import Ticket
+
+
+@override_settings(TICKET_RESPONSE_CACHE_TIMEOUT=0)
+class SparseFieldsetTests(APITestCase):
+    admin = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "admin@example.com"}
+
+    def setUp(self):
+        Ticket.objects.create(
+            source=Ticket.Source.EXTERNAL,
+            external_ref="EXT-1",
+            title="Refund",
+            description="x" * 5000,
+            customer_id="alice@example.com",
+        )
+        Ticket.objects.create(source=Ticket.Source.CUSTOMER, title="Login", customer_id="alice@example.com")
+
+    def test_fast_path_matches_model_serializer(self):
+        qs = Ticket.objects.order_by("id")
+        self.assertEqual(
+            serialize_ticket_rows(qs.values(*TICKET_LIST_FIELDS)),
+            [dict(row) for row in TicketListSerializer(qs, many=True).data],
+        )
+
+    def test_fields_param_restricts_projection_and_output(self):
+        with CaptureQueriesContext(connection) as ctx:
+            r = self.client.get("/admin/tickets?fields=id,title,status", **self.admin)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual([set(row) for row in r.data["results"]], [{"id", "title", "status"}] * 2)
+        page_sql = ctx.captured_queries[-1]["sql"]
+        self.assertNotIn("description", page_sql)
+
+        r = self.client.get(
+            "/customer/tickets?fields=title&pagination=cursor",
+            HTTP_X_ROLE="customer",
+            HTTP_X_USER="alice@example.com",
+        )
+        self.assertEqual(r.data["results"], [{"title": "Login"}, {"title": "Refund"}])
+
+    def test_unknown_field_is_rejected(self):
+        r = self.client.get("/admin/tickets?fields=id,password", **self.admin)
+        self.assertEqual(r.status_code, 400)
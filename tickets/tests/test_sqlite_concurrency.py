@@ -0,0 +1,75 @@
+import os
+import tempfile
+import threading
+import time
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+
+from ticketing.sqlite import concurrent_profile
+from tickets.domain.services import add_comment, create_customer_ticket
+from tickets.domain.writer import get_write_queue
+from tickets.models import Comment
+
+
+class ConcurrentProfileTests(SimpleTestCase):
+    def test_pragmas_and_immediate_transactions_apply_to_new_connections(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        name = os.path.join(tmp.name, "db.sqlite3")
+        connection = connections["default"].copy("profile")
+        connection.settings_dict = concurrent_profile({**connection.settings_dict, "NAME": name})
+        self.addCleanup(connection.close)
+
+        with connection.cursor() as cursor:
+            pragmas = {}
+            for pragma in ("journal_mode", "synchronous", "busy_timeout"):
+                cursor.execute(f"PRAGMA {pragma}")
+                pragmas[pragma] = cursor.fetchone()[0]
+        self.assertEqual(pragmas, {"journal_mode": "wal", "synchronous": 1, "busy_timeout": 10_000})
+        self.assertEqual(connection.transaction_mode, "IMMEDIATE")
+        self.assertEqual(connection.settings_dict["CONN_MAX_AGE"], 600)
+
+
+@override_settings(TICKET_WRITE_QUEUE=True)
+class WriteQueueTests(TransactionTestCase):
+    def setUp(self):
+        get_write_queue.cache_clear()
+        self.addCleanup(get_write_queue.cache_clear)
+
+    def test_queued_writes_share_a_transaction_and_fail_alone(self):
+        ticket = create_customer_ticket(customer_email="alice@example.com", data={"title": "Busy"})
+        queue = get_write_queue()
+        batches, jobs = queue.batches, queue.jobs
+        running, release = threading.Event(), threading.Event()
+        errors = []
+
+        def hold_the_writer():
+            running.set()
+            release.wait()
+
+        blocker = threading.Thread(target=queue.submit, args=(hold_the_writer,))
+        blocker.start()
+        running.wait(timeout=5)
+
+        def comment(i):
+            try:
+                role = "nobody" if i == 3 else "customer"
+                add_comment(ticket=ticket, author="alice@example.com", role=role, message=str(i))
+            except ValidationError as exc:
+                errors.append((i, exc))
+
+        threads = [threading.Thread(target=comment, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        while queue._queue.qsize() < 8:
+            time.sleep(0.001)
+        release.set()
+        for thread in [blocker, *threads]:
+            thread.join(timeout=10)
+
+        self.assertEqual((queue.batches - batches, queue.jobs - jobs), (2, 9))  # the 8 comments in one commit
+        self.assertEqual([i for i, _ in errors], [3])
+        messages = sorted(Comment.objects.values_list("message", flat=True))
+        self.assertEqual(messages, ["0", "1", "2", "4", "5", "6", "7"])
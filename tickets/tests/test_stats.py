@@ -0,0 +1,47 @@
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from tickets.domain.stats import recount_buckets, stored_buckets
+from tickets.models import Ticket, TicketStatsBucket
+
+
+@override_settings(TICKET_RESPONSE_CACHE_TIMEOUT=0)
+class TicketStatsTests(APITestCase):
+    admin = {"HTTP_X_ROLE": "admin", "HTTP_X_USER": "admin@example.com"}
+    alice = {"HTTP_X_ROLE": "customer", "HTTP_X_USER": "alice@example.com"}
+
+    def test_counters_follow_service_writes(self):
+        r = self.client.post("/customer/tickets", {"title": "A", "category": "billing"}, format="json", **self.alice)
+        ticket_id = r.data["id"]
+        self.client.post("/customer/tickets", {"title": "B"}, format="json", **self.alice)
+        self.client.post(
+            "/external/tickets",
+            {"external_ref": "EXT-1", "title": "C", "priority": "high"},
+            format="json",
+            HTTP_X_API_KEY=settings.EXTERNAL_TICKET_API_KEY,
+        )
+        self.client.put(f"/admin/tickets/{ticket_id}", {"status": "resolved"}, format="json", **self.admin)
+        self.client.post(f"/customer/tickets/{ticket_id}/close", **self.alice)
+
+        self.assertEqual(stored_buckets(), recount_buckets())
+
+        with self.assertNumQueries(1):
+            r = self.client.get("/admin/tickets/stats", **self.admin)
+        self.assertEqual(r.data["by_status"], {"open": 2, "closed": 1})
+        self.assertEqual(r.data["by_priority"], {"medium": 2, "high": 1})
+        self.assertEqual(r.data["by_source"], {"customer": 2, "external": 1})
+        self.assertEqual(r.data["by_category"], {"billing": 1, "general": 2})
+
+    def test_check_command_detects_and_rebuild_fixes_drift(self):
+        Ticket.objects.create(source=Ticket.Source.CUSTOMER, title="Written around the services")
+
+        with self.assertRaises(CommandError):
+            call_command("rebuild_ticket_stats", "--check", stdout=StringIO())
+
+        call_command("rebuild_ticket_stats", stdout=StringIO())
+        call_command("rebuild_ticket_stats", "--check", stdout=StringIO())
+        self.assertEqual(TicketStatsBucket.objects.get().count, 1)
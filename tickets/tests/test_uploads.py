@@ -0,0 +1,94 @@
+import fcntl
+import tempfile
+from datetime import timedelta
+from io import BytesIO
+
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from tickets.domain.services import create_customer_ticket
+from tickets.domain.uploads import part_path, write_upload_chunk
+from tickets.models import TicketAttachment, UploadSession
+from tickets.tasks import purge_expired_upload_sessions
+
+
+class ResumableUploadTests(APITestCase):
+    alice = {"HTTP_X_ROLE": "customer", "HTTP_X_USER": "alice@example.com"}
+
+    def setUp(self):
+        dirs = [tempfile.TemporaryDirectory() for _ in range(2)]
+        for d in dirs:
+            self.addCleanup(d.cleanup)
+        override = override_settings(
+            TICKET_UPLOAD_DIR=dirs[0].name, MEDIA_ROOT=dirs[1].name, TICKET_UPLOAD_CHUNK_SIZE=4
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+        self.ticket = create_customer_ticket(customer_email="alice@example.com", data={"title": "Dump"})
+
+    def start(self, size=10, **headers):
+        payload = {"ticket_id": self.ticket.id, "filename": "dump.bin", "size": size}
+        return self.client.post("/uploads", payload, format="json", **(headers or self.alice))
+
+    def put_chunk(self, session_id, index, body):
+        return self.client.put(
+            f"/uploads/{session_id}/chunks/{index}", data=body, content_type="application/octet-stream", **self.alice
+        )
+
+    def test_chunks_resume_and_finalize_into_attachment(self):
+        r = self.start()
+        self.assertEqual(r.status_code, 201)
+        sid = r.data["id"]
+        self.assertEqual(r.data["chunk_size"], 4)
+
+        self.assertEqual(self.put_chunk(sid, 0, b"abcd").data["next_chunk"], 1)
+        self.assertEqual(self.put_chunk(sid, 2, b"ijkl").status_code, 409)
+        self.assertEqual(self.put_chunk(sid, 0, b"abcd").data["received"], 4)  # retried chunk is a no-op
+        self.assertEqual(self.put_chunk(sid, 1, b"toolarge").status_code, 400)
+        self.put_chunk(sid, 1, b"efgh")
+        self.assertEqual(self.client.post(f"/uploads/{sid}/finalize", **self.alice).status_code, 409)
+        self.assertEqual(self.put_chunk(sid, 2, b"ij").data["received"], 10)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            r = self.client.post(f"/uploads/{sid}/finalize", **self.alice)
+        self.assertEqual(r.status_code, 200)
+        attachment = TicketAttachment.objects.get(ticket=self.ticket)
+        self.assertEqual(attachment.original_name, "dump.bin")
+        with attachment.file.open("rb") as fh:
+            self.assertEqual(fh.read(), b"abcdefghij")
+        self.assertFalse(part_path(UploadSession.objects.get()).exists())
+
+        again = self.client.post(f"/uploads/{sid}/finalize", **self.alice)
+        self.assertEqual(again.data["id"], r.data["id"])
+        self.assertEqual(TicketAttachment.objects.count(), 1)
+
+    def test_chunk_writes_to_a_session_are_serialized(self):
+        sid = self.start().data["id"]
+        self.put_chunk(sid, 0, b"abcd")
+        stale = UploadSession.objects.get()  # a retry of chunk 1 that was read before chunk 1 committed
+        self.put_chunk(sid, 1, b"efgh")
+
+        with open(part_path(stale), "rb") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)  # another request is still streaming into this session
+            self.assertEqual(self.put_chunk(sid, 2, b"ij").status_code, 409)
+        self.assertEqual(self.put_chunk(sid, 2, b"ij").data["received"], 10)
+
+        result = write_upload_chunk(session=stale, index=1, stream=BytesIO(b"ef"), length=2)
+        self.assertTrue(result.accepted)
+        self.assertEqual(part_path(stale).read_bytes(), b"abcdefghij")
+
+    def test_sessions_are_scoped_to_uploader_and_purged_when_expired(self):
+        self.assertEqual(self.start(HTTP_X_ROLE="customer", HTTP_X_USER="bob@example.com").status_code, 404)
+        sid = self.start().data["id"]
+        r = self.client.get(f"/uploads/{sid}", HTTP_X_ROLE="customer", HTTP_X_USER="bob@example.com")
+        self.assertEqual(r.status_code, 404)
+
+        self.put_chunk(sid, 0, b"abcd")
+        session = UploadSession.objects.get()
+        UploadSession.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(self.put_chunk(sid, 1, b"efgh").status_code, 404)
+
+        self.assertEqual(purge_expired_upload_sessions(), 1)
+        self.assertFalse(UploadSession.objects.exists())
+        self.assertFalse(part_path(session).exists())
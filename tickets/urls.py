@@ -1,46 +1,122 @@
 from django.urls import path
 
 from tickets.api.admin_views import (
-    AdminTicketCommentCreateView,
+    AdminMetricsView,
+    AdminResponseCacheStatsView,
+    AdminTicketAttachmentDownloadView,
+    AdminTicketCommentListCreateView,
+    AdminTicketExportView,
     AdminTicketListView,
     AdminTicketRetrieveUpdateView,
     AdminTicketStatsView,
 )
+from tickets.api.async_views import (
+    AdminTicketChangesView,
+    AsyncAdminTicketDetailView,
+    AsyncAdminTicketListView,
+    AsyncAdminTicketStatsView,
+    AsyncCustomerTicketDetailView,
+    AsyncCustomerTicketListView,
+    CustomerTicketChangesView,
+)
 from tickets.api.category_views import CategoryListView
 from tickets.api.customer_views import (
+    CustomerTicketAttachmentDownloadView,
     CustomerTicketCloseView,
-    CustomerTicketCommentCreateView,
+    CustomerTicketCommentListCreateView,
     CustomerTicketDetailView,
     CustomerTicketListCreateView,
 )
-from tickets.api.external_views import ExternalTicketIngestView
+from tickets.api.external_views import (
+    ExternalIngestJobDetailView,
+    ExternalTicketBatchIngestView,
+    ExternalTicketIngestView,
+)
+from tickets.api.live_views import (
+    AdminTicketEventStreamView,
+    CustomerTicketEventStreamView,
+    CustomerTicketsEventStreamView,
+)
+from tickets.api.upload_views import (
+    UploadChunkView,
+    UploadFinalizeView,
+    UploadSessionCreateView,
+    UploadSessionDetailView,
+)
 
 
 urlpatterns = [
     # Customer
     path("customer/tickets", CustomerTicketListCreateView.as_view(), name="customer-ticket-list-create"),
+    path("customer/tickets/changes", CustomerTicketChangesView.as_view(), name="customer-ticket-changes"),
+    path("customer/tickets/events", CustomerTicketsEventStreamView.as_view(), name="customer-ticket-events"),
     path("customer/tickets/<int:ticket_id>", CustomerTicketDetailView.as_view(), name="customer-ticket-detail"),
+    path(
+        "customer/tickets/<int:ticket_id>/events",
+        CustomerTicketEventStreamView.as_view(),
+        name="customer-ticket-detail-events",
+    ),
     path(
         "customer/tickets/<int:ticket_id>/comments",
-        CustomerTicketCommentCreateView.as_view(),
+        CustomerTicketCommentListCreateView.as_view(),
         name="customer-ticket-comment-create",
     ),
     path("customer/tickets/<int:ticket_id>/close", CustomerTicketCloseView.as_view(), name="customer-ticket-close"),
+    path(
+        "customer/tickets/<int:ticket_id>/attachments/<int:attachment_id>",
+        CustomerTicketAttachmentDownloadView.as_view(),
+        name="customer-ticket-attachment-download",
+    ),
     # Admin
     path("admin/tickets", AdminTicketListView.as_view(), name="admin-ticket-list"),
     path("admin/tickets/stats", AdminTicketStatsView.as_view(), name="admin-ticket-stats"),
+    path("admin/tickets/export", AdminTicketExportView.as_view(), name="admin-ticket-export"),
+    path("admin/tickets/changes", AdminTicketChangesView.as_view(), name="admin-ticket-changes"),
     path(
         "admin/tickets/<int:ticket_id>",
         AdminTicketRetrieveUpdateView.as_view(),
         name="admin-ticket-retrieve-update",
     ),
+    path(
+        "admin/tickets/<int:ticket_id>/events",
+        AdminTicketEventStreamView.as_view(),
+        name="admin-ticket-detail-events",
+    ),
     path(
         "admin/tickets/<int:ticket_id>/comments",
-        AdminTicketCommentCreateView.as_view(),
+        AdminTicketCommentListCreateView.as_view(),
         name="admin-ticket-comment-create",
     ),
+    path(
+        "admin/tickets/<int:ticket_id>/attachments/<int:attachment_id>",
+        AdminTicketAttachmentDownloadView.as_view(),
+        name="admin-ticket-attachment-download",
+    ),
+    path("admin/cache/stats", AdminResponseCacheStatsView.as_view(), name="admin-cache-stats"),
+    path("admin/metrics", AdminMetricsView.as_view(), name="admin-metrics"),
     # External
     path("external/tickets", ExternalTicketIngestView.as_view(), name="external-ticket-ingest"),
+    path("external/tickets/batch", ExternalTicketBatchIngestView.as_view(), name="external-ticket-batch-ingest"),
+    path("external/jobs/<uuid:job_id>", ExternalIngestJobDetailView.as_view(), name="external-ingest-job-detail"),
+    # Resumable chunked uploads (customer/admin role headers or external X-API-KEY)
+    path("uploads", UploadSessionCreateView.as_view(), name="upload-session-create"),
+    path("uploads/<uuid:session_id>", UploadSessionDetailView.as_view(), name="upload-session-detail"),
+    path("uploads/<uuid:session_id>/chunks/<int:index>", UploadChunkView.as_view(), name="upload-chunk"),
+    path("uploads/<uuid:session_id>/finalize", UploadFinalizeView.as_view(), name="upload-finalize"),
+    # Native async (ASGI) read endpoints
+    path("async/customer/tickets", AsyncCustomerTicketListView.as_view(), name="async-customer-ticket-list"),
+    path(
+        "async/customer/tickets/<int:ticket_id>",
+        AsyncCustomerTicketDetailView.as_view(),
+        name="async-customer-ticket-detail",
+    ),
+    path("async/admin/tickets", AsyncAdminTicketListView.as_view(), name="async-admin-ticket-list"),
+    path("async/admin/tickets/stats", AsyncAdminTicketStatsView.as_view(), name="async-admin-ticket-stats"),
+    path(
+        "async/admin/tickets/<int:ticket_id>",
+        AsyncAdminTicketDetailView.as_view(),
+        name="async-admin-ticket-detail",
+    ),
     # Categories (for frontend dropdowns)
     path("categories", CategoryListView.as_view(), name="category-list"),
 ]